@@ -1,6 +1,47 @@
+import logging
+
 from app.collections.book_collection import BookCollection
+from app.collections.catalog_collection import CatalogCollection
+from app.collections.migration_collection import MigrationCollection
+from app.collections.upload_job_collection import UploadJobCollection
+from app.collections.user_collection import UserCollection
+
+logger = logging.getLogger(__name__)
+
+# 인덱스를 관리하는 콜랙션 목록 (각 콜랙션의 _indexes 에 인덱스를 선언)
+ALL_COLLECTIONS = [
+    BookCollection,
+    CatalogCollection,
+    MigrationCollection,
+    UploadJobCollection,
+    UserCollection,
+]
 
 
 # 콜랙션 인덱스 생성 명시
 async def create_all_indexes():
-    await BookCollection._collection.create_index("book_title")
+    for collection in ALL_COLLECTIONS:
+        if collection._indexes:
+            await collection._collection.create_indexes(collection._indexes)
+
+
+# 기존 문서 마이그레이션 (여러 번 실행해도 안전해야 함)
+# 적용한 이름은 migration 콜랙션에 기록해서 워커가 시작할 때마다 전체 문서를 훑지 않음
+# 마이그레이션 내용을 바꾸면 이름을 새로 지어서 한 번 더 실행되도록 함
+MIGRATIONS = [
+    ("book_search_fields_v1", BookCollection.backfill_search_fields),
+    ("book_stock_fields_v2", BookCollection.migrate_stock_fields),
+]
+
+
+async def run_all_migrations():
+    applied_names = await MigrationCollection.get_applied_names(
+        [name for name, _ in MIGRATIONS]
+    )
+    for name, migrate in MIGRATIONS:
+        if name in applied_names:
+            continue
+        # 워커 여러 개가 동시에 처음 시작하면 같이 실행될 수 있지만 결과는 같음
+        updated_count = await migrate()
+        await MigrationCollection.mark_applied(name=name, updated_count=updated_count)
+        logger.info("migration %s updated %d documents", name, updated_count)
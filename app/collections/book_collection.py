@@ -1,39 +1,110 @@
 import dataclasses
-from typing import Any
+import time
+from collections import Counter
+from typing import Any, AsyncGenerator
 from bson import ObjectId
 from typing import List
+import pandas as pd
+from pymongo import DeleteMany, IndexModel, InsertOne, ReplaceOne, UpdateOne
+from pymongo.errors import BulkWriteError
 
-from app.core.database import db
+from app.core.database import LazyCollection
+from app.core.env import env
 from app.documents.book_document import BookDocument
 from app.core.enums import STORE_SPOT
+from app.utils.book_util import CONTENT_FIELDS, INTEGER_FIELDS, RATE_FIELD, BookUtil
+from app.utils.search_util import SearchUtil
+
+# 예전 업로드 코드가 빈 값을 str(None) 으로 저장하던 텍스트 필드
+LEGACY_NONE_TEXT_FIELDS = [
+    "subject_name",
+    "author",
+    "publisher",
+    "major",
+    "professor_name",
+    "location",
+]
+
+
+@dataclasses.dataclass(frozen=True)
+class InsertBatchResult:
+    inserted_count: int
+    failed_count: int
+    elapsed_ms: float
+
+
+@dataclasses.dataclass(frozen=True)
+class DiffWriteResult:
+    inserted_count: int
+    updated_count: int
+    removed_count: int
+    failed_count: int
+    elapsed_ms: float
+
+
+@dataclasses.dataclass(frozen=True)
+class RowIndex:
+    # row_key -> (_id, content_hash)
+    rows: dict[str, tuple[ObjectId, str]]
+    # 같은 row_key 를 가진 나머지 문서 (증분 업로드에서 삭제 대상)
+    duplicate_ids: List[ObjectId]
 
 
 class BookCollection:
-    _collection = db["book"]
+    _collection = LazyCollection("book")
+    _indexes = [
+        # 검색/지점별 조회/버전 정리 모두 store_spot + catalog_version 접두 조건을 사용
+        IndexModel(
+            [("store_spot", 1), ("catalog_version", 1), ("search_tokens", 1)],
+            name="store_spot_catalog_version_search_tokens",
+        ),
+        # 입고율 기준 정렬/필터 (예: 입고율 < 1 인 미입고 도서)
+        IndexModel(
+            [("store_spot", 1), ("catalog_version", 1), ("fulfillment_rate", 1)],
+            name="store_spot_catalog_version_fulfillment_rate",
+        ),
+    ]
 
     @classmethod
     def _parse(cls, document: dict[str, Any]) -> BookDocument:
+        # projection 으로 빠진 필드는 None
         return BookDocument(
             _id=document["_id"],
             store_spot=STORE_SPOT(document["store_spot"]),
-            subject_name=document["subject_name"],
+            subject_name=document.get("subject_name"),
             book_title=document["book_title"],
-            author=document["author"],
-            publisher=document["publisher"],
-            request_count=document["request_count"],
-            received_count=document["received_count"],
-            price=document["price"],
-            fulfillment_rate=document["fulfillment_rate"],
-            major=document["major"],
-            professor_name=document["professor_name"],
-            location=document["location"],
-            order_date=document["order_date"],
+            author=document.get("author"),
+            publisher=document.get("publisher"),
+            request_count=document.get("request_count"),
+            received_count=document.get("received_count"),
+            price=document.get("price"),
+            fulfillment_rate=document.get("fulfillment_rate"),
+            major=document.get("major"),
+            professor_name=document.get("professor_name"),
+            location=document.get("location"),
+            order_date=document.get("order_date"),
         )
 
     @classmethod
-    async def insert_book(cls, document: BookDocument) -> str | None:
-        insert_data = dataclasses.asdict(document)
-        insert_data.pop("_id", None)
+    def _to_insert_data(
+        cls, book: dict[str, Any], catalog_version: str | None
+    ) -> dict[str, Any]:
+        insert_data = {key: value for key, value in book.items() if key != "_id"}
+        insert_data["catalog_version"] = catalog_version
+        # 엑셀 업로드는 자식 프로세스에서 계산한 검색/비교 필드를 그대로 사용
+        if "search_tokens" not in insert_data:
+            insert_data.update(
+                SearchUtil.document_fields(book["book_title"], book.get("subject_name"))
+            )
+        if "row_key" not in insert_data:
+            insert_data.update(BookUtil.diff_fields(insert_data))
+        return insert_data
+
+    @classmethod
+    async def insert_book(
+        cls, document: BookDocument, catalog_version: str | None
+    ) -> str | None:
+        insert_data = cls._to_insert_data(dataclasses.asdict(document), catalog_version)
 
         result = await cls._collection.insert_one(insert_data)
 
@@ -43,34 +114,315 @@ class BookCollection:
         return None
 
     @classmethod
-    async def delete_book_by_id(cls, id: str) -> bool:
-        result = await cls._collection.delete_one(filter={"_id": ObjectId(id)})
-        return result.deleted_count > 0
+    async def insert_books(
+        cls,
+        books: List[dict[str, Any]],
+        catalog_version: str | None,
+        batch_size: int,
+    ) -> List[InsertBatchResult]:
+        # books 는 BookDocument 필드 이름을 키로 하는 dict 목록
+        results: List[InsertBatchResult] = []
+
+        # batch_size 단위로 나눠 unordered insert_many (실패한 행이 있어도 나머지는 계속 삽입)
+        for start in range(0, len(books), batch_size):
+            batch = [
+                cls._to_insert_data(book, catalog_version)
+                for book in books[start : start + batch_size]
+            ]
+
+            started_at = time.perf_counter()
+            try:
+                result = await cls._collection.insert_many(batch, ordered=False)
+                inserted_count = len(result.inserted_ids)
+            except BulkWriteError as e:
+                inserted_count = e.details.get("nInserted", 0)
+
+            results.append(
+                InsertBatchResult(
+                    inserted_count=inserted_count,
+                    failed_count=len(batch) - inserted_count,
+                    elapsed_ms=(time.perf_counter() - started_at) * 1000,
+                )
+            )
+
+        return results
+
+    @classmethod
+    async def get_row_index(
+        cls, store_spot: str, catalog_version: str | None
+    ) -> RowIndex:
+        rows: dict[str, tuple[ObjectId, str]] = {}
+        duplicate_ids: List[ObjectId] = []
+        seen: Counter = Counter()
+
+        async for document in cls._collection.find(
+            filter={"store_spot": store_spot, "catalog_version": catalog_version},
+            projection={"search_title": 0, "search_tokens": 0},
+            sort=[("_id", 1)],
+        ):
+            if "row_key" in document:
+                row_key, content_hash = document["row_key"], document["content_hash"]
+            else:
+                # row_key 가 없는 (이전에 추가된) 문서는 추가된 순서대로 키를 계산
+                book = {field: document.get(field) for field in CONTENT_FIELDS}
+                BookUtil.add_diff_fields([book], seen)
+                row_key, content_hash = book["row_key"], book["content_hash"]
+
+            if row_key in rows:
+                duplicate_ids.append(document["_id"])
+            else:
+                rows[row_key] = (document["_id"], content_hash)
+
+        return RowIndex(rows=rows, duplicate_ids=duplicate_ids)
+
+    @classmethod
+    async def apply_books_diff(
+        cls,
+        inserts: List[dict[str, Any]],
+        replacements: List[tuple[ObjectId, dict[str, Any]]],
+        delete_ids: List[ObjectId],
+        catalog_version: str | None,
+    ) -> DiffWriteResult:
+        requests: List[InsertOne | ReplaceOne | DeleteMany] = [
+            InsertOne(cls._to_insert_data(book, catalog_version)) for book in inserts
+        ]
+        requests += [
+            ReplaceOne({"_id": id}, cls._to_insert_data(book, catalog_version))
+            for id, book in replacements
+        ]
+        if delete_ids:
+            requests.append(DeleteMany({"_id": {"$in": delete_ids}}))
+
+        if not requests:
+            return DiffWriteResult(
+                inserted_count=0,
+                updated_count=0,
+                removed_count=0,
+                failed_count=0,
+                elapsed_ms=0.0,
+            )
+
+        # 추가/수정/삭제를 한 번의 unordered bulk_write 로 반영
+        started_at = time.perf_counter()
+        try:
+            result = (
+                await cls._collection.bulk_write(requests, ordered=False)
+            ).bulk_api_result
+        except BulkWriteError as e:
+            result = e.details
+
+        return DiffWriteResult(
+            inserted_count=result.get("nInserted", 0),
+            updated_count=result.get("nModified", 0),
+            removed_count=result.get("nRemoved", 0),
+            failed_count=len(result.get("writeErrors", [])),
+            elapsed_ms=(time.perf_counter() - started_at) * 1000,
+        )
+
+    @classmethod
+    async def delete_book_by_id(cls, id: str) -> BookDocument | None:
+        result = await cls._collection.find_one_and_delete(filter={"_id": ObjectId(id)})
+        if result:
+            return cls._parse(result)
+        return None
+
+    @classmethod
+    async def count_books_by_catalog_version(
+        cls, store_spot: str, catalog_version: str | None
+    ) -> int:
+        return await cls._collection.count_documents(
+            filter={"store_spot": store_spot, "catalog_version": catalog_version}
+        )
+
+    @classmethod
+    async def select_catalog_versions(cls, store_spot: str) -> List[str | None]:
+        return await cls._collection.distinct(
+            "catalog_version", filter={"store_spot": store_spot}
+        )
 
     @classmethod
-    async def delete_books_by_store_spot(cls, store_spot: str) -> int:
-        result = await cls._collection.delete_many(filter={"store_spot": store_spot})
+    async def delete_books_by_catalog_version(
+        cls, store_spot: str, catalog_version: str | None
+    ) -> int:
+        result = await cls._collection.delete_many(
+            filter={"store_spot": store_spot, "catalog_version": catalog_version}
+        )
         return result.deleted_count
 
     @classmethod
     async def select_book_by_book_title(
-        cls, book_title: str, store_spot: STORE_SPOT
+        cls,
+        book_title: str,
+        store_spot: STORE_SPOT,
+        catalog_version: str | None,
+        limit: int | None = None,
+        after_id: str | None = None,
+        fields: List[str] | None = None,
+    ) -> List[BookDocument]:
+        search_filter = SearchUtil.query_filter(book_title)
+        if search_filter is None:
+            return []
+
+        query_filter = {
+            "store_spot": store_spot,
+            "catalog_version": catalog_version,
+            **search_filter,
+        }
+        # 페이지 단위 조회는 _id 기준 keyset 페이지네이션
+        if after_id is not None:
+            query_filter["_id"] = {"$gt": ObjectId(after_id)}
+
+        projection = None
+        if fields is not None:
+            projection = dict.fromkeys(["store_spot", "book_title", *fields], 1)
+
+        cursor = cls._collection.find(
+            filter=query_filter, projection=projection
+        ).batch_size(env.SEARCH_CURSOR_BATCH_SIZE)
+
+        if limit is not None or after_id is not None:
+            cursor = cursor.sort("_id", 1)
+        if limit is not None:
+            cursor = cursor.limit(limit)
+
+        return [cls._parse(document) async for document in cursor]
+
+    @classmethod
+    async def select_all_book_by_store_spot(
+        cls, store_spot: str, catalog_version: str | None
     ) -> List[BookDocument]:
         result = await cls._collection.find(
             filter={
-                "book_title": {"$regex": book_title, "$options": "i"},
                 "store_spot": store_spot,
+                "catalog_version": catalog_version,
             }
         ).to_list(length=None)
 
         return [cls._parse(document) for document in result]
 
     @classmethod
-    async def select_all_book_by_store_spot(cls, store_spot: str) -> List[BookDocument]:
-        result = await cls._collection.find(
+    async def select_titles_by_store_spot(
+        cls, store_spot: str, catalog_version: str | None
+    ) -> List[str]:
+        # 자동완성 색인용 (중복 없는 도서명만 조회)
+        return await cls._collection.distinct(
+            "book_title",
+            filter={"store_spot": store_spot, "catalog_version": catalog_version},
+        )
+
+    @classmethod
+    async def iter_books_by_store_spot(
+        cls, store_spot: str, catalog_version: str | None
+    ) -> AsyncGenerator[BookDocument, None]:
+        cursor = cls._collection.find(
+            filter={"store_spot": store_spot, "catalog_version": catalog_version}
+        ).batch_size(env.SEARCH_CURSOR_BATCH_SIZE)
+
+        async for document in cursor:
+            yield cls._parse(document)
+
+    @classmethod
+    async def iter_book_by_book_title(
+        cls, book_title: str, store_spot: STORE_SPOT, catalog_version: str | None
+    ) -> AsyncGenerator[BookDocument, None]:
+        search_filter = SearchUtil.query_filter(book_title)
+        if search_filter is None:
+            return
+
+        cursor = cls._collection.find(
             filter={
                 "store_spot": store_spot,
+                "catalog_version": catalog_version,
+                **search_filter,
             }
-        ).to_list(length=None)
+        ).batch_size(env.SEARCH_CURSOR_BATCH_SIZE)
 
-        return [cls._parse(document) for document in result]
+        async for document in cursor:
+            yield cls._parse(document)
+
+    @classmethod
+    async def backfill_search_fields(cls, batch_size: int = 1000) -> int:
+        # 검색 필드(초성/자모 포함)가 없는 (이전에 추가된) 문서에 검색 필드를 채움
+        updated_count = 0
+        requests: List[UpdateOne] = []
+
+        async for document in cls._collection.find(
+            filter={"search_jamo": {"$exists": False}},
+            projection={"book_title": 1, "subject_name": 1},
+        ):
+            search_fields = SearchUtil.document_fields(
+                document.get("book_title"), document.get("subject_name")
+            )
+            requests.append(
+                UpdateOne({"_id": document["_id"]}, {"$set": search_fields})
+            )
+            if len(requests) >= batch_size:
+                result = await cls._collection.bulk_write(requests, ordered=False)
+                updated_count += result.modified_count
+                requests = []
+
+        if requests:
+            result = await cls._collection.bulk_write(requests, ordered=False)
+            updated_count += result.modified_count
+
+        return updated_count
+
+    @classmethod
+    async def _write_stock_fields(cls, documents: List[dict[str, Any]]) -> int:
+        frame = BookUtil.clean_stock_columns(
+            pd.DataFrame(documents, dtype=object).reindex(
+                columns=["_id", *INTEGER_FIELDS, RATE_FIELD]
+            )
+        )
+        requests = [
+            UpdateOne(
+                {"_id": row["_id"]},
+                {
+                    "$set": {
+                        **{
+                            field: row[field] for field in [*INTEGER_FIELDS, RATE_FIELD]
+                        },
+                        **{
+                            field: None
+                            for field in LEGACY_NONE_TEXT_FIELDS
+                            if document.get(field) == "None"
+                        },
+                    }
+                },
+            )
+            for document, row in zip(documents, frame.to_dict("records"))
+        ]
+        result = await cls._collection.bulk_write(requests, ordered=False)
+        return result.modified_count
+
+    @classmethod
+    async def migrate_stock_fields(cls, batch_size: int = 1000) -> int:
+        # 문자열로 저장된 (이전에 추가된) 재고 필드를 int/float 로 변환하고
+        # 빈 값이 문자열 "None" 으로 저장된 텍스트 필드는 null 로 정리
+        updated_count = 0
+        documents: List[dict[str, Any]] = []
+
+        async for document in cls._collection.find(
+            filter={
+                "$or": [
+                    *(
+                        {field: {"$type": "string"}}
+                        for field in [*INTEGER_FIELDS, RATE_FIELD]
+                    ),
+                    *({field: "None"} for field in LEGACY_NONE_TEXT_FIELDS),
+                ]
+            },
+            projection={
+                field: 1
+                for field in [*INTEGER_FIELDS, RATE_FIELD, *LEGACY_NONE_TEXT_FIELDS]
+            },
+        ):
+            documents.append(document)
+            if len(documents) >= batch_size:
+                updated_count += await cls._write_stock_fields(documents)
+                documents = []
+
+        if documents:
+            updated_count += await cls._write_stock_fields(documents)
+
+        return updated_count
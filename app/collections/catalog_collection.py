@@ -0,0 +1,111 @@
+from datetime import datetime
+from typing import Any, List
+
+from pymongo import IndexModel, ReturnDocument
+
+from app.core.cache import TTLCache
+from app.core.database import LazyCollection
+from app.core.env import env
+from app.documents.catalog_document import CatalogDocument
+from app.core.enums import STORE_SPOT
+
+
+class CatalogCollection:
+    _collection = LazyCollection("catalog")
+    _indexes = [
+        IndexModel([("store_spot", 1)], name="store_spot", unique=True),
+    ]
+    # 검색과 검색 응답의 ETag 확인용 (다른 워커의 변경은 TTL 이 지나야 반영)
+    _cache = TTLCache(
+        max_size=len(STORE_SPOT),
+        ttl_seconds=env.CATALOG_CACHE_TTL_SECONDS,
+        name="catalog",
+    )
+
+    @classmethod
+    def _parse(cls, document: dict[str, Any]) -> CatalogDocument:
+        return CatalogDocument(
+            _id=document["_id"],
+            store_spot=STORE_SPOT(document["store_spot"]),
+            active_version=document.get("active_version"),
+            revision=document.get("revision", 0),
+            updated_at=document["updated_at"],
+            file_hash=document.get("file_hash"),
+        )
+
+    @classmethod
+    async def get_catalog(cls, store_spot: str) -> CatalogDocument | None:
+        result = await cls._collection.find_one(filter={"store_spot": store_spot})
+        if result:
+            return cls._parse(result)
+        return None
+
+    @classmethod
+    async def get_cached_catalog(cls, store_spot: str) -> CatalogDocument | None:
+        catalog = cls._cache.get(store_spot)
+        if catalog is None:
+            catalog = await cls.get_catalog(store_spot=store_spot)
+            if catalog is not None:
+                cls._cache.set(store_spot, catalog)
+        return catalog
+
+    @classmethod
+    def invalidate_catalog(cls, store_spot: str) -> None:
+        cls._cache.delete(store_spot)
+
+    @classmethod
+    async def get_all_catalogs(cls) -> List[CatalogDocument]:
+        result = await cls._collection.find().to_list(length=None)
+        return [cls._parse(document) for document in result]
+
+    @classmethod
+    async def get_active_version(cls, store_spot: str) -> str | None:
+        # 버전 정보가 없는 지점은 catalog_version 필드가 없는 기존 문서를 사용
+        catalog = await cls.get_catalog(store_spot=store_spot)
+        return catalog.active_version if catalog else None
+
+    @classmethod
+    async def swap_active_version(
+        cls, store_spot: str, version: str, file_hash: str | None = None
+    ) -> str | None:
+        """활성 버전을 교체하고 직전 버전을 반환합니다."""
+        result = await cls._collection.find_one_and_update(
+            filter={"store_spot": store_spot},
+            update={
+                "$set": {
+                    "active_version": version,
+                    "file_hash": file_hash,
+                    "updated_at": datetime.now(),
+                },
+                "$inc": {"revision": 1},
+            },
+            upsert=True,
+            return_document=ReturnDocument.BEFORE,
+        )
+        cls.invalidate_catalog(store_spot)
+        if result:
+            return result.get("active_version")
+        return None
+
+    @classmethod
+    async def bump_revision(cls, store_spot: str, file_hash: str | None = None) -> None:
+        # 활성 버전 안에서 도서가 추가/삭제된 경우 (캐시 무효화 기준)
+        # 목록이 파일과 달라졌으므로 file_hash 도 함께 교체 (직접 수정이면 None)
+        await cls._collection.update_one(
+            filter={"store_spot": store_spot},
+            update={
+                "$set": {"file_hash": file_hash, "updated_at": datetime.now()},
+                "$inc": {"revision": 1},
+            },
+            upsert=True,
+        )
+        cls.invalidate_catalog(store_spot)
+
+    @classmethod
+    async def set_file_hash(cls, store_spot: str, file_hash: str | None) -> None:
+        # 도서 목록은 그대로이고 반영한 파일 해시만 기록
+        await cls._collection.update_one(
+            filter={"store_spot": store_spot},
+            update={"$set": {"file_hash": file_hash}},
+        )
+        cls.invalidate_catalog(store_spot)
@@ -0,0 +1,100 @@
+import asyncio
+import logging
+import sys
+from typing import Any, List
+
+from app.collections import ALL_COLLECTIONS, create_all_indexes
+from app.collections.book_collection import BookCollection
+from app.collections.catalog_collection import CatalogCollection
+from app.collections.user_collection import UserCollection
+from app.core.database import Database
+from app.utils.search_util import SearchUtil
+
+logger = logging.getLogger(__name__)
+
+# 요청마다 실행되는 쿼리 (인덱스 없이 COLLSCAN 으로 실행되면 안 됨)
+HOT_QUERIES = [
+    (
+        "book.select_book_by_book_title",
+        BookCollection,
+        {
+            "store_spot": "sch",
+            "catalog_version": None,
+            **SearchUtil.query_filter("회계원리"),
+        },
+    ),
+    (
+        "book.select_book_by_book_title (chosung)",
+        BookCollection,
+        {
+            "store_spot": "sch",
+            "catalog_version": None,
+            **SearchUtil.query_filter("ㅎㄱㅇㄹ"),
+        },
+    ),
+    (
+        "book.select_all_book_by_store_spot",
+        BookCollection,
+        {"store_spot": "sch", "catalog_version": None},
+    ),
+    ("catalog.get_catalog", CatalogCollection, {"store_spot": "sch"}),
+    ("user.get_user_by_user_id", UserCollection, {"user_id": "admin"}),
+]
+
+
+def _has_collection_scan(plan: Any) -> bool:
+    if isinstance(plan, dict):
+        if plan.get("stage") == "COLLSCAN":
+            return True
+        return any(_has_collection_scan(value) for value in plan.values())
+    if isinstance(plan, list):
+        return any(_has_collection_scan(value) for value in plan)
+    return False
+
+
+async def find_collection_scans() -> List[str]:
+    collection_scans = []
+    for name, collection, query in HOT_QUERIES:
+        explain = await collection._collection.find(query).explain()
+        if _has_collection_scan(explain.get("queryPlanner", {}).get("winningPlan")):
+            collection_scans.append(name)
+    return collection_scans
+
+
+async def warn_collection_scans() -> None:
+    # 개발 환경 진단용이므로 explain 실패가 서버 시작을 막지 않도록 함
+    try:
+        collection_scans = await find_collection_scans()
+    except Exception:
+        logger.exception("could not explain hot queries")
+        return
+
+    for name in collection_scans:
+        logger.warning("hot query %s falls back to COLLSCAN", name)
+
+
+async def main() -> int:
+    await Database.connect()
+    try:
+        return await check_indexes()
+    finally:
+        Database.close()
+
+
+async def check_indexes() -> int:
+    await create_all_indexes()
+
+    for collection in ALL_COLLECTIONS:
+        names = [index.document["name"] for index in collection._indexes]
+        print(f"{collection._collection.name}: {', '.join(names) or '-'}")
+
+    collection_scans = await find_collection_scans()
+    for name in collection_scans:
+        print(f"COLLSCAN: {name}")
+
+    return 1 if collection_scans else 0
+
+
+# python -m app.collections.index_check (COLLSCAN 이 있으면 실패)
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,27 @@
+from datetime import datetime
+from typing import List
+
+from app.core.database import LazyCollection
+
+
+class MigrationCollection:
+    # 적용한 마이그레이션 이름을 _id 로 기록 (_id 인덱스만 사용)
+    _collection = LazyCollection("migration")
+    _indexes = []
+
+    @classmethod
+    async def get_applied_names(cls, names: List[str]) -> set[str]:
+        result = await cls._collection.find(
+            filter={"_id": {"$in": names}}, projection={"_id": 1}
+        ).to_list(length=None)
+        return {document["_id"] for document in result}
+
+    @classmethod
+    async def mark_applied(cls, name: str, updated_count: int) -> None:
+        await cls._collection.update_one(
+            filter={"_id": name},
+            update={
+                "$set": {"updated_count": updated_count, "applied_at": datetime.now()}
+            },
+            upsert=True,
+        )
@@ -0,0 +1,100 @@
+import dataclasses
+from datetime import datetime
+from typing import Any, List
+from bson import ObjectId
+from pymongo import IndexModel
+
+from app.core.database import LazyCollection
+from app.core.env import env
+from app.documents.upload_job_document import UploadJobDocument
+from app.core.enums import STORE_SPOT, UPLOAD_JOB_STATUS, UPLOAD_MODE
+
+
+class UploadJobCollection:
+    _collection = LazyCollection("upload_job")
+    _indexes = [
+        # 끝난 작업은 UPLOAD_JOB_TTL_SECONDS 가 지나면 자동 삭제 (진행 중인 작업은 finished_at 이 None)
+        IndexModel(
+            [("finished_at", 1)],
+            name="finished_at_ttl",
+            expireAfterSeconds=env.UPLOAD_JOB_TTL_SECONDS,
+        ),
+        IndexModel([("status", 1), ("heartbeat_at", 1)], name="status_heartbeat_at"),
+    ]
+    # 대기/처리 중인 작업 상태
+    _active_statuses = [UPLOAD_JOB_STATUS.queued.value, UPLOAD_JOB_STATUS.running.value]
+
+    @classmethod
+    def _parse(cls, document: dict[str, Any]) -> UploadJobDocument:
+        return UploadJobDocument(
+            _id=document["_id"],
+            store_spot=STORE_SPOT(document["store_spot"]),
+            status=UPLOAD_JOB_STATUS(document["status"]),
+            mode=UPLOAD_MODE(document.get("mode", UPLOAD_MODE.replace)),
+            file_name=document["file_name"],
+            file_hash=document.get("file_hash", ""),
+            force=document.get("force", False),
+            rows_parsed=document["rows_parsed"],
+            rows_inserted=document["rows_inserted"],
+            rows_failed=document["rows_failed"],
+            errors=document["errors"],
+            result=document["result"],
+            created_at=document["created_at"],
+            started_at=document["started_at"],
+            finished_at=document["finished_at"],
+            worker_id=document.get("worker_id", ""),
+            heartbeat_at=document.get("heartbeat_at"),
+        )
+
+    @classmethod
+    async def get_job_by_id(cls, id: str) -> UploadJobDocument | None:
+        if not ObjectId.is_valid(id):
+            return None
+        result = await cls._collection.find_one(filter={"_id": ObjectId(id)})
+        if result:
+            return cls._parse(result)
+        return None
+
+    @classmethod
+    async def save_job(cls, document: UploadJobDocument) -> None:
+        save_data = dataclasses.asdict(document)
+        save_data.pop("_id", None)
+
+        await cls._collection.replace_one(
+            filter={"_id": document.id}, replacement=save_data, upsert=True
+        )
+
+    @classmethod
+    async def touch_jobs(cls, worker_id: str, heartbeat_at: datetime) -> None:
+        # 워커가 살아 있는 동안 대기열의 작업이 중단된 작업으로 처리되지 않도록 갱신
+        await cls._collection.update_many(
+            filter={"worker_id": worker_id, "status": {"$in": cls._active_statuses}},
+            update={"$set": {"heartbeat_at": heartbeat_at}},
+        )
+
+    @classmethod
+    async def fail_stale_jobs(cls, stale_before: datetime, error: str) -> List[str]:
+        # heartbeat 가 끊긴 (워커가 재시작/종료된) 대기/처리 중 작업을 실패로 처리
+        stale_filter = {
+            "status": {"$in": cls._active_statuses},
+            "$or": [
+                {"heartbeat_at": {"$lt": stale_before}},
+                {"heartbeat_at": None, "created_at": {"$lt": stale_before}},
+            ],
+        }
+        job_ids = []
+        async for document in cls._collection.find(stale_filter, {"_id": 1}):
+            # 여러 워커가 동시에 확인해도 한 번만 처리되도록 조건을 다시 걸고 갱신
+            result = await cls._collection.find_one_and_update(
+                filter={"_id": document["_id"], **stale_filter},
+                update={
+                    "$set": {
+                        "status": UPLOAD_JOB_STATUS.failed.value,
+                        "errors": [error],
+                        "finished_at": datetime.now(),
+                    }
+                },
+            )
+            if result is not None:
+                job_ids.append(str(document["_id"]))
+        return job_ids
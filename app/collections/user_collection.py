@@ -1,13 +1,25 @@
 import dataclasses
 from typing import Any
+from pymongo import IndexModel
 
-from app.core.database import db
+from app.core.cache import TTLCache
+from app.core.database import LazyCollection
+from app.core.env import env
 from app.documents.user_document import UserDocument
 from app.core.enums import STORE_SPOT
 
 
 class UserCollection:
-    _collection = db["user"]
+    _collection = LazyCollection("user")
+    _indexes = [
+        IndexModel([("user_id", 1)], name="user_id", unique=True),
+    ]
+    # 토큰 검증(get_current_user) 전용 캐시 (사용자가 바뀌면 invalidate_user)
+    _cache = TTLCache(
+        max_size=env.USER_CACHE_MAX_SIZE,
+        ttl_seconds=env.USER_CACHE_TTL_SECONDS,
+        name="user",
+    )
 
     @classmethod
     def _parse(cls, document: dict[str, Any]) -> UserDocument:
@@ -20,17 +32,36 @@ class UserCollection:
 
     @classmethod
     async def get_user_by_user_id(cls, user_id: str) -> UserDocument | None:
+        # 로그인은 DB 에서 바뀐 비밀번호/삭제된 사용자가 바로 반영되도록 캐시 없이 조회
         result = await cls._collection.find_one(filter={"user_id": user_id})
         if result:
             return cls._parse(result)
         return None
 
+    @classmethod
+    async def get_cached_user_by_user_id(cls, user_id: str) -> UserDocument | None:
+        user = cls._cache.get(user_id)
+        if user is not None:
+            return user
+
+        user = await cls.get_user_by_user_id(user_id=user_id)
+        if user is not None:
+            # 비밀번호 해시는 캐시에 남기지 않음
+            user = dataclasses.replace(user, hashed_password="")
+            cls._cache.set(user_id, user)
+        return user
+
+    @classmethod
+    def invalidate_user(cls, user_id: str) -> None:
+        cls._cache.delete(user_id)
+
     @classmethod
     async def insert_user(cls, document: UserDocument) -> str | None:
         insert_data = dataclasses.asdict(document)
         insert_data.pop("_id", None)
 
         result = await cls._collection.insert_one(insert_data)
+        cls.invalidate_user(document.user_id)
 
         if result.inserted_id:
             return str(result.inserted_id)
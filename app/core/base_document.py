@@ -22,7 +22,7 @@ PydanticObjectId = Annotated[
 ]
 
 
-@dataclasses.dataclass(kw_only=True, frozen=True)
+@dataclasses.dataclass(kw_only=True, frozen=True, slots=True)
 class BaseModel:
     _id: PydanticObjectId = dataclasses.field(default_factory=ObjectId)
 
@@ -0,0 +1,186 @@
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+import orjson
+
+from app.core.enums import CACHE_BACKEND
+from app.core.metrics import record_cache
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """크기 제한(LRU)과 만료 시간(TTL)이 있는 프로세스 내 캐시"""
+
+    def __init__(self, max_size: int, ttl_seconds: float, name: str | None = None):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        # name 이 있으면 적중/실패를 cache_requests_total 메트릭에도 기록
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self._items: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: Hashable) -> Any | None:
+        item = self._items.get(key)
+        if item is None or item[0] <= time.monotonic():
+            if item is not None:
+                del self._items[key]
+            self.misses += 1
+            if self.name is not None:
+                record_cache(self.name, hit=False)
+            return None
+
+        self._items.move_to_end(key)
+        self.hits += 1
+        if self.name is not None:
+            record_cache(self.name, hit=True)
+        return item[1]
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: float | None = None) -> None:
+        expires_at = time.monotonic() + (ttl_seconds or self.ttl_seconds)
+        self._items[key] = (expires_at, value)
+        self._items.move_to_end(key)
+
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        self._items.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> None:
+        for key in [k for k in self._items if str(k).startswith(prefix)]:
+            del self._items[key]
+
+    def clear(self) -> None:
+        self._items.clear()
+
+
+class CacheBackend:
+    hits: int = 0
+    misses: int = 0
+
+    async def get(self, key: str) -> Any | None:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: Any) -> None:
+        raise NotImplementedError
+
+    async def delete_prefix(self, prefix: str) -> None:
+        raise NotImplementedError
+
+
+class MemoryCacheBackend(CacheBackend):
+    def __init__(self, max_size: int, ttl_seconds: float, name: str | None = None):
+        self._cache = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds, name=name)
+
+    @property
+    def hits(self) -> int:
+        return self._cache.hits
+
+    @property
+    def misses(self) -> int:
+        return self._cache.misses
+
+    async def get(self, key: str) -> Any | None:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: Any) -> None:
+        self._cache.set(key, value)
+
+    async def delete_prefix(self, prefix: str) -> None:
+        self._cache.delete_prefix(prefix)
+
+
+class RedisCacheBackend(CacheBackend):
+    """gunicorn 워커끼리 공유하는 캐시
+
+    공유 저장소의 값을 pickle 로 풀지 않도록 dumps/loads 로 JSON 직렬화
+    redis 에 연결할 수 없으면 요청을 실패시키지 않고 캐시가 없는 것처럼 동작
+    """
+
+    def __init__(
+        self,
+        uri: str,
+        namespace: str,
+        ttl_seconds: float,
+        dumps: Callable[[Any], bytes] = orjson.dumps,
+        loads: Callable[[bytes], Any] = orjson.loads,
+    ):
+        from redis import asyncio as redis
+        from redis.exceptions import RedisError
+
+        self._client = redis.from_url(uri)
+        self._errors = RedisError
+        self._namespace = namespace
+        self._ttl_seconds = ttl_seconds
+        self._dumps = dumps
+        self._loads = loads
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> Any | None:
+        try:
+            value = await self._client.get(f"{self._namespace}:{key}")
+        except self._errors as error:
+            logger.warning("%s cache get failed: %r", self._namespace, error)
+            value = None
+        if value is None:
+            self.misses += 1
+            record_cache(self._namespace, hit=False)
+            return None
+        self.hits += 1
+        record_cache(self._namespace, hit=True)
+        return self._loads(value)
+
+    async def set(self, key: str, value: Any) -> None:
+        try:
+            await self._client.set(
+                f"{self._namespace}:{key}",
+                self._dumps(value),
+                ex=max(1, int(self._ttl_seconds)),
+            )
+        except self._errors as error:
+            logger.warning("%s cache set failed: %r", self._namespace, error)
+
+    async def delete_prefix(self, prefix: str) -> None:
+        # 지우지 못한 값은 TTL 이 지나면 만료됨
+        try:
+            keys = [
+                key
+                async for key in self._client.scan_iter(
+                    match=f"{self._namespace}:{prefix}*"
+                )
+            ]
+            if keys:
+                await self._client.delete(*keys)
+        except self._errors as error:
+            logger.warning("%s cache delete failed: %r", self._namespace, error)
+
+
+def create_cache_backend(
+    backend: str,
+    namespace: str,
+    max_size: int,
+    ttl_seconds: float,
+    redis_uri: str,
+    dumps: Callable[[Any], bytes] = orjson.dumps,
+    loads: Callable[[bytes], Any] = orjson.loads,
+) -> CacheBackend:
+    # dumps/loads 는 redis 에 저장할 때만 사용 (메모리 캐시는 객체를 그대로 보관)
+    if backend == CACHE_BACKEND.redis:
+        return RedisCacheBackend(
+            uri=redis_uri,
+            namespace=namespace,
+            ttl_seconds=ttl_seconds,
+            dumps=dumps,
+            loads=loads,
+        )
+    return MemoryCacheBackend(
+        max_size=max_size, ttl_seconds=ttl_seconds, name=namespace
+    )
@@ -1,8 +1,83 @@
-from motor.motor_asyncio import AsyncIOMotorClient
+import asyncio
+from typing import Any
+
+from motor.motor_asyncio import (
+    AsyncIOMotorClient,
+    AsyncIOMotorCollection,
+    AsyncIOMotorDatabase,
+)
 
 from app.core.env import env
+from app.core.metrics import MongoCommandListener
+
+
+class Database:
+    """애플리케이션 lifespan 에서 연결/종료하는 Motor 클라이언트"""
+
+    client: AsyncIOMotorClient | None = None
+
+    @classmethod
+    def _client_options(cls) -> dict[str, Any]:
+        options: dict[str, Any] = {
+            "maxPoolSize": env.DB_MAX_POOL_SIZE,
+            "minPoolSize": env.DB_MIN_POOL_SIZE,
+            "connectTimeoutMS": env.DB_CONNECT_TIMEOUT_MS,
+            "serverSelectionTimeoutMS": env.DB_SERVER_SELECTION_TIMEOUT_MS,
+            "socketTimeoutMS": env.DB_SOCKET_TIMEOUT_MS,
+            "waitQueueTimeoutMS": env.DB_WAIT_QUEUE_TIMEOUT_MS,
+            "readPreference": env.DB_READ_PREFERENCE,
+            "event_listeners": [MongoCommandListener()],
+        }
+        if env.DB_COMPRESSORS:
+            # zstd/snappy 는 pymongo[zstd], pymongo[snappy] extra 가 설치되어 있어야 함
+            options["compressors"] = env.DB_COMPRESSORS
+        return options
+
+    @classmethod
+    async def connect(cls) -> None:
+        if cls.client is not None:
+            return
+
+        client = AsyncIOMotorClient(env.DB_URI, **cls._client_options())
+
+        # 배포 직후 첫 요청이 연결 수립 비용을 내지 않도록 minPoolSize 만큼 미리 연결
+        try:
+            await asyncio.gather(
+                *(
+                    client.admin.command("ping")
+                    for _ in range(max(1, env.DB_MIN_POOL_SIZE))
+                )
+            )
+        except Exception:
+            client.close()
+            raise
+
+        cls.client = client
+
+    @classmethod
+    def close(cls) -> None:
+        if cls.client is not None:
+            cls.client.close()
+            cls.client = None
+
+    @classmethod
+    def get_database(cls) -> AsyncIOMotorDatabase:
+        if cls.client is None:
+            raise RuntimeError("database client is not connected")
+        return cls.client[env.DB_NAME]
+
+
+class LazyCollection:
+    """클래스 속성으로 선언하고, 접근할 때 현재 클라이언트의 컬렉션을 반환"""
 
-# 비동기 클라이언트
-client = AsyncIOMotorClient(env.DB_URI)
+    def __init__(self, name: str):
+        self.name = name
+        self._client: AsyncIOMotorClient | None = None
+        self._collection: AsyncIOMotorCollection | None = None
 
-db = client["base"]
+    def __get__(self, instance: Any, owner: type) -> AsyncIOMotorCollection:
+        # 클라이언트가 바뀌지 않았으면 만들어 둔 컬렉션 객체를 재사용
+        if self._collection is None or self._client is not Database.client:
+            self._collection = Database.get_database()[self.name]
+            self._client = Database.client
+        return self._collection
@@ -12,3 +12,35 @@ class STORE_SPOT(str, Enum):
     nasaret = "nasaret"
     kongju = "kongju"
     mokwon = "mokwon"
+
+
+class UPLOAD_JOB_STATUS(str, Enum):
+    queued = "queued"
+    running = "running"
+    succeeded = "succeeded"
+    failed = "failed"
+
+
+class UPLOAD_JOB_STORE(str, Enum):
+    memory = "memory"
+    mongo = "mongo"
+
+
+class CACHE_BACKEND(str, Enum):
+    memory = "memory"
+    redis = "redis"
+
+
+class SEARCH_ENGINE(str, Enum):
+    mongo = "mongo"
+    memory = "memory"
+
+
+class EXPORT_FORMAT(str, Enum):
+    csv = "csv"
+    xlsx = "xlsx"
+
+
+class UPLOAD_MODE(str, Enum):
+    replace = "replace"
+    incremental = "incremental"
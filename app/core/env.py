@@ -7,6 +7,67 @@ class Env(BaseSettings):
     SECRET_KEY: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int
 
+    DB_NAME: str = "base"
+    # MongoDB 연결 풀/타임아웃/압축/읽기 설정 (워커 프로세스마다 적용)
+    DB_MAX_POOL_SIZE: int = 100
+    DB_MIN_POOL_SIZE: int = 0
+    DB_CONNECT_TIMEOUT_MS: int = 20000
+    DB_SERVER_SELECTION_TIMEOUT_MS: int = 30000
+    DB_SOCKET_TIMEOUT_MS: int | None = None
+    DB_WAIT_QUEUE_TIMEOUT_MS: int | None = None
+    DB_COMPRESSORS: str = ""
+    DB_READ_PREFERENCE: str = "primary"
+
+    # 엑셀 업로드 시 insert_many 한 번에 넣을 문서 수
+    BOOK_INSERT_BATCH_SIZE: int = 1000
+    # 엑셀 파싱에 사용할 프로세스 수와 내보내기에 사용할 스레드 수
+    EXCEL_PARSE_WORKERS: int = 2
+    EXCEL_EXPORT_WORKERS: int = 2
+    # bcrypt 해시/검증 스레드 수와 최대 대기 수
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_QUEUE: int = 32
+    # 메모리 검색/자동완성 색인을 만들 프로세스 수
+    INDEX_BUILD_WORKERS: int = 1
+    # 업로드 작업 설정 (저장소: "memory" 또는 "mongo")
+    UPLOAD_DIR: str = "uploads"
+    UPLOAD_JOB_STORE: str = "mongo"
+    UPLOAD_JOB_WORKERS: int = 1
+    UPLOAD_JOB_MAX_QUEUE: int = 8
+    # 중단된 작업 확인 주기, 이 시간 동안 확인이 없으면 중단된 작업으로 처리, 끝난 작업 보관 시간
+    UPLOAD_JOB_HEARTBEAT_SECONDS: int = 10
+    UPLOAD_JOB_STALE_SECONDS: int = 60
+    UPLOAD_JOB_TTL_SECONDS: int = 604800
+    # 검색 결과 캐시 설정 (백엔드: "memory" 또는 "redis")
+    SEARCH_CACHE_BACKEND: str = "memory"
+    SEARCH_CACHE_MAX_SIZE: int = 1024
+    SEARCH_CACHE_TTL_SECONDS: int = 300
+    REDIS_URI: str = "redis://localhost:6379/0"
+    # 검색 결과 페이지 크기 제한과 커서 배치 크기
+    SEARCH_MAX_LIMIT: int = 100
+    SEARCH_CURSOR_BATCH_SIZE: int = 100
+    # 검색 엔진 ("mongo" 또는 지점별 도서 목록을 메모리에 올리는 "memory")
+    SEARCH_ENGINE: str = "mongo"
+    SEARCH_ENGINE_REFRESH_SECONDS: int = 10
+    # 자동완성 사용 여부 (켜면 워커마다 모든 지점의 도서명을 메모리에 올림)와 다른 워커 변경 확인 주기
+    SUGGEST_ENABLED: bool = True
+    SUGGEST_REFRESH_SECONDS: int = 10
+    # 자동완성 결과 수 기본값/최대값과 검색어 최대 길이
+    SUGGEST_LIMIT: int = 10
+    SUGGEST_MAX_LIMIT: int = 20
+    SUGGEST_MAX_QUERY_LENGTH: int = 50
+    # 검색/ETag 용 지점 카탈로그 캐시 시간과 브라우저 캐시 시간(Cache-Control max-age)
+    CATALOG_CACHE_TTL_SECONDS: int = 2
+    SEARCH_HTTP_MAX_AGE_SECONDS: int = 0
+    # 활성 버전이 아닌 도서 목록 버전을 정리하기 전 대기 시간 (가장 오래 걸리는 업로드보다 길어야 함)
+    CATALOG_VERSION_GRACE_SECONDS: int = 3600
+    # /metrics 를 조회할 수 있는 주소/대역 (쉼표 구분, 기본값은 같은 서버의 Prometheus 만 허용)
+    METRICS_ALLOWED_IPS: str = "127.0.0.1,::1"
+    # 이 크기(byte) 이상인 응답은 gzip 압축
+    GZIP_MINIMUM_SIZE: int = 1000
+    # 토큰 검증용 토큰/사용자 캐시 설정 (로그인은 캐시 없이 DB 에서 조회)
+    USER_CACHE_MAX_SIZE: int = 1024
+    USER_CACHE_TTL_SECONDS: int = 300
+
     class Config:
         env_file = ".env"
 
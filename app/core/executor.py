@@ -0,0 +1,169 @@
+import asyncio
+import contextlib
+import functools
+import multiprocessing
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, AsyncGenerator, BinaryIO, Callable, TypeVar
+
+from app.core.env import env
+from app.core.metrics import (
+    EXECUTOR_TASKS,
+    EXECUTOR_TASKS_TOTAL,
+    EXECUTOR_WAIT_DURATION,
+)
+
+T = TypeVar("T")
+
+
+class ExecutorBusyError(RuntimeError):
+    pass
+
+
+# spool 파일 레코드 = 8 byte 길이 + 데이터
+SPOOL_HEADER_SIZE = 8
+
+
+def write_spool_record(spool: BinaryIO, data: bytes) -> None:
+    # 부모 프로세스가 바로 읽을 수 있도록 레코드마다 flush
+    spool.write(len(data).to_bytes(SPOOL_HEADER_SIZE, "big"))
+    spool.write(data)
+    spool.flush()
+
+
+def _read_spool_record(spool: BinaryIO) -> bytes | None:
+    # 아직 다 쓰이지 않은 레코드면 읽은 위치를 되돌리고 None
+    position = spool.tell()
+    header = spool.read(SPOOL_HEADER_SIZE)
+    if len(header) == SPOOL_HEADER_SIZE:
+        size = int.from_bytes(header, "big")
+        data = spool.read(size)
+        if len(data) == size:
+            return data
+    spool.seek(position)
+    return None
+
+
+class BoundedExecutor:
+    def __init__(
+        self,
+        name: str,
+        max_workers: int,
+        max_queue: int | None = None,
+        processes: bool = False,
+    ):
+        self.name = name
+        self.max_queue = max_queue
+        # 대기/실행 중인 작업 수 (모니터링용)
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.rejected = 0
+        # /metrics 로 내보내는 값 (executor 이름별)
+        self._queued_gauge = EXECUTOR_TASKS.labels(executor=name, state="queued")
+        self._running_gauge = EXECUTOR_TASKS.labels(executor=name, state="running")
+        self._completed_counter = EXECUTOR_TASKS_TOTAL.labels(
+            executor=name, result="completed"
+        )
+        self._rejected_counter = EXECUTOR_TASKS_TOTAL.labels(
+            executor=name, result="rejected"
+        )
+        self._wait_histogram = EXECUTOR_WAIT_DURATION.labels(executor=name)
+        self._semaphore = asyncio.Semaphore(max_workers)
+        self._executor: Executor
+        if processes:
+            # GIL 을 잡고 있는 순수 파이썬 작업용 (인자와 반환값은 pickle 로 전달)
+            # Motor 스레드가 있는 프로세스를 fork 하지 않도록 spawn 사용
+            self._executor = ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix=name
+            )
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        # 대기열이 가득 차면 바로 거절해서 요청이 끝없이 쌓이지 않도록 함
+        if self.max_queue is not None and self.queued >= self.max_queue:
+            self.rejected += 1
+            self._rejected_counter.inc()
+            raise ExecutorBusyError(self.name)
+
+        self.queued += 1
+        self._queued_gauge.inc()
+        started_at = time.perf_counter()
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.queued -= 1
+            self._queued_gauge.dec()
+        self._wait_histogram.observe(time.perf_counter() - started_at)
+
+        self.running += 1
+        self._running_gauge.inc()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, functools.partial(func, *args, **kwargs)
+            )
+        finally:
+            self.running -= 1
+            self._running_gauge.dec()
+            self.completed += 1
+            self._completed_counter.inc()
+            self._semaphore.release()
+
+    async def stream(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        spool_path: str,
+        poll_seconds: float = 0.05,
+    ) -> AsyncGenerator[bytes, None]:
+        """func(*args, spool_path) 가 write_spool_record 로 쓴 레코드를 쓰는 대로 반환
+
+        결과 전체를 반환값으로 돌려받지 않으므로 부모 프로세스는 레코드 하나만큼만 메모리 사용
+        """
+        open(spool_path, "wb").close()
+        task = asyncio.create_task(self.run(func, *args, spool_path))
+        try:
+            with open(spool_path, "rb") as spool:
+                while True:
+                    # 작업이 끝난 것을 먼저 확인해야 마지막 레코드를 놓치지 않음
+                    done = task.done()
+                    record = _read_spool_record(spool)
+                    if record is not None:
+                        yield record
+                    elif done:
+                        # 실패한 작업이면 예외 전달
+                        task.result()
+                        return
+                    else:
+                        await asyncio.wait({task}, timeout=poll_seconds)
+        finally:
+            # 소비를 중단하면 대기 중인 작업은 취소 (이미 실행 중인 자식 프로세스는 끝까지 실행)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(spool_path)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# 엑셀 파싱/행 변환 전용 (openpyxl 은 GIL 을 놓지 않으므로 별도 프로세스에서 실행)
+excel_executor = BoundedExecutor(
+    "excel-parser", env.EXCEL_PARSE_WORKERS, processes=True
+)
+
+# 메모리 검색/자동완성 색인 생성 전용 (업로드 파싱이 길어져도 색인 갱신이 밀리지 않도록 분리)
+index_executor = BoundedExecutor("index-build", env.INDEX_BUILD_WORKERS, processes=True)
+
+# 엑셀 내보내기 전용 (작성 중인 workbook 을 넘겨야 하므로 스레드에서 실행)
+excel_export_executor = BoundedExecutor("excel-export", env.EXCEL_EXPORT_WORKERS)
+
+# bcrypt 해시/검증 전용 (로그인이 몰려도 검색 요청이 막히지 않도록 분리)
+password_executor = BoundedExecutor(
+    "password-hash", env.PASSWORD_HASH_WORKERS, max_queue=env.PASSWORD_HASH_MAX_QUEUE
+)
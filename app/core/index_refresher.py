@@ -0,0 +1,114 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Generic, TypeVar
+
+from app.collections.catalog_collection import CatalogCollection
+from app.core.enums import STORE_SPOT
+
+logger = logging.getLogger(__name__)
+
+# 색인은 만들 때 읽은 catalog_version, revision 속성을 가져야 함
+IndexT = TypeVar("IndexT")
+
+
+class StoreIndexRefresher(Generic[IndexT]):
+    """지점별 메모리 색인을 지점 카탈로그의 (active_version, revision) 에 맞춰 유지
+
+    build(store_spot, catalog_version, revision) 로 색인을 만들고,
+    refresh_seconds 마다 다른 워커에서 바뀐 지점만 다시 만듦
+    지점마다 한 번에 하나만 만들고, 만드는 중에 다시 요청되면 끝난 뒤 한 번만 더 만듦
+    """
+
+    def __init__(
+        self,
+        name: str,
+        build: Callable[[str, str | None, int], Awaitable[IndexT]],
+        refresh_seconds: int,
+    ):
+        self.name = name
+        self._build = build
+        self._refresh_seconds = refresh_seconds
+        self._indexes: dict[str, IndexT] = {}
+        self._reload_tasks: dict[str, asyncio.Task] = {}
+        self._pending: set[str] = set()
+        self._refresh_task: asyncio.Task | None = None
+
+    def get(self, store_spot: str) -> IndexT | None:
+        return self._indexes.get(store_spot)
+
+    async def reload_store(self, store_spot: str) -> None:
+        catalog = await CatalogCollection.get_catalog(store_spot=store_spot)
+        catalog_version = catalog.active_version if catalog else None
+        revision = catalog.revision if catalog else 0
+
+        index = await self._build(store_spot, catalog_version, revision)
+
+        # 동시에 여러 번 다시 읽은 경우 더 최신 revision 만 반영
+        current = self._indexes.get(store_spot)
+        if current is None or current.revision <= index.revision:
+            self._indexes[store_spot] = index
+
+    async def _reload_until_current(self, store_spot: str) -> None:
+        # 만드는 동안 들어온 요청은 모두 다음 한 번으로 합침
+        while True:
+            self._pending.discard(store_spot)
+            try:
+                await self.reload_store(store_spot=store_spot)
+            except Exception:
+                logger.exception("%s index reload failed: %s", self.name, store_spot)
+            if store_spot not in self._pending:
+                return
+
+    def request_reload(self, store_spot: str) -> asyncio.Task:
+        # 도서 목록이 바뀔 때 호출 (쓰기 요청은 색인이 다시 만들어질 때까지 기다리지 않음)
+        task = self._reload_tasks.get(store_spot)
+        if task is not None and not task.done():
+            self._pending.add(store_spot)
+            return task
+
+        task = asyncio.create_task(self._reload_until_current(store_spot))
+        self._reload_tasks[store_spot] = task
+        return task
+
+    async def refresh_changed_stores(self) -> None:
+        catalogs = {
+            catalog.store_spot.value: catalog
+            for catalog in await CatalogCollection.get_all_catalogs()
+        }
+        for store_spot in STORE_SPOT:
+            catalog = catalogs.get(store_spot.value)
+            index = self._indexes.get(store_spot.value)
+            if (
+                index is None
+                or catalog is not None
+                and (
+                    index.catalog_version != catalog.active_version
+                    or index.revision != catalog.revision
+                )
+            ):
+                await self.request_reload(store_spot=store_spot.value)
+
+    async def _run_refresh(self) -> None:
+        # 다른 gunicorn 워커에서 바뀐 도서 목록을 주기적으로 반영
+        while True:
+            await asyncio.sleep(self._refresh_seconds)
+            try:
+                await self.refresh_changed_stores()
+            except Exception:
+                logger.exception("%s index refresh failed", self.name)
+
+    async def start(self) -> None:
+        await self.refresh_changed_stores()
+        self._refresh_task = asyncio.create_task(self._run_refresh())
+
+    async def stop(self) -> None:
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            await asyncio.gather(self._refresh_task, return_exceptions=True)
+            self._refresh_task = None
+        for task in self._reload_tasks.values():
+            task.cancel()
+        await asyncio.gather(*self._reload_tasks.values(), return_exceptions=True)
+        self._reload_tasks.clear()
+        self._pending.clear()
+        self._indexes.clear()
@@ -0,0 +1,189 @@
+import ipaddress
+import os
+import threading
+import time
+from typing import Any
+from urllib.parse import parse_qs
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+from pymongo import monitoring
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.enums import STORE_SPOT
+from app.core.env import env
+
+# gunicorn 워커가 여럿이면 PROMETHEUS_MULTIPROC_DIR 을 지정해서 워커별 값을 합산
+MULTIPROCESS = "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+STORE_SPOTS = {store_spot.value for store_spot in STORE_SPOT}
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간",
+    ["method", "route", "status", "store_spot"],
+)
+MONGO_COMMAND_DURATION = Histogram(
+    "mongodb_command_duration_seconds",
+    "MongoDB 명령 실행 시간",
+    ["command", "collection", "result"],
+)
+UPLOAD_ROWS = Counter(
+    "upload_rows_total",
+    "엑셀 업로드로 처리한 행 수 (rate 로 초당 행 수 확인)",
+    ["store_spot", "mode", "result"],
+)
+UPLOAD_BATCH_DURATION = Histogram(
+    "upload_batch_duration_seconds",
+    "엑셀 업로드 배치 쓰기 시간",
+    ["store_spot", "mode"],
+)
+UPLOAD_JOB_DURATION = Histogram(
+    "upload_job_duration_seconds",
+    "엑셀 업로드 작업 처리 시간",
+    ["store_spot", "mode", "status"],
+    buckets=(0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600),
+)
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "캐시 조회 수 (hit / (hit + miss) 로 적중률 확인)",
+    ["cache", "result"],
+)
+SINGLE_FLIGHT_REQUESTS = Counter(
+    "single_flight_requests_total",
+    "동시에 들어온 같은 조회 수 (coalesced 는 진행 중인 조회 결과를 함께 사용)",
+    ["name", "result"],
+)
+
+# 대기/실행 중 작업 수는 워커 프로세스 중 살아 있는 것만 합산
+EXECUTOR_TASKS = Gauge(
+    "executor_tasks_active",
+    "전용 executor 에서 대기(queued)/실행(running) 중인 작업 수",
+    ["executor", "state"],
+    multiprocess_mode="livesum",
+)
+EXECUTOR_TASKS_TOTAL = Counter(
+    "executor_tasks_total",
+    "전용 executor 작업 수 (rejected 는 대기열이 가득 차서 거절)",
+    ["executor", "result"],
+)
+EXECUTOR_WAIT_DURATION = Histogram(
+    "executor_wait_seconds",
+    "전용 executor 의 빈 자리를 기다린 시간",
+    ["executor"],
+)
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    CACHE_REQUESTS.labels(cache=cache, result="hit" if hit else "miss").inc()
+
+
+def record_single_flight(name: str, coalesced: bool) -> None:
+    SINGLE_FLIGHT_REQUESTS.labels(
+        name=name, result="coalesced" if coalesced else "leader"
+    ).inc()
+
+
+def is_metrics_client_allowed(host: str | None) -> bool:
+    # METRICS_ALLOWED_IPS 의 주소/대역(쉼표 구분)에서 온 요청만 허용
+    if host is None:
+        return False
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(
+        address in ipaddress.ip_network(network.strip(), strict=False)
+        for network in env.METRICS_ALLOWED_IPS.split(",")
+        if network.strip()
+    )
+
+
+def render_metrics() -> tuple[bytes, str]:
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+class MetricsMiddleware:
+    """라우트(경로 템플릿)와 지점별 요청 처리 시간을 기록하는 ASGI 미들웨어"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # 라벨 값이 늘어나지 않도록 매칭된 라우트 경로와 알려진 지점만 사용
+            route = scope.get("route")
+            store_spot = self._store_spot(scope)
+            HTTP_REQUEST_DURATION.labels(
+                method=scope["method"],
+                route=getattr(route, "path", "<unmatched>"),
+                status=str(status_code),
+                store_spot=store_spot,
+            ).observe(time.perf_counter() - started_at)
+
+    @classmethod
+    def _store_spot(cls, scope: Scope) -> str:
+        query = parse_qs(scope.get("query_string", b"").decode())
+        store_spot = query.get("store_spot", [""])[0]
+        return store_spot if store_spot in STORE_SPOTS else ""
+
+
+class MongoCommandListener(monitoring.CommandListener):
+    """MongoDB 명령별 실행 시간을 기록 (Motor 클라이언트 event_listeners 로 등록)"""
+
+    def __init__(self):
+        self._collections: dict[tuple[Any, int], str] = {}
+        self._lock = threading.Lock()
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        # getMore 는 커서 id 가 명령 값이므로 collection 필드를 사용
+        if event.command_name == "getMore":
+            collection = event.command.get("collection")
+        else:
+            collection = event.command.get(event.command_name)
+        if not isinstance(collection, str):
+            collection = ""
+        with self._lock:
+            self._collections[(event.connection_id, event.request_id)] = collection
+
+    def _observe(self, event: Any, result: str) -> None:
+        with self._lock:
+            collection = self._collections.pop(
+                (event.connection_id, event.request_id), ""
+            )
+        MONGO_COMMAND_DURATION.labels(
+            command=event.command_name, collection=collection, result=result
+        ).observe(event.duration_micros / 1_000_000)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._observe(event, "succeeded")
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._observe(event, "failed")
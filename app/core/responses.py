@@ -0,0 +1,47 @@
+import dataclasses
+import functools
+import operator
+from typing import Any, Callable
+
+import orjson
+from bson import ObjectId
+from fastapi.responses import JSONResponse
+
+
+@functools.cache
+def _dataclass_fields(cls: type) -> tuple[tuple[str, ...], Callable[[Any], tuple]]:
+    names = tuple(field.name for field in dataclasses.fields(cls))
+    return names, operator.attrgetter(*names)
+
+
+def _default(value: Any) -> Any:
+    # orjson 은 _ 로 시작하는 필드(_id)를 건너뛰므로 문서는 직접 dict 로 변환
+    if dataclasses.is_dataclass(value):
+        names, getter = _dataclass_fields(type(value))
+        return dict(zip(names, getter(value)))
+    if isinstance(value, ObjectId):
+        return str(value)
+    raise TypeError
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(
+        content, default=_default, option=orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+
+def is_not_modified(if_none_match: str | None, etag: str) -> bool:
+    # If-None-Match 는 약한 비교 (W/ 접두어 무시), 여러 값과 "*" 허용
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in tags
+
+
+class ORJSONResponse(JSONResponse):
+    """응답 모델 검증 없이 문서를 바로 직렬화하는 응답 (ObjectId/datetime 지원)"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -1,3 +1,4 @@
+import time
 from datetime import datetime, timedelta
 
 from jose import jwt, JWTError
@@ -5,7 +6,9 @@ from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 
+from app.core.cache import TTLCache
 from app.core.env import env
+from app.core.executor import password_executor
 from app.schemas.user_schema import TokenData
 from app.collections.user_collection import UserCollection
 from app.documents.user_document import UserDocument
@@ -19,6 +22,13 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
+# 검증된 토큰 캐시 (토큰의 만료 시각을 넘겨서 유지하지 않음)
+token_cache = TTLCache(
+    max_size=env.USER_CACHE_MAX_SIZE,
+    ttl_seconds=ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+    name="token",
+)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
@@ -29,6 +39,11 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+# bcrypt 는 CPU 를 오래 쓰므로 이벤트 루프 밖에서 실행
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await password_executor.run(verify_password, plain_password, hashed_password)
+
+
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     to_encode = data.copy()
     if expires_delta:
@@ -41,6 +56,10 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None) -> s
 
 
 def decode_access_token(token: str) -> TokenData | None:
+    token_data = token_cache.get(token)
+    if token_data is not None:
+        return token_data
+
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         user_id = payload.get("sub")
@@ -49,6 +68,13 @@ def decode_access_token(token: str) -> TokenData | None:
         token_data = TokenData(user_id=user_id)
     except JWTError:
         return None
+
+    ttl_seconds = token_cache.ttl_seconds
+    if payload.get("exp") is not None:
+        ttl_seconds = min(ttl_seconds, payload["exp"] - time.time())
+    if ttl_seconds > 0:
+        token_cache.set(token, token_data, ttl_seconds=ttl_seconds)
+
     return token_data
 
 
@@ -63,7 +89,7 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserDocument:
         raise credentials_exception
     if token_data.user_id is None:
         raise credentials_exception
-    user = await UserCollection.get_user_by_user_id(token_data.user_id)
+    user = await UserCollection.get_cached_user_by_user_id(token_data.user_id)
     if user is None:
         raise credentials_exception
     return user
@@ -0,0 +1,43 @@
+import asyncio
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+from app.core.metrics import record_single_flight
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """같은 키로 동시에 들어온 요청이 진행 중인 작업 하나의 결과를 함께 사용"""
+
+    def __init__(self, name: str):
+        self.name = name
+        # 직접 실행한 요청 수와 다른 요청의 결과를 함께 사용한 요청 수 (모니터링용)
+        self.leaders = 0
+        self.coalesced = 0
+        self._tasks: dict[Hashable, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        task = self._tasks.get(key)
+        if task is None:
+            # 별도 태스크로 실행해서 처음 요청한 쪽이 취소되어도 다른 요청은 결과를 받음
+            task = asyncio.ensure_future(func())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self.leaders += 1
+            record_single_flight(self.name, coalesced=False)
+        else:
+            self.coalesced += 1
+            record_single_flight(self.name, coalesced=True)
+
+        # shield: 기다리던 요청이 취소되면 그 요청만 빠지고 공유 작업은 계속 진행
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        # 기다리던 요청이 모두 취소된 경우에도 예외가 기록되지 않은 채 남지 않도록 확인
+        if not task.cancelled():
+            task.exception()
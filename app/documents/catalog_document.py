@@ -0,0 +1,15 @@
+import dataclasses
+from pydantic import Field
+from datetime import datetime
+
+from app.core.base_document import BaseModel
+from app.core.enums import STORE_SPOT
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True, slots=True)
+class CatalogDocument(BaseModel):
+    store_spot: STORE_SPOT = Field(..., description="지점명")
+    active_version: str | None = Field(..., description="활성 도서 목록 버전")
+    revision: int = Field(..., description="도서 목록 변경 횟수")
+    updated_at: datetime = Field(..., description="도서 목록 변경 시각")
+    file_hash: str | None = Field(..., description="마지막으로 반영한 엑셀 파일 해시")
@@ -0,0 +1,27 @@
+import dataclasses
+from typing import Any
+from pydantic import Field
+from datetime import datetime
+
+from app.core.base_document import BaseModel
+from app.core.enums import STORE_SPOT, UPLOAD_JOB_STATUS, UPLOAD_MODE
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True, slots=True)
+class UploadJobDocument(BaseModel):
+    store_spot: STORE_SPOT = Field(..., description="지점명")
+    status: UPLOAD_JOB_STATUS = Field(..., description="작업 상태")
+    mode: UPLOAD_MODE = Field(..., description="업로드 방식")
+    file_name: str = Field(..., description="업로드 파일명")
+    file_hash: str = Field(..., description="업로드 파일 해시 (sha256)")
+    force: bool = Field(..., description="같은 파일이어도 다시 반영할지 여부")
+    rows_parsed: int = Field(..., description="파싱된 행 수")
+    rows_inserted: int = Field(..., description="추가된 행 수")
+    rows_failed: int = Field(..., description="추가에 실패한 행 수")
+    errors: list[str] = Field(..., description="오류 목록")
+    result: dict[str, Any] | None = Field(..., description="업로드 결과")
+    created_at: datetime = Field(..., description="작업 생성 시각")
+    started_at: datetime | None = Field(..., description="작업 시작 시각")
+    finished_at: datetime | None = Field(..., description="작업 종료 시각")
+    worker_id: str = Field(..., description="작업을 대기열에 넣은 워커 프로세스 id")
+    heartbeat_at: datetime | None = Field(..., description="워커 확인 시각")
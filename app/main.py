@@ -1,24 +1,57 @@
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI, Depends, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, Response
 from typing import Any, Dict
 from contextlib import asynccontextmanager
 from bson import ObjectId  # Import ObjectId
 
+from app.core.database import Database
+from app.core.enums import MODE
 from app.core.env import env
-from app.collections import create_all_indexes
+from app.core.metrics import (
+    MetricsMiddleware,
+    is_metrics_client_allowed,
+    render_metrics,
+)
+from app.core.executor import (
+    excel_executor,
+    excel_export_executor,
+    index_executor,
+    password_executor,
+)
+from app.collections import create_all_indexes, run_all_migrations
+from app.collections.index_check import warn_collection_scans
 from app.routers import book_router, auth_router
 from app.core.security import get_current_user
+from app.services.search_engine_service import SearchEngineService
+from app.services.suggest_service import SuggestService
+from app.services.upload_job_service import UploadJobService
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # 워커마다 Motor 클라이언트를 만들고 연결 풀을 미리 채움
+    await Database.connect()
     # 초기 DB 인덱스 설정
     await create_all_indexes()
+    await run_all_migrations()
+    if env.MODE == MODE.dev:
+        await warn_collection_scans()
+    await SearchEngineService.start()
+    await SuggestService.start()
+    UploadJobService.start_workers()
 
     yield
     # On application shutdown
-    pass
+    await UploadJobService.stop_workers()
+    await SearchEngineService.stop()
+    await SuggestService.stop()
+    excel_executor.shutdown()
+    excel_export_executor.shutdown()
+    index_executor.shutdown()
+    password_executor.shutdown()
+    Database.close()
 
 
 app = FastAPI(
@@ -36,6 +69,9 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# 모바일(QR 코드) 사용자를 위해 큰 검색 응답은 gzip 으로 압축
+app.add_middleware(GZipMiddleware, minimum_size=env.GZIP_MINIMUM_SIZE)
+app.add_middleware(MetricsMiddleware)
 
 # Include the book router
 app.include_router(book_router.router)
@@ -47,6 +83,19 @@ async def favicon():
     return FileResponse("app/assets/favicon.ico")
 
 
+# Prometheus 수집용 (gunicorn 워커 전체 합산은 PROMETHEUS_MULTIPROC_DIR 설정 필요)
+# 0.0.0.0 으로 열려 있으므로 METRICS_ALLOWED_IPS 의 주소에서만 조회
+@app.get("/metrics", include_in_schema=False)
+async def metrics(request: Request) -> Response:
+    if not is_metrics_client_allowed(request.client.host if request.client else None):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="메트릭을 조회할 수 없는 주소입니다.",
+        )
+    content, media_type = render_metrics()
+    return Response(content=content, media_type=media_type)
+
+
 @app.get("/", dependencies=[Depends(get_current_user)])
 async def root() -> Dict[str, Any]:
     return {"I'm ready": "OK"}
@@ -1,15 +1,35 @@
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+import os
+from typing import List
 
-from app.core.enums import STORE_SPOT
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+    status,
+)
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
+
+from app.core.enums import EXPORT_FORMAT, STORE_SPOT, UPLOAD_MODE
+from app.core.env import env
+from app.core.responses import ORJSONResponse, dumps, is_not_modified
 from app.core.security import get_current_user
+from app.services.book_export_service import BookExportService
 from app.services.book_service import BookService
+from app.services.suggest_service import SuggestService
+from app.services.upload_job_service import UploadJobService
 from app.schemas.book_schema import (
     AddBookData,
     AddBookResponse,
     BookCreateModel,
     DeleteBookResponse,
     GetBooksResponse,
-    UploadBooksResponse,
+    SuggestBooksResponse,
+    UploadJobResponse,
 )
 
 router = APIRouter(
@@ -20,27 +40,53 @@ router = APIRouter(
 
 @router.post(
     "/upload/excel",
-    response_model=UploadBooksResponse,
-    status_code=status.HTTP_201_CREATED,
-    summary="엑셀 파일로 책 목록을 추가합니다.",
+    response_model=UploadJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="엑셀 파일로 책 목록을 추가하는 작업을 등록합니다.",
     dependencies=[Depends(get_current_user)],
 )
 async def upload_books_from_excel(
     store_spot: STORE_SPOT,
     file: UploadFile = File(...),
-) -> UploadBooksResponse:
-    (
-        total_books_in_file,
-        added_books_count,
-        del_files,
-    ) = await BookService.insert_all_books_to_file(store_spot=store_spot, file=file)
-
-    return UploadBooksResponse(
-        detail="엑셀 파일의 책 목록을 성공적으로 추가했습니다.",
-        total_books_in_file=total_books_in_file,
-        added_books_count=added_books_count,
-        deleted_books_count=del_files,
-        status_code=status.HTTP_201_CREATED,
+    mode: UPLOAD_MODE = Query(
+        UPLOAD_MODE.replace,
+        description="replace: 전체 교체, incremental: 바뀐 행만 반영",
+    ),
+    force: bool = Query(
+        False, description="마지막으로 반영한 파일과 같아도 다시 반영합니다."
+    ),
+) -> UploadJobResponse:
+    job = await UploadJobService.create_job(
+        store_spot=store_spot, file=file, mode=mode, force=force
+    )
+
+    return UploadJobResponse(
+        detail="엑셀 파일 업로드 작업이 등록되었습니다.",
+        job=job,
+        status_code=status.HTTP_202_ACCEPTED,
+    )
+
+
+@router.get(
+    "/upload/jobs/{job_id}",
+    response_model=UploadJobResponse,
+    status_code=status.HTTP_200_OK,
+    summary="엑셀 업로드 작업의 진행 상황을 조회합니다.",
+    dependencies=[Depends(get_current_user)],
+)
+async def get_upload_job(job_id: str) -> UploadJobResponse:
+    job = await UploadJobService.get_job(job_id=job_id)
+
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Upload job with id '{job_id}' not found",
+        )
+
+    return UploadJobResponse(
+        detail="업로드 작업을 성공적으로 조회했습니다.",
+        job=job,
+        status_code=status.HTTP_200_OK,
     )
 
 
@@ -87,6 +133,40 @@ async def delete_book(book_id: str) -> DeleteBookResponse:
     )
 
 
+@router.get(
+    "/suggest",
+    response_model=SuggestBooksResponse,
+    status_code=status.HTTP_200_OK,
+    summary="입력 중인 검색어로 시작하는 도서명을 추천합니다. (초성 포함)",
+)
+async def suggest_books(
+    store_spot: STORE_SPOT,
+    q: str = Query(
+        ...,
+        min_length=1,
+        max_length=env.SUGGEST_MAX_QUERY_LENGTH,
+        description="입력 중인 검색어",
+    ),
+    limit: int = Query(
+        env.SUGGEST_LIMIT, ge=1, le=env.SUGGEST_MAX_LIMIT, description="추천 수"
+    ),
+) -> SuggestBooksResponse:
+    if not SuggestService.is_enabled():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="자동완성을 사용하지 않습니다.",
+        )
+
+    # 메모리 색인에서만 조회 (키 입력마다 호출되므로 DB 를 조회하지 않음)
+    suggestions = SuggestService.suggest(store_spot=store_spot, query=q, limit=limit)
+
+    return SuggestBooksResponse(
+        detail="추천 도서명을 성공적으로 조회했습니다.",
+        suggestions=suggestions,
+        status_code=status.HTTP_200_OK,
+    )
+
+
 @router.get(
     "/search/{book_title}",
     response_model=GetBooksResponse,
@@ -94,10 +174,32 @@ async def delete_book(book_id: str) -> DeleteBookResponse:
     summary="제목으로 책을 검색합니다. (유사한 제목 포함)",
 )
 async def get_books_by_title(
-    book_title: str, store_spot: STORE_SPOT
-) -> GetBooksResponse:
-    books = await BookService.select_books_by_title(
-        book_title=book_title, store_spot=store_spot
+    request: Request,
+    book_title: str,
+    store_spot: STORE_SPOT,
+    limit: int | None = Query(
+        None, ge=1, le=env.SEARCH_MAX_LIMIT, description="페이지 크기"
+    ),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor"),
+    fields: List[str] | None = Query(
+        None, description="조회할 필드 (지정하지 않은 필드는 null)"
+    ),
+) -> Response:
+    # 도서 목록이 그대로면 검색 없이 304 (브라우저가 If-None-Match 로 확인)
+    etag = await BookService.get_search_etag(store_spot=store_spot)
+    cache_headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={env.SEARCH_HTTP_MAX_AGE_SECONDS}",
+    }
+    if is_not_modified(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
+    books, next_cursor = await BookService.select_books_by_title(
+        book_title=book_title,
+        store_spot=store_spot,
+        limit=limit,
+        cursor=cursor,
+        fields=fields,
     )
 
     if not books:
@@ -105,8 +207,59 @@ async def get_books_by_title(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"'{book_title}' 해당 제목의 도서를 찾을 수 없습니다.",
         )
-    return GetBooksResponse(
-        detail="책을 성공적으로 찾았습니다.",
-        books=books,
+    # 도서 목록은 응답 모델 재검증 없이 바로 직렬화 (스키마는 GetBooksResponse)
+    return ORJSONResponse(
+        content={
+            "detail": "책을 성공적으로 찾았습니다.",
+            "status_code": status.HTTP_200_OK,
+            "books": books,
+            "next_cursor": next_cursor,
+        },
         status_code=status.HTTP_200_OK,
+        headers=cache_headers,
+    )
+
+
+@router.get(
+    "/search/{book_title}/stream",
+    status_code=status.HTTP_200_OK,
+    summary="제목으로 책을 검색해 한 줄에 한 권씩(NDJSON) 스트리밍합니다.",
+)
+async def stream_books_by_title(
+    book_title: str, store_spot: STORE_SPOT
+) -> StreamingResponse:
+    books = BookService.stream_books_by_title(
+        book_title=book_title, store_spot=store_spot
+    )
+
+    return StreamingResponse(
+        (dumps(book) + b"\n" async for book in books),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.get(
+    "/export",
+    status_code=status.HTTP_200_OK,
+    summary="지점의 도서 목록 전체를 파일로 내려받습니다.",
+    dependencies=[Depends(get_current_user)],
+)
+async def export_books(
+    store_spot: STORE_SPOT, format: EXPORT_FORMAT = EXPORT_FORMAT.csv
+):
+    file_name = f"{store_spot.value}_books.{format.value}"
+
+    if format == EXPORT_FORMAT.csv:
+        return StreamingResponse(
+            BookExportService.stream_csv(store_spot=store_spot),
+            media_type="text/csv; charset=utf-8",
+            headers={"Content-Disposition": f'attachment; filename="{file_name}"'},
+        )
+
+    file_path = await BookExportService.export_xlsx(store_spot=store_spot)
+    return FileResponse(
+        file_path,
+        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        filename=file_name,
+        background=BackgroundTask(os.remove, file_path),
     )
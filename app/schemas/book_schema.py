@@ -1,11 +1,12 @@
 from datetime import datetime
 from typing import List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 from app.core.base_response import BaseResponseModel
-from app.core.enums import STORE_SPOT
+from app.core.enums import STORE_SPOT, UPLOAD_JOB_STATUS, UPLOAD_MODE
 from app.documents.book_document import BookDocument
+from app.utils.book_util import BookUtil
 
 
 class BookCreateModel(BaseModel):
@@ -16,15 +17,26 @@ class BookCreateModel(BaseModel):
     book_title: str = Field(..., description="도서명")
     author: str | None = Field(..., description="저자")
     publisher: str | None = Field(..., description="출판사")
-    request_count: str | None = Field(..., description="신청")
-    received_count: str | None = Field(..., description="입고")
-    price: str | None = Field(..., description="가격")
-    fulfillment_rate: str | None = Field(..., description="입고율")
+    request_count: int = Field(..., description="신청")
+    received_count: int = Field(..., description="입고")
+    price: int = Field(..., description="가격")
+    fulfillment_rate: float | None = Field(..., description="입고율 (0~1 비율)")
     major: str | None = Field(..., description="전공")
     professor_name: str | None = Field(..., description="교수명")
     location: str | None = Field(..., description="위치")
     order_date: datetime | None = Field(..., description="주문날짜")
 
+    # "12,000" 같은 문자열도 받아서 숫자로 정리
+    @field_validator("request_count", "received_count", "price", mode="before")
+    @classmethod
+    def clean_integer_fields(cls, v):
+        return BookUtil.clean_integer_fields(v)
+
+    @field_validator("fulfillment_rate", mode="before")
+    @classmethod
+    def clean_rate_field(cls, v):
+        return BookUtil.clean_rate_field(v)
+
 
 class AddBookData(BaseModel):
     inserted_id: str
@@ -36,13 +48,55 @@ class AddBookResponse(BaseResponseModel):
 
 class GetBooksResponse(BaseResponseModel):
     books: List[BookDocument] = Field(..., description="조회된 도서 목록")
+    next_cursor: str | None = Field(None, description="다음 페이지 커서")
+
+
+class SuggestBooksResponse(BaseResponseModel):
+    suggestions: List[str] = Field(..., description="자동완성 도서명 목록")
 
 
 class DeleteBookResponse(BaseResponseModel):
     pass
 
 
-class UploadBooksResponse(BaseResponseModel):
+class UploadBatchData(BaseModel):
+    batch_index: int = Field(..., description="배치 순번")
+    inserted_count: int = Field(..., description="배치에서 추가된 책 수")
+    failed_count: int = Field(..., description="배치에서 추가에 실패한 책 수")
+    elapsed_ms: float = Field(..., description="배치 처리 시간(ms)")
+
+
+class UploadBooksData(BaseModel):
+    mode: UPLOAD_MODE = Field(UPLOAD_MODE.replace, description="업로드 방식")
+    skipped: bool = Field(
+        False, description="마지막으로 반영한 파일과 같아서 건너뛰었는지 여부"
+    )
     total_books_in_file: int = Field(..., description="엑셀 파일에 있는 총 책 수")
-    deleted_books_count: int = Field(..., description="기존의 책 수")
+    deleted_books_count: int = Field(..., description="삭제된 기존 책 수")
     added_books_count: int = Field(..., description="성공적으로 추가된 책 수")
+    updated_books_count: int = Field(0, description="내용이 바뀌어 수정된 책 수")
+    unchanged_books_count: int = Field(0, description="변경 없이 유지된 책 수")
+    failed_books_count: int = Field(..., description="추가에 실패한 책 수")
+    batches: List[UploadBatchData] = Field(..., description="배치별 처리 결과")
+
+
+class UploadJobData(BaseModel):
+    job_id: str = Field(..., description="업로드 작업 아이디")
+    store_spot: STORE_SPOT = Field(..., description="지점명")
+    status: UPLOAD_JOB_STATUS = Field(..., description="작업 상태")
+    mode: UPLOAD_MODE = Field(..., description="업로드 방식")
+    file_name: str = Field(..., description="업로드 파일명")
+    file_hash: str = Field(..., description="업로드 파일 해시 (sha256)")
+    rows_parsed: int = Field(..., description="파싱된 행 수")
+    rows_inserted: int = Field(..., description="추가된 행 수")
+    rows_failed: int = Field(..., description="추가에 실패한 행 수")
+    rows_per_second: float = Field(..., description="초당 추가된 행 수")
+    errors: List[str] = Field(..., description="오류 목록")
+    result: UploadBooksData | None = Field(..., description="업로드 결과")
+    created_at: datetime = Field(..., description="작업 생성 시각")
+    started_at: datetime | None = Field(..., description="작업 시작 시각")
+    finished_at: datetime | None = Field(..., description="작업 종료 시각")
+
+
+class UploadJobResponse(BaseResponseModel):
+    job: UploadJobData = Field(..., description="업로드 작업 정보")
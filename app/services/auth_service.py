@@ -5,6 +5,7 @@ from fastapi import HTTPException, status
 from app.collections.user_collection import UserCollection
 from app.core import security
 from app.core.env import env
+from app.core.executor import ExecutorBusyError
 from app.schemas.user_schema import LoginRequest, Token
 
 
@@ -19,7 +20,17 @@ class AuthService:
                 detail="로그인 정보가 올바르지 않습니다.",
                 headers={"WWW-Authenticate": "Bearer"},
             )
-        if not security.verify_password(login_request.password, user.hashed_password):
+        try:
+            is_valid_password = await security.verify_password_async(
+                login_request.password, user.hashed_password
+            )
+        except ExecutorBusyError:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="로그인 요청이 많습니다. 잠시 후 다시 시도해주세요.",
+                headers={"Retry-After": "1"},
+            )
+        if not is_valid_password:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="로그인 정보가 올바르지 않습니다.",
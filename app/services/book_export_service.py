@@ -0,0 +1,89 @@
+import csv
+import io
+import os
+import tempfile
+from datetime import datetime
+from typing import Any, AsyncGenerator, List
+
+import openpyxl
+
+from app.collections.book_collection import BookCollection
+from app.collections.catalog_collection import CatalogCollection
+from app.core.enums import STORE_SPOT
+from app.core.executor import excel_export_executor
+from app.documents.book_document import BookDocument
+from app.services.book_service import BOOK_EXCEL_COLUMNS
+
+EXPORT_CHUNK_ROWS = 500
+
+
+class BookExportService:
+    @classmethod
+    def _to_row(cls, book: BookDocument) -> List[Any]:
+        # 업로드 양식과 같은 컬럼으로 내보내서 그대로 다시 업로드할 수 있게 함
+        row = []
+        for field in BOOK_EXCEL_COLUMNS.values():
+            value = getattr(book, field)
+            if isinstance(value, datetime):
+                value = value.strftime("%Y-%m-%d")
+            row.append(value)
+        return row
+
+    @classmethod
+    async def _iter_row_chunks(
+        cls, store_spot: STORE_SPOT
+    ) -> AsyncGenerator[List[List[Any]], None]:
+        catalog_version = await CatalogCollection.get_active_version(
+            store_spot=store_spot.value
+        )
+
+        rows: List[List[Any]] = []
+        async for book in BookCollection.iter_books_by_store_spot(
+            store_spot=store_spot.value, catalog_version=catalog_version
+        ):
+            rows.append(cls._to_row(book))
+            if len(rows) >= EXPORT_CHUNK_ROWS:
+                yield rows
+                rows = []
+
+        if rows:
+            yield rows
+
+    @classmethod
+    async def stream_csv(cls, store_spot: STORE_SPOT) -> AsyncGenerator[bytes, None]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        # 엑셀에서 한글이 깨지지 않도록 BOM 을 붙임
+        buffer.write("\ufeff")
+        writer.writerow(BOOK_EXCEL_COLUMNS.keys())
+
+        async for rows in cls._iter_row_chunks(store_spot=store_spot):
+            writer.writerows(rows)
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+
+        if buffer.tell():
+            yield buffer.getvalue().encode("utf-8")
+
+    @classmethod
+    async def export_xlsx(cls, store_spot: STORE_SPOT) -> str:
+        # write_only 모드는 행을 바로 임시 파일로 내보내므로 전체를 메모리에 두지 않음
+        workbook = openpyxl.Workbook(write_only=True)
+        worksheet = workbook.create_sheet(title=store_spot.value)
+        worksheet.append(list(BOOK_EXCEL_COLUMNS.keys()))
+
+        async for rows in cls._iter_row_chunks(store_spot=store_spot):
+            await excel_export_executor.run(cls._append_rows, worksheet, rows)
+
+        fd, file_path = tempfile.mkstemp(suffix=".xlsx")
+        os.close(fd)
+        await excel_export_executor.run(workbook.save, file_path)
+
+        return file_path
+
+    @classmethod
+    def _append_rows(cls, worksheet: Any, rows: List[List[Any]]) -> None:
+        for row in rows:
+            worksheet.append(row)
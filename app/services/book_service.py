@@ -1,20 +1,131 @@
-from typing import List
-from fastapi import UploadFile, HTTPException, status
-import os
-from datetime import datetime
-import io
+import asyncio
+import dataclasses
+import pickle
+from collections import Counter
+from contextlib import aclosing
+from datetime import datetime, timedelta, timezone
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Generator,
+    List,
+)
 import pandas as pd
+from bson import ObjectId
+from fastapi import HTTPException, status
+import os
 
-from app.core.enums import STORE_SPOT
-from app.schemas.book_schema import BookCreateModel
+from app.core.cache import CacheBackend, create_cache_backend
+from app.core.enums import STORE_SPOT, UPLOAD_MODE
+from app.core.env import env
+from app.core.executor import excel_executor, write_spool_record
+from app.core.single_flight import SingleFlight
+from app.schemas.book_schema import BookCreateModel, UploadBatchData, UploadBooksData
 from app.documents.book_document import BookDocument
 from app.collections.book_collection import BookCollection
+from app.collections.catalog_collection import CatalogCollection
+from app.services.search_engine_service import SearchEngineService
+from app.services.suggest_service import SuggestService
+from app.utils.book_util import BookUtil
+from app.utils.excel_util import ExcelFileError, ExcelUtil
+from app.utils.search_util import SearchUtil
+
+
+# 엑셀 컬럼명 -> 도서 필드
+BOOK_EXCEL_COLUMNS = {
+    "과목명": "subject_name",
+    "도서명(저자)": "book_title",
+    "출판사": "publisher",
+    "신청": "request_count",
+    "입고": "received_count",
+    "가격": "price",
+    "입고율": "fulfillment_rate",
+    "전공": "major",
+    "교수명": "professor_name",
+    "위치": "location",
+    "주문": "order_date",
+}
+
+BOOK_FIELDS = [
+    field.name for field in dataclasses.fields(BookDocument) if field.name != "_id"
+]
+
+BOOK_TEXT_FIELDS = [
+    "subject_name",
+    "book_title",
+    "publisher",
+    "major",
+    "professor_name",
+    "location",
+]
 
 
 class BookService:
+    _background_tasks: set[asyncio.Task] = set()
+    _search_cache: CacheBackend = create_cache_backend(
+        backend=env.SEARCH_CACHE_BACKEND,
+        namespace="book_search",
+        max_size=env.SEARCH_CACHE_MAX_SIZE,
+        ttl_seconds=env.SEARCH_CACHE_TTL_SECONDS,
+        redis_uri=env.REDIS_URI,
+        dumps=BookUtil.dumps_books,
+        loads=BookUtil.loads_books,
+    )
+    _search_flight = SingleFlight(name="book_search")
+
     @classmethod
-    async def insert_book(cls, book_data: BookCreateModel) -> str | None:
-        book_document = BookDocument(
+    def _run_in_background(cls, coroutine: Coroutine) -> None:
+        # 태스크가 GC 되지 않도록 완료될 때까지 참조를 유지
+        task = asyncio.create_task(coroutine)
+        cls._background_tasks.add(task)
+        task.add_done_callback(cls._background_tasks.discard)
+
+    @classmethod
+    async def _delete_catalog_version_later(
+        cls, store_spot: str, catalog_version: str | None
+    ) -> None:
+        # 다른 워커는 캐시된 카탈로그로 이전 버전을 검색할 수 있으므로 캐시가 만료된 뒤 삭제
+        await asyncio.sleep(env.CATALOG_CACHE_TTL_SECONDS)
+        await BookCollection.delete_books_by_catalog_version(
+            store_spot=store_spot, catalog_version=catalog_version
+        )
+
+    @classmethod
+    async def delete_stale_catalog_versions(cls) -> int:
+        """활성 버전이 아니고 만든 지 CATALOG_VERSION_GRACE_SECONDS 가 지난 버전의 문서를 삭제
+
+        교체 뒤 삭제 태스크가 실행되기 전에 워커가 재시작되었거나
+        적재 도중 종료된 업로드가 남긴 문서를 정리 (업로드 중인 버전은 grace 안에 있음)
+        """
+        stale_before = datetime.now(timezone.utc) - timedelta(
+            seconds=env.CATALOG_VERSION_GRACE_SECONDS
+        )
+        deleted_count = 0
+        for store_spot in STORE_SPOT:
+            catalog = await CatalogCollection.get_catalog(store_spot=store_spot.value)
+            active_version = catalog.active_version if catalog else None
+            for version in await BookCollection.select_catalog_versions(
+                store_spot=store_spot.value
+            ):
+                if version == active_version:
+                    continue
+                # 버전은 str(ObjectId()) 이므로 만든 시각을 ObjectId 에서 읽음 (None 은 버전 도입 전 문서)
+                if version is not None and (
+                    not ObjectId.is_valid(version)
+                    or ObjectId(version).generation_time >= stale_before
+                ):
+                    continue
+                deleted_count += await BookCollection.delete_books_by_catalog_version(
+                    store_spot=store_spot.value, catalog_version=version
+                )
+        return deleted_count
+
+    @classmethod
+    def _to_document(cls, book_data: BookCreateModel) -> BookDocument:
+        return BookDocument(
             store_spot=book_data.store_spot,
             subject_name=book_data.subject_name,
             book_title=book_data.book_title,
@@ -29,33 +140,217 @@ class BookService:
             location=book_data.location,
             order_date=book_data.order_date,
         )
-        inserted_id = await BookCollection.insert_book(document=book_document)
+
+    @classmethod
+    async def _invalidate_store(
+        cls, store_spot: str, bump_revision: bool = True, file_hash: str | None = None
+    ) -> None:
+        # 도서 목록이 바뀐 지점의 검색 캐시를 지우고 메모리 색인, 자동완성 색인 갱신을 요청
+        if bump_revision:
+            await CatalogCollection.bump_revision(
+                store_spot=store_spot, file_hash=file_hash
+            )
+        await cls._search_cache.delete_prefix(f"{store_spot}:")
+        SearchEngineService.request_reload(store_spot=store_spot)
+        SuggestService.request_reload(store_spot=store_spot)
+
+    @classmethod
+    def _next_book_chunk(
+        cls,
+        store_spot: STORE_SPOT,
+        rows: Generator[List[dict[str, Any]], None, None],
+        seen: Counter,
+    ) -> List[dict[str, Any]] | None:
+        chunk = next(rows, None)
+        if chunk is None:
+            return None
+
+        # 행마다 변환하지 않고 청크 전체를 컬럼 단위로 정리 (없는 컬럼은 None)
+        frame = (
+            pd.DataFrame(chunk, dtype=object)
+            .rename(columns=BOOK_EXCEL_COLUMNS)
+            .reindex(columns=list(BOOK_EXCEL_COLUMNS.values()))
+        )
+        frame = frame[frame["book_title"].notna()]
+        frame = frame.where(frame.notna(), None)
+
+        for field in BOOK_TEXT_FIELDS:
+            frame[field] = BookUtil.clean_text_column(frame[field])
+        frame["order_date"] = BookUtil.clean_date_column(
+            frame["order_date"], format="%Y-%m-%d"
+        )
+        frame = BookUtil.clean_stock_columns(frame)
+        frame["store_spot"] = store_spot.value
+        frame["author"] = None
+
+        # to_dict("records") 는 값마다 타입 변환을 거치므로 object 배열에서 바로 dict 생성
+        books = [
+            dict(zip(BOOK_FIELDS, values))
+            for values in frame[BOOK_FIELDS].to_numpy(dtype=object).tolist()
+        ]
+        BookUtil.add_diff_fields(books, seen)
+        # 초성/자모/n-gram 검색 필드도 자식 프로세스에서 계산 (삽입할 때 이벤트 루프를 막지 않도록)
+        for book in books:
+            book.update(
+                SearchUtil.document_fields(book["book_title"], book["subject_name"])
+            )
+        return books
+
+    @classmethod
+    async def insert_book(cls, book_data: BookCreateModel) -> str | None:
+        book_document = cls._to_document(book_data)
+        catalog_version = await CatalogCollection.get_active_version(
+            store_spot=book_data.store_spot.value
+        )
+        inserted_id = await BookCollection.insert_book(
+            document=book_document, catalog_version=catalog_version
+        )
+        if inserted_id:
+            await cls._invalidate_store(store_spot=book_data.store_spot.value)
 
         return inserted_id
 
     @classmethod
     async def delete_book_by_id(cls, book_id: str) -> bool:
-        return await BookCollection.delete_book_by_id(id=book_id)
+        deleted_book = await BookCollection.delete_book_by_id(id=book_id)
+        if deleted_book is None:
+            return False
+
+        await cls._invalidate_store(store_spot=deleted_book.store_spot.value)
+        return True
+
+    @classmethod
+    def _validate_page_params(cls, cursor: str | None, fields: List[str] | None):
+        if cursor is not None and not ObjectId.is_valid(cursor):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="cursor 값이 올바르지 않습니다.",
+            )
+
+        for field in fields or []:
+            if field not in BOOK_FIELDS:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"'{field}' 필드는 조회할 수 없습니다.",
+                )
+
+    @classmethod
+    def _to_page(
+        cls, books: List[BookDocument], limit: int | None
+    ) -> tuple[List[BookDocument], str | None]:
+        # limit + 1 개를 조회해서 다음 페이지가 있을 때만 next_cursor 를 반환
+        if limit is None or len(books) <= limit:
+            return books, None
+        return books[:limit], str(books[limit - 1].id)
 
     @classmethod
-    async def delete_books_by_store_spot(cls, store_spot: str) -> int:
-        return await BookCollection.delete_books_by_store_spot(store_spot=store_spot)
+    async def get_search_etag(cls, store_spot: STORE_SPOT) -> str:
+        # 도서 목록이 바뀔 때마다 바뀌는 (catalog_version, revision) 으로 만든 약한 ETag
+        state = None
+        if SearchEngineService.is_enabled():
+            # 메모리 엔진은 색인에 반영된 상태 기준 (응답 내용과 ETag 가 어긋나지 않도록)
+            state = SearchEngineService.catalog_state(store_spot=store_spot)
+        if state is None:
+            catalog = await CatalogCollection.get_cached_catalog(
+                store_spot=store_spot.value
+            )
+            state = (catalog.active_version, catalog.revision) if catalog else (None, 0)
+
+        catalog_version, revision = state
+        return f'W/"{store_spot.value}-{catalog_version or 0}-{revision}"'
 
     @classmethod
     async def select_books_by_title(
-        cls, book_title: str, store_spot: STORE_SPOT
-    ) -> List[BookDocument]:
-        books = await BookCollection.select_book_by_book_title(
-            book_title=book_title, store_spot=store_spot
+        cls,
+        book_title: str,
+        store_spot: STORE_SPOT,
+        limit: int | None = None,
+        cursor: str | None = None,
+        fields: List[str] | None = None,
+    ) -> tuple[List[BookDocument], str | None]:
+        cls._validate_page_params(cursor=cursor, fields=fields)
+        fetch_limit = limit + 1 if limit is not None else None
+
+        if SearchEngineService.is_enabled():
+            books = SearchEngineService.search(
+                store_spot=store_spot, book_title=book_title
+            )
+            if books is not None:
+                if cursor is not None:
+                    books = [book for book in books if book.id > ObjectId(cursor)]
+                if fields is not None:
+                    hidden = dict.fromkeys(set(BOOK_FIELDS) - set(fields), None)
+                    hidden.pop("store_spot", None)
+                    hidden.pop("book_title", None)
+                    books = [dataclasses.replace(book, **hidden) for book in books]
+                return cls._to_page(books[:fetch_limit], limit)
+
+        # 캐시 적중 때 DB 를 거치지 않도록 카탈로그도 캐시에서 조회 (다른 워커의 변경은 TTL 뒤 반영)
+        catalog = await CatalogCollection.get_cached_catalog(
+            store_spot=store_spot.value
         )
+        catalog_version = catalog.active_version if catalog else None
+        revision = catalog.revision if catalog else 0
 
-        return books
+        # 도서 목록이 바뀌면 revision 이 올라가므로 다른 워커의 캐시도 자연스럽게 무효화됨
+        cache_key = ":".join(
+            [
+                store_spot.value,
+                str(catalog_version),
+                str(revision),
+                str(limit),
+                str(cursor),
+                ",".join(fields) if fields is not None else "*",
+                SearchUtil.normalize(book_title),
+            ]
+        )
+        books = await cls._search_cache.get(cache_key)
+        if books is None:
+
+            async def select_and_cache() -> List[BookDocument]:
+                selected = await BookCollection.select_book_by_book_title(
+                    book_title=book_title,
+                    store_spot=store_spot,
+                    catalog_version=catalog_version,
+                    limit=fetch_limit,
+                    after_id=cursor,
+                    fields=fields,
+                )
+                await cls._search_cache.set(cache_key, selected)
+                return selected
+
+            # 같은 검색이 동시에 몰리면 (캐시가 채워지기 전) DB 조회 한 번의 결과를 공유
+            books = await cls._search_flight.run(cache_key, select_and_cache)
+
+        return cls._to_page(books, limit)
 
     @classmethod
-    async def insert_all_books_to_file(
-        cls, store_spot: STORE_SPOT, file: UploadFile
-    ) -> tuple[int, int, int]:
-        ext = os.path.splitext(file.filename)[1].lower()
+    async def stream_books_by_title(
+        cls, book_title: str, store_spot: STORE_SPOT
+    ) -> AsyncGenerator[BookDocument, None]:
+        if SearchEngineService.is_enabled():
+            books = SearchEngineService.search(
+                store_spot=store_spot, book_title=book_title
+            )
+            if books is not None:
+                for book in books:
+                    yield book
+                return
+
+        catalog = await CatalogCollection.get_cached_catalog(
+            store_spot=store_spot.value
+        )
+        catalog_version = catalog.active_version if catalog else None
+        async for book in BookCollection.iter_book_by_book_title(
+            book_title=book_title,
+            store_spot=store_spot,
+            catalog_version=catalog_version,
+        ):
+            yield book
+
+    @classmethod
+    def validate_excel_file_name(cls, file_name: str | None) -> str:
+        ext = os.path.splitext(file_name or "")[1].lower()
 
         if ext not in [".xls", ".xlsx", ".xlsm", ".xltm"]:
             raise HTTPException(
@@ -63,57 +358,249 @@ class BookService:
                 detail="엑셀 파일(.xlsx)만 업로드할 수 있습니다.",
             )
 
-        del_files = await BookService.delete_books_by_store_spot(
-            store_spot=store_spot.value
+        return ext
+
+    @classmethod
+    def _parse_book_chunks(
+        cls, store_spot: STORE_SPOT, file_path: str, spool_path: str
+    ) -> None:
+        # excel_executor 의 자식 프로세스에서 실행 (변환한 청크를 하나씩 spool 파일에 씀)
+        # 청크마다 따로 pickle 해서 부모가 한 청크씩 unpickle 하도록 함
+        with open(file_path, "rb") as file, open(spool_path, "ab") as spool:
+            rows = ExcelUtil.iter_row_chunks(
+                file=file,
+                chunk_size=env.BOOK_INSERT_BATCH_SIZE,
+                required_columns=["도서명(저자)"],
+            )
+            seen: Counter = Counter()
+            while (books := cls._next_book_chunk(store_spot, rows, seen)) is not None:
+                write_spool_record(
+                    spool, pickle.dumps(books, protocol=pickle.HIGHEST_PROTOCOL)
+                )
+
+    @classmethod
+    async def _iter_book_chunks(
+        cls, store_spot: STORE_SPOT, file_path: str
+    ) -> AsyncGenerator[List[dict[str, Any]], None]:
+        # 파싱과 행 변환은 별도 프로세스에서, DB 쓰기는 이벤트 루프에서 진행
+        # 자식 프로세스가 청크를 쓰는 대로 받아서 파일 전체를 메모리에 올리지 않음
+        chunks = excel_executor.stream(
+            cls._parse_book_chunks,
+            store_spot,
+            file_path,
+            spool_path=os.path.splitext(file_path)[0] + ".chunks",
         )
+        try:
+            async with aclosing(chunks):
+                async for chunk in chunks:
+                    yield pickle.loads(chunk)
+        except ExcelFileError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            )
+
+    @classmethod
+    async def insert_all_books_to_file(
+        cls,
+        store_spot: STORE_SPOT,
+        file_path: str,
+        mode: UPLOAD_MODE = UPLOAD_MODE.replace,
+        file_hash: str | None = None,
+        force: bool = False,
+        on_progress: Callable[[int, int, int], Awaitable[None]] | None = None,
+    ) -> UploadBooksData:
+        # 마지막으로 반영한 파일과 같으면 파싱/삽입 없이 종료 (최신 해시와 비교하도록 캐시 없이 조회)
+        catalog = await CatalogCollection.get_catalog(store_spot=store_spot.value)
+        if (
+            not force
+            and file_hash is not None
+            and catalog is not None
+            and catalog.file_hash == file_hash
+        ):
+            books_count = await BookCollection.count_books_by_catalog_version(
+                store_spot=store_spot.value, catalog_version=catalog.active_version
+            )
+            return UploadBooksData(
+                mode=mode,
+                skipped=True,
+                total_books_in_file=books_count,
+                deleted_books_count=0,
+                added_books_count=0,
+                unchanged_books_count=books_count,
+                failed_books_count=0,
+                batches=[],
+            )
 
-        contents = await file.read()
-        df = pd.read_excel(io.BytesIO(contents), engine="openpyxl")
-        df = df.astype(object).where(pd.notna(df), None)
+        if mode == UPLOAD_MODE.incremental:
+            return await cls._apply_books_diff_to_file(
+                store_spot=store_spot,
+                file_path=file_path,
+                file_hash=file_hash,
+                on_progress=on_progress,
+            )
+
+        # 새 버전으로 먼저 적재하고, 검증이 끝난 뒤에 활성 버전을 교체
+        catalog_version = str(ObjectId())
+        total_books_in_file = 0
+        batches: List[UploadBatchData] = []
+
+        try:
+            async with aclosing(cls._iter_book_chunks(store_spot, file_path)) as chunks:
+                async for books in chunks:
+                    total_books_in_file += len(books)
+
+                    for result in await BookCollection.insert_books(
+                        books=books,
+                        catalog_version=catalog_version,
+                        batch_size=env.BOOK_INSERT_BATCH_SIZE,
+                    ):
+                        batches.append(
+                            UploadBatchData(
+                                batch_index=len(batches),
+                                inserted_count=result.inserted_count,
+                                failed_count=result.failed_count,
+                                elapsed_ms=result.elapsed_ms,
+                            )
+                        )
+
+                    if on_progress is not None:
+                        await on_progress(
+                            total_books_in_file,
+                            sum(batch.inserted_count for batch in batches),
+                            sum(batch.failed_count for batch in batches),
+                        )
+        except BaseException:
+            # 적재 도중 실패하면 스테이징된 문서를 정리하고 기존 목록을 유지
+            await BookCollection.delete_books_by_catalog_version(
+                store_spot=store_spot.value, catalog_version=catalog_version
+            )
+            raise
 
-        if "도서명(저자)" not in df.columns:
+        added_books_count = sum(batch.inserted_count for batch in batches)
+
+        if added_books_count == 0:
+            await BookCollection.delete_books_by_catalog_version(
+                store_spot=store_spot.value, catalog_version=catalog_version
+            )
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="'도서명(저자)' 컬럼이 엑셀 파일에 존재하지 않습니다.",
+                detail="엑셀 파일에서 추가할 수 있는 도서를 찾지 못했습니다.",
             )
 
-        added_books_count = 0
-        total_books_in_file = len(df)
+        failed_books_count = sum(batch.failed_count for batch in batches)
+        # 실패한 행이 있으면 같은 파일로 다시 시도할 수 있도록 해시를 남기지 않음
+        previous_version = await CatalogCollection.swap_active_version(
+            store_spot=store_spot.value,
+            version=catalog_version,
+            file_hash=file_hash if failed_books_count == 0 else None,
+        )
+        await cls._invalidate_store(store_spot=store_spot.value, bump_revision=False)
+        deleted_books_count = await BookCollection.count_books_by_catalog_version(
+            store_spot=store_spot.value, catalog_version=previous_version
+        )
+        # 이전 버전 문서는 검색에서 제외되었으므로 백그라운드에서 정리
+        cls._run_in_background(
+            cls._delete_catalog_version_later(
+                store_spot=store_spot.value, catalog_version=previous_version
+            )
+        )
+
+        return UploadBooksData(
+            total_books_in_file=total_books_in_file,
+            deleted_books_count=deleted_books_count,
+            added_books_count=added_books_count,
+            failed_books_count=failed_books_count,
+            batches=batches,
+        )
 
-        for _, row in df.iterrows():
-            book_title: str = row["도서명(저자)"]
-            author = None
+    @classmethod
+    async def _apply_books_diff_to_file(
+        cls,
+        store_spot: STORE_SPOT,
+        file_path: str,
+        file_hash: str | None = None,
+        on_progress: Callable[[int, int, int], Awaitable[None]] | None = None,
+    ) -> UploadBooksData:
+        # 활성 버전의 문서와 row_key / content_hash 로 비교해서 바뀐 행만 반영
+        catalog_version = await CatalogCollection.get_active_version(
+            store_spot=store_spot.value
+        )
+        row_index = await BookCollection.get_row_index(
+            store_spot=store_spot.value, catalog_version=catalog_version
+        )
 
-            if book_title is None:
-                total_books_in_file -= 1
-                continue
+        total_books_in_file = 0
+        unchanged_books_count = 0
+        inserts: List[dict[str, Any]] = []
+        replacements: List[tuple[ObjectId, dict[str, Any]]] = []
 
-            order_date = row.get("주문")
-            try:
-                # order_date를 datetime으로 변환
-                if isinstance(order_date, str):
-                    order_date = datetime.strptime(order_date, "%Y-%m-%d")
-            except ValueError:
-                order_date = None
+        async with aclosing(cls._iter_book_chunks(store_spot, file_path)) as chunks:
+            async for books in chunks:
+                total_books_in_file += len(books)
 
-            book_data = BookCreateModel(
-                store_spot=store_spot,
-                subject_name=str(row.get("과목명")),
-                book_title=str(book_title),
-                author=str(author),
-                publisher=str(row.get("출판사")),
-                request_count=str(row.get("신청", "0")),
-                received_count=str(row.get("입고", "0")),
-                price=str(row.get("가격")),
-                fulfillment_rate=str(row.get("입고율")),
-                major=str(row.get("전공")),
-                professor_name=str(row.get("교수명")),
-                location=str(row.get("위치")),
-                order_date=order_date,
-            )
-
-            inserted_id = await BookService.insert_book(book_data=book_data)
-            if inserted_id:
-                added_books_count += 1
-
-        return total_books_in_file, added_books_count, del_files
+                for book in books:
+                    current = row_index.rows.pop(book["row_key"], None)
+                    if current is None:
+                        inserts.append(book)
+                    elif current[1] == book["content_hash"]:
+                        unchanged_books_count += 1
+                    else:
+                        replacements.append((current[0], book))
+
+                if on_progress is not None:
+                    await on_progress(total_books_in_file, 0, 0)
+
+        # 빈 파일로 전체 목록이 지워지지 않도록 막음
+        if total_books_in_file == 0:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="엑셀 파일에서 추가할 수 있는 도서를 찾지 못했습니다.",
+            )
+
+        # 파일에 없는 행과 중복 키 문서는 삭제
+        delete_ids = [id for id, _ in row_index.rows.values()]
+        delete_ids += row_index.duplicate_ids
+
+        result = await BookCollection.apply_books_diff(
+            inserts=inserts,
+            replacements=replacements,
+            delete_ids=delete_ids,
+            catalog_version=catalog_version,
+        )
+        # 실패한 행이 있으면 같은 파일로 다시 시도할 수 있도록 해시를 남기지 않음
+        if result.failed_count:
+            file_hash = None
+        if result.inserted_count or result.updated_count or result.removed_count:
+            await cls._invalidate_store(
+                store_spot=store_spot.value, file_hash=file_hash
+            )
+        else:
+            await CatalogCollection.set_file_hash(
+                store_spot=store_spot.value, file_hash=file_hash
+            )
+
+        if on_progress is not None:
+            await on_progress(
+                total_books_in_file,
+                result.inserted_count + result.updated_count,
+                result.failed_count,
+            )
+
+        return UploadBooksData(
+            mode=UPLOAD_MODE.incremental,
+            total_books_in_file=total_books_in_file,
+            deleted_books_count=result.removed_count,
+            added_books_count=result.inserted_count,
+            updated_books_count=result.updated_count,
+            unchanged_books_count=unchanged_books_count,
+            failed_books_count=result.failed_count,
+            batches=[
+                UploadBatchData(
+                    batch_index=0,
+                    inserted_count=result.inserted_count + result.updated_count,
+                    failed_count=result.failed_count,
+                    elapsed_ms=result.elapsed_ms,
+                )
+            ],
+        )
@@ -0,0 +1,79 @@
+from typing import List
+
+from app.collections.book_collection import BookCollection
+from app.core.enums import SEARCH_ENGINE, STORE_SPOT
+from app.core.env import env
+from app.core.executor import index_executor
+from app.core.index_refresher import StoreIndexRefresher
+from app.documents.book_document import BookDocument
+from app.utils.search_index import BookSearchIndex
+
+
+async def _build_index(
+    store_spot: str, catalog_version: str | None, revision: int
+) -> BookSearchIndex:
+    # 커서 배치마다 이벤트 루프에 양보하면서 도서를 읽고, 토큰 색인은 별도 프로세스에서 만듦
+    books = [
+        book
+        async for book in BookCollection.iter_books_by_store_spot(
+            store_spot=store_spot, catalog_version=catalog_version
+        )
+    ]
+    fields = await index_executor.run(
+        BookSearchIndex.build_fields, BookSearchIndex.field_values(books)
+    )
+    return BookSearchIndex(
+        books=books, catalog_version=catalog_version, revision=revision, fields=fields
+    )
+
+
+class SearchEngineService:
+    _refresher: StoreIndexRefresher[BookSearchIndex] = StoreIndexRefresher(
+        name="search engine",
+        build=_build_index,
+        refresh_seconds=env.SEARCH_ENGINE_REFRESH_SECONDS,
+    )
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return env.SEARCH_ENGINE == SEARCH_ENGINE.memory
+
+    @classmethod
+    def search(
+        cls, store_spot: STORE_SPOT, book_title: str
+    ) -> List[BookDocument] | None:
+        # 아직 색인이 없는 지점이면 None (호출하는 쪽에서 DB 로 조회)
+        index = cls._refresher.get(store_spot.value)
+        if index is None:
+            return None
+        return index.search(book_title)
+
+    @classmethod
+    def catalog_state(cls, store_spot: STORE_SPOT) -> tuple[str | None, int] | None:
+        # 색인에 반영된 (catalog_version, revision), 아직 색인이 없으면 None
+        index = cls._refresher.get(store_spot.value)
+        if index is None:
+            return None
+        return index.catalog_version, index.revision
+
+    @classmethod
+    def request_reload(cls, store_spot: str) -> None:
+        if not cls.is_enabled():
+            return
+        cls._refresher.request_reload(store_spot=store_spot)
+
+    @classmethod
+    async def refresh_changed_stores(cls) -> None:
+        if not cls.is_enabled():
+            return
+        await cls._refresher.refresh_changed_stores()
+
+    @classmethod
+    async def start(cls) -> None:
+        if not cls.is_enabled():
+            return
+        await cls._refresher.start()
+
+    @classmethod
+    async def stop(cls) -> None:
+        await cls._refresher.stop()
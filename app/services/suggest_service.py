@@ -0,0 +1,65 @@
+from typing import List
+
+from app.collections.book_collection import BookCollection
+from app.core.enums import STORE_SPOT
+from app.core.env import env
+from app.core.executor import index_executor
+from app.core.index_refresher import StoreIndexRefresher
+from app.utils.suggest_index import TitleSuggestIndex
+
+
+async def _build_index(
+    store_spot: str, catalog_version: str | None, revision: int
+) -> TitleSuggestIndex:
+    titles = await BookCollection.select_titles_by_store_spot(
+        store_spot=store_spot, catalog_version=catalog_version
+    )
+    # 키 정렬은 이벤트 루프를 막지 않도록 별도 프로세스에서 실행
+    return await index_executor.run(
+        TitleSuggestIndex,
+        titles=titles,
+        catalog_version=catalog_version,
+        revision=revision,
+    )
+
+
+class SuggestService:
+    _refresher: StoreIndexRefresher[TitleSuggestIndex] = StoreIndexRefresher(
+        name="suggest",
+        build=_build_index,
+        refresh_seconds=env.SUGGEST_REFRESH_SECONDS,
+    )
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return env.SUGGEST_ENABLED
+
+    @classmethod
+    def suggest(cls, store_spot: STORE_SPOT, query: str, limit: int) -> List[str]:
+        # 아직 색인이 없는 지점이면 빈 목록 (검색창 입력을 DB 조회로 막지 않음)
+        index = cls._refresher.get(store_spot.value)
+        if index is None:
+            return []
+        return index.suggest(query, limit)
+
+    @classmethod
+    def request_reload(cls, store_spot: str) -> None:
+        if not cls.is_enabled():
+            return
+        cls._refresher.request_reload(store_spot=store_spot)
+
+    @classmethod
+    async def refresh_changed_stores(cls) -> None:
+        if not cls.is_enabled():
+            return
+        await cls._refresher.refresh_changed_stores()
+
+    @classmethod
+    async def start(cls) -> None:
+        if not cls.is_enabled():
+            return
+        await cls._refresher.start()
+
+    @classmethod
+    async def stop(cls) -> None:
+        await cls._refresher.stop()
@@ -0,0 +1,331 @@
+import asyncio
+import dataclasses
+import glob
+import hashlib
+import logging
+import os
+from datetime import datetime, timedelta
+from typing import BinaryIO
+
+from bson import ObjectId
+from fastapi import HTTPException, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+
+from app.collections.upload_job_collection import UploadJobCollection
+from app.core.enums import STORE_SPOT, UPLOAD_JOB_STATUS, UPLOAD_JOB_STORE, UPLOAD_MODE
+from app.core.env import env
+from app.core.metrics import UPLOAD_BATCH_DURATION, UPLOAD_JOB_DURATION, UPLOAD_ROWS
+from app.documents.upload_job_document import UploadJobDocument
+from app.schemas.book_schema import UploadBooksData, UploadJobData
+from app.services.book_service import BookService
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+STALE_JOB_ERROR = "서버가 재시작되어 작업이 중단되었습니다. 다시 업로드해주세요."
+
+
+class UploadJobService:
+    _jobs: dict[str, UploadJobDocument] = {}
+    _queue: asyncio.Queue | None = None
+    _workers: list[asyncio.Task] = []
+    _monitor: asyncio.Task | None = None
+    # 작업을 대기열에 넣은 워커 프로세스 구분용 (start_workers 에서 생성)
+    _worker_id = ""
+
+    @classmethod
+    def _busy_error(cls) -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="처리 대기 중인 업로드가 많습니다. 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": str(env.UPLOAD_JOB_HEARTBEAT_SECONDS)},
+        )
+
+    @classmethod
+    async def _save_job(cls, job: UploadJobDocument) -> None:
+        job = dataclasses.replace(job, heartbeat_at=datetime.now())
+        if env.UPLOAD_JOB_STORE == UPLOAD_JOB_STORE.mongo:
+            await UploadJobCollection.save_job(document=job)
+        else:
+            cls._jobs[str(job.id)] = job
+
+    @classmethod
+    async def _get_job(cls, job_id: str) -> UploadJobDocument | None:
+        if env.UPLOAD_JOB_STORE == UPLOAD_JOB_STORE.mongo:
+            return await UploadJobCollection.get_job_by_id(id=job_id)
+        return cls._jobs.get(job_id)
+
+    @classmethod
+    def _to_data(cls, job: UploadJobDocument) -> UploadJobData:
+        rows_per_second = 0.0
+        if job.started_at is not None:
+            elapsed = (
+                (job.finished_at or datetime.now()) - job.started_at
+            ).total_seconds()
+            if elapsed > 0:
+                rows_per_second = job.rows_inserted / elapsed
+
+        return UploadJobData(
+            job_id=str(job.id),
+            store_spot=job.store_spot,
+            status=job.status,
+            mode=job.mode,
+            file_name=job.file_name,
+            file_hash=job.file_hash,
+            rows_parsed=job.rows_parsed,
+            rows_inserted=job.rows_inserted,
+            rows_failed=job.rows_failed,
+            rows_per_second=rows_per_second,
+            errors=job.errors,
+            result=UploadBooksData(**job.result) if job.result else None,
+            created_at=job.created_at,
+            started_at=job.started_at,
+            finished_at=job.finished_at,
+        )
+
+    @classmethod
+    async def get_job(cls, job_id: str) -> UploadJobData | None:
+        job = await cls._get_job(job_id)
+        if job is None:
+            return None
+        return cls._to_data(job)
+
+    @classmethod
+    async def create_job(
+        cls,
+        store_spot: STORE_SPOT,
+        file: UploadFile,
+        mode: UPLOAD_MODE = UPLOAD_MODE.replace,
+        force: bool = False,
+    ) -> UploadJobData:
+        if cls._queue is None:
+            raise RuntimeError("upload workers are not running")
+
+        ext = BookService.validate_excel_file_name(file.filename)
+        if cls._queue.full():
+            raise cls._busy_error()
+
+        job_id = ObjectId()
+
+        # 요청이 끝나면 UploadFile 이 닫히므로 작업용 파일로 옮겨 두면서 해시를 계산
+        file_path = os.path.join(env.UPLOAD_DIR, f"{job_id}{ext}")
+        file_hash = await run_in_threadpool(cls._copy_upload_file, file.file, file_path)
+
+        job = UploadJobDocument(
+            _id=job_id,
+            store_spot=store_spot,
+            status=UPLOAD_JOB_STATUS.queued,
+            mode=mode,
+            file_name=file.filename or "",
+            file_hash=file_hash,
+            force=force,
+            rows_parsed=0,
+            rows_inserted=0,
+            rows_failed=0,
+            errors=[],
+            result=None,
+            created_at=datetime.now(),
+            started_at=None,
+            finished_at=None,
+            worker_id=cls._worker_id,
+            heartbeat_at=None,
+        )
+
+        await cls._save_job(job)
+        try:
+            cls._queue.put_nowait((str(job.id), file_path))
+        except asyncio.QueueFull:
+            # 파일을 저장하는 동안 대기열이 찬 경우
+            await cls._save_job(
+                dataclasses.replace(
+                    job,
+                    status=UPLOAD_JOB_STATUS.failed,
+                    errors=["처리 대기 중인 업로드가 많아 작업을 등록하지 못했습니다."],
+                    finished_at=datetime.now(),
+                )
+            )
+            cls._remove_job_files(str(job.id))
+            raise cls._busy_error()
+
+        return cls._to_data(job)
+
+    @classmethod
+    def _copy_upload_file(cls, source: BinaryIO, file_path: str) -> str:
+        # 큰 파일 쓰기가 이벤트 루프를 막지 않도록 스레드에서 실행
+        os.makedirs(env.UPLOAD_DIR, exist_ok=True)
+        file_hash = hashlib.sha256()
+        with open(file_path, "wb") as f:
+            while chunk := source.read(UPLOAD_CHUNK_SIZE):
+                file_hash.update(chunk)
+                f.write(chunk)
+        return file_hash.hexdigest()
+
+    @classmethod
+    def _remove_job_files(cls, job_id: str) -> None:
+        for file_path in glob.glob(os.path.join(env.UPLOAD_DIR, f"{job_id}.*")):
+            os.remove(file_path)
+
+    @classmethod
+    async def _process_job(cls, job_id: str, file_path: str) -> None:
+        job = await cls._get_job(job_id)
+        if job is None:
+            return
+
+        job = dataclasses.replace(
+            job, status=UPLOAD_JOB_STATUS.running, started_at=datetime.now()
+        )
+        await cls._save_job(job)
+
+        async def on_progress(rows_parsed: int, rows_inserted: int, rows_failed: int):
+            nonlocal job
+            job = dataclasses.replace(
+                job,
+                rows_parsed=rows_parsed,
+                rows_inserted=rows_inserted,
+                rows_failed=rows_failed,
+            )
+            await cls._save_job(job)
+
+        try:
+            upload_data = await BookService.insert_all_books_to_file(
+                store_spot=job.store_spot,
+                file_path=file_path,
+                mode=job.mode,
+                file_hash=job.file_hash,
+                force=job.force,
+                on_progress=on_progress,
+            )
+            job = dataclasses.replace(
+                job,
+                status=UPLOAD_JOB_STATUS.succeeded,
+                rows_parsed=upload_data.total_books_in_file,
+                rows_inserted=upload_data.added_books_count,
+                rows_failed=upload_data.failed_books_count,
+                result=upload_data.model_dump(),
+            )
+        except HTTPException as e:
+            job = dataclasses.replace(
+                job, status=UPLOAD_JOB_STATUS.failed, errors=[str(e.detail)]
+            )
+        except Exception as e:
+            logger.exception("upload job %s failed", job_id)
+            job = dataclasses.replace(
+                job, status=UPLOAD_JOB_STATUS.failed, errors=[repr(e)]
+            )
+
+        job = dataclasses.replace(job, finished_at=datetime.now())
+        await cls._save_job(job)
+        cls._record_metrics(job)
+
+    @classmethod
+    def _record_metrics(cls, job: UploadJobDocument) -> None:
+        labels = {"store_spot": job.store_spot.value, "mode": job.mode.value}
+        UPLOAD_JOB_DURATION.labels(**labels, status=job.status.value).observe(
+            (job.finished_at - job.started_at).total_seconds()
+        )
+        if job.result is None:
+            return
+
+        result = UploadBooksData(**job.result)
+        for name, count in [
+            ("inserted", result.added_books_count),
+            ("updated", result.updated_books_count),
+            ("unchanged", result.unchanged_books_count),
+            ("deleted", result.deleted_books_count),
+            ("failed", result.failed_books_count),
+        ]:
+            UPLOAD_ROWS.labels(**labels, result=name).inc(count)
+        for batch in result.batches:
+            UPLOAD_BATCH_DURATION.labels(**labels).observe(batch.elapsed_ms / 1000)
+
+    @classmethod
+    async def _run_worker(cls) -> None:
+        while True:
+            job_id, file_path = await cls._queue.get()
+            try:
+                await cls._process_job(job_id, file_path)
+            except Exception:
+                logger.exception("upload job %s could not be saved", job_id)
+            finally:
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+                cls._queue.task_done()
+
+    @classmethod
+    async def _recover_jobs(cls) -> None:
+        now = datetime.now()
+        stale_before = now - timedelta(seconds=env.UPLOAD_JOB_STALE_SECONDS)
+
+        if env.UPLOAD_JOB_STORE == UPLOAD_JOB_STORE.mongo:
+            await UploadJobCollection.touch_jobs(
+                worker_id=cls._worker_id, heartbeat_at=now
+            )
+            for job_id in await UploadJobCollection.fail_stale_jobs(
+                stale_before=stale_before, error=STALE_JOB_ERROR
+            ):
+                logger.warning("upload job %s was interrupted", job_id)
+                cls._remove_job_files(job_id)
+        else:
+            # 메모리 저장소는 TTL 인덱스가 없으므로 오래된 작업을 직접 정리
+            expire_before = now - timedelta(seconds=env.UPLOAD_JOB_TTL_SECONDS)
+            cls._jobs = {
+                job_id: job
+                for job_id, job in cls._jobs.items()
+                if job.finished_at is None or job.finished_at >= expire_before
+            }
+
+        # 작업 기록이 없거나 이미 끝난 작업의 파일 (작업 등록 전에 종료된 경우 등) 정리
+        if not os.path.isdir(env.UPLOAD_DIR):
+            return
+        for file_name in os.listdir(env.UPLOAD_DIR):
+            file_path = os.path.join(env.UPLOAD_DIR, file_name)
+            try:
+                if os.path.getmtime(file_path) >= stale_before.timestamp():
+                    continue
+                job = await cls._get_job(os.path.splitext(file_name)[0])
+                if job is None or job.status not in (
+                    UPLOAD_JOB_STATUS.queued,
+                    UPLOAD_JOB_STATUS.running,
+                ):
+                    os.remove(file_path)
+            except FileNotFoundError:
+                # 확인하는 사이에 작업이 끝나서 지워진 파일
+                continue
+
+    @classmethod
+    async def _run_monitor(cls) -> None:
+        # 시작할 때 한 번, 이후 주기적으로 heartbeat 갱신과 중단된 작업/남은 도서 목록 버전 정리
+        while True:
+            try:
+                await cls._recover_jobs()
+            except Exception:
+                logger.exception("upload jobs could not be recovered")
+            try:
+                deleted_count = await BookService.delete_stale_catalog_versions()
+                if deleted_count:
+                    logger.info(
+                        "deleted %d books of stale catalog versions", deleted_count
+                    )
+            except Exception:
+                logger.exception("stale catalog versions could not be deleted")
+            await asyncio.sleep(env.UPLOAD_JOB_HEARTBEAT_SECONDS)
+
+    @classmethod
+    def start_workers(cls) -> None:
+        cls._worker_id = str(ObjectId())
+        cls._queue = asyncio.Queue(maxsize=env.UPLOAD_JOB_MAX_QUEUE)
+        cls._workers = [
+            asyncio.create_task(cls._run_worker())
+            for _ in range(env.UPLOAD_JOB_WORKERS)
+        ]
+        cls._monitor = asyncio.create_task(cls._run_monitor())
+
+    @classmethod
+    async def stop_workers(cls) -> None:
+        tasks = [*cls._workers, cls._monitor] if cls._monitor else cls._workers
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        cls._workers = []
+        cls._monitor = None
+        cls._queue = None
@@ -1,15 +1,169 @@
+import dataclasses
+import hashlib
+import math
 import re
+from collections import Counter
+from datetime import datetime
+from typing import Any, List
+
+import orjson
+import pandas as pd
+from bson import ObjectId
+
+from app.core.enums import STORE_SPOT
+from app.core.responses import dumps
+from app.documents.book_document import BookDocument
+from app.utils.search_util import SearchUtil
+
+# 엑셀/이전 문서에서 숫자로 정리하는 재고 필드
+INTEGER_FIELDS = ["request_count", "received_count", "price"]
+RATE_FIELD = "fulfillment_rate"
+
+# 증분 업로드에서 같은 도서로 보는 기준 필드와 내용 비교 필드
+ROW_KEY_FIELDS = ["book_title", "subject_name", "professor_name"]
+CONTENT_FIELDS = [
+    field.name for field in dataclasses.fields(BookDocument) if field.name != "_id"
+]
 
 
 class BookUtil:
     @classmethod
     def clean_integer_fields(cls, v) -> int:
+        if isinstance(v, bool):
+            return 0
+        if isinstance(v, int):
+            return v
+        if isinstance(v, float):
+            return int(v) if math.isfinite(v) else 0
         if isinstance(v, str):
-            # Extracts only digits from the string.
-            digits = re.sub(r"\D", "", v)
+            # Extracts only digits from the string. ("12.0" -> 12, "12,000원" -> 12000)
+            digits = re.sub(r"[^\d.]", "", v).split(".")[0]
             if digits:
                 try:
                     return int(digits)
                 except Exception:
                     return 0
         return 0
+
+    @classmethod
+    def clean_rate_field(cls, v) -> float | None:
+        # 숫자 셀은 엑셀 백분율 서식처럼 비율(0.85), "85%" 문자열은 100 으로 나눔
+        if isinstance(v, bool):
+            return None
+        if isinstance(v, (int, float)):
+            return float(v) if math.isfinite(v) else None
+        if isinstance(v, str):
+            number = re.sub(r"[^\d.]", "", v)
+            try:
+                rate = float(number)
+            except ValueError:
+                return None
+            return rate / 100 if "%" in v else rate
+        return None
+
+    @classmethod
+    def clean_integer_column(cls, column: pd.Series) -> pd.Series:
+        # clean_integer_fields 를 컬럼 단위로 적용
+        # 숫자 컬럼만 한 번에 변환하고, 값이 섞인 컬럼은 같은 함수로 변환해서 결과를 맞춤
+        if pd.api.types.is_bool_dtype(column):
+            return pd.Series(0, index=column.index, dtype="int64")
+        if pd.api.types.is_integer_dtype(column):
+            return column.astype("int64")
+        if pd.api.types.is_float_dtype(column):
+            # inf 는 int 로 바꿀 수 없으므로 NaN 과 같이 0
+            finite = column.where(column.abs() != math.inf)
+            return finite.fillna(0).astype("int64")
+        return column.map(cls.clean_integer_fields).astype("int64")
+
+    @classmethod
+    def clean_rate_column(cls, column: pd.Series) -> pd.Series:
+        # clean_rate_field 를 컬럼 단위로 적용 (값이 없으면 NaN)
+        numbers = pd.to_numeric(column, errors="coerce")
+        needs_parse = numbers.isna() & column.notna()
+        if needs_parse.any():
+            text = column[needs_parse].astype(str)
+            parsed = pd.to_numeric(
+                text.str.replace(r"[^\d.]", "", regex=True), errors="coerce"
+            )
+            percents = parsed.where(~text.str.contains("%", regex=False), parsed / 100)
+            numbers = numbers.fillna(percents)
+        return numbers.astype("float64")
+
+    @classmethod
+    def clean_text_column(cls, column: pd.Series) -> pd.Series:
+        # 값이 있으면 문자열로, 없으면 None
+        return column.astype(str).astype(object).where(column.notna(), None)
+
+    @classmethod
+    def clean_date_column(cls, column: pd.Series, format: str) -> pd.Series:
+        # datetime 셀은 그대로, format 에 맞는 문자열은 datetime 으로, 나머지는 None
+        dates = pd.to_datetime(column, errors="coerce", format=format)
+        datetimes = pd.Series(
+            dates.dt.to_pydatetime(), index=column.index, dtype=object
+        )
+        return datetimes.where(dates.notna(), None)
+
+    @classmethod
+    def clean_stock_columns(cls, frame: pd.DataFrame) -> pd.DataFrame:
+        # 재고 필드를 int/float 로 정리하고, 입고율이 없으면 입고 / 신청 으로 계산
+        frame = frame.copy()
+        for field in INTEGER_FIELDS:
+            frame[field] = cls.clean_integer_column(frame[field])
+
+        rate = cls.clean_rate_column(frame[RATE_FIELD])
+        requested = frame["request_count"].where(frame["request_count"] > 0)
+        rate = rate.fillna(frame["received_count"] / requested)
+        frame[RATE_FIELD] = rate.astype(object).where(rate.notna(), None)
+
+        return frame
+
+    @classmethod
+    def row_key(cls, book: dict[str, Any]) -> str:
+        return "\x1f".join(
+            SearchUtil.normalize(book.get(field)) for field in ROW_KEY_FIELDS
+        )
+
+    @classmethod
+    def content_hash(cls, book: dict[str, Any]) -> str:
+        content = orjson.dumps([book.get(field) for field in CONTENT_FIELDS])
+        return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+    @classmethod
+    def diff_fields(cls, book: dict[str, Any]) -> dict[str, Any]:
+        return {"row_key": cls.row_key(book), "content_hash": cls.content_hash(book)}
+
+    @classmethod
+    def add_diff_fields(cls, books: List[dict[str, Any]], seen: Counter) -> None:
+        # 같은 키가 여러 번 나오면 등장 순서로 구분 (두 번째부터 "#1", "#2" ...)
+        # seen 은 파일 전체에서 키별 등장 횟수 (청크를 넘어 이어짐)
+        for book in books:
+            row_key = cls.row_key(book)
+            occurrence = seen[row_key]
+            seen[row_key] += 1
+
+            book["row_key"] = f"{row_key}#{occurrence}" if occurrence else row_key
+            book["content_hash"] = cls.content_hash(book)
+
+    @classmethod
+    def dumps_books(cls, books: List[BookDocument]) -> bytes:
+        # 공유 캐시(redis) 에 저장할 JSON
+        return dumps(books)
+
+    @classmethod
+    def loads_books(cls, data: bytes) -> List[BookDocument]:
+        books = []
+        for book in orjson.loads(data):
+            order_date = book["order_date"]
+            books.append(
+                BookDocument(
+                    **{
+                        **book,
+                        "_id": ObjectId(book["_id"]),
+                        "store_spot": STORE_SPOT(book["store_spot"]),
+                        "order_date": datetime.fromisoformat(order_date)
+                        if order_date
+                        else None,
+                    }
+                )
+            )
+        return books
@@ -0,0 +1,54 @@
+import zipfile
+from typing import Any, BinaryIO, Generator, List
+
+import openpyxl
+from openpyxl.utils.exceptions import InvalidFileException
+
+
+class ExcelFileError(ValueError):
+    pass
+
+
+class MissingColumnError(ExcelFileError):
+    def __init__(self, column: str):
+        super().__init__(f"'{column}' 컬럼이 엑셀 파일에 존재하지 않습니다.")
+        self.column = column
+
+    def __reduce__(self):
+        # 파싱 프로세스에서 넘어올 때 메시지가 아닌 컬럼명으로 다시 생성
+        return type(self), (self.column,)
+
+
+class ExcelUtil:
+    @classmethod
+    def iter_row_chunks(
+        cls, file: BinaryIO, chunk_size: int, required_columns: List[str]
+    ) -> Generator[List[dict[str, Any]], None, None]:
+        # read_only 모드로 행을 하나씩 읽어 chunk_size 단위로 반환 (파일 전체를 메모리에 올리지 않음)
+        try:
+            workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
+        except (InvalidFileException, zipfile.BadZipFile) as e:
+            raise ExcelFileError("엑셀 파일을 읽을 수 없습니다.") from e
+
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            columns = list(next(rows, ()))
+
+            for column in required_columns:
+                if column not in columns:
+                    raise MissingColumnError(column)
+
+            chunk: List[dict[str, Any]] = []
+            for row in rows:
+                if all(value is None for value in row):
+                    continue
+
+                chunk.append(dict(zip(columns, row)))
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+
+            if chunk:
+                yield chunk
+        finally:
+            workbook.close()
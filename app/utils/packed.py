@@ -0,0 +1,53 @@
+from array import array
+from bisect import bisect_left
+from typing import Iterable, List
+
+
+class PackedStrings:
+    """문자열 목록을 이어 붙인 문자열 하나와 시작 위치 배열로 저장
+
+    문자열 객체 수만큼 pickle/unpickle 하지 않으므로 다른 프로세스에서 만든 색인을 빠르게 넘겨받음
+    """
+
+    def __init__(self, values: Iterable[str]):
+        parts: List[str] = []
+        self._offsets = array("q", [0])
+        for value in values:
+            parts.append(value)
+            self._offsets.append(self._offsets[-1] + len(value))
+        self._text = "".join(parts)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, position: int) -> str:
+        return self._text[self._offsets[position] : self._offsets[position + 1]]
+
+    def containing(self, positions: Iterable[int], value: str) -> List[int]:
+        # value 를 포함하는 위치만 반환 (위치마다 문자열을 잘라 만들지 않고 범위 안에서 찾음)
+        text, offsets = self._text, self._offsets
+        return [
+            position
+            for position in positions
+            if text.find(value, offsets[position], offsets[position + 1]) >= 0
+        ]
+
+
+class PackedPostings:
+    """토큰 -> 위치 목록을 정렬된 토큰 배열과 위치 배열 하나로 저장"""
+
+    def __init__(self, postings: dict[str, List[int]]):
+        tokens = sorted(postings)
+        self._tokens = PackedStrings(tokens)
+        self._offsets = array("q", [0])
+        self._positions = array("I")
+        for token in tokens:
+            self._positions.extend(postings[token])
+            self._offsets.append(len(self._positions))
+
+    def get(self, token: str) -> array:
+        # 없는 토큰이면 빈 배열
+        index = bisect_left(self._tokens, token)
+        if index < len(self._tokens) and self._tokens[index] == token:
+            return self._positions[self._offsets[index] : self._offsets[index + 1]]
+        return array("I")
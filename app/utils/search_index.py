@@ -0,0 +1,94 @@
+from typing import List
+
+from app.documents.book_document import BookDocument
+from app.utils.packed import PackedPostings, PackedStrings
+from app.utils.search_util import SearchUtil
+
+# (검색 필드 형태, 도서 필드) -> (위치별 텍스트, 토큰 -> 위치 목록)
+SearchFields = dict[tuple[str, str], tuple[PackedStrings, PackedPostings]]
+
+
+class BookSearchIndex:
+    """한 지점의 도서 목록 전체를 메모리에 올린 n-gram 역색인
+
+    토큰 색인(fields)은 field_values 로 뽑은 값으로 별도 프로세스에서 build_fields 를 실행해
+    넘겨받을 수 있음 (주지 않으면 바로 만듦)
+    """
+
+    def __init__(
+        self,
+        books: List[BookDocument],
+        catalog_version: str | None,
+        revision: int,
+        fields: SearchFields | None = None,
+    ):
+        self.catalog_version = catalog_version
+        self.revision = revision
+        # 페이지네이션(_id 기준 keyset)과 같은 순서를 유지
+        self._books = self._sort_books(books)
+        if fields is None:
+            fields = self.build_fields(self.field_values(self._books))
+        self._fields = fields
+
+    @classmethod
+    def _sort_books(cls, books: List[BookDocument]) -> List[BookDocument]:
+        # ObjectId 비교보다 빠른 bytes 비교로 정렬 (순서는 같음)
+        return sorted(books, key=lambda book: book.id.binary)
+
+    @classmethod
+    def field_values(cls, books: List[BookDocument]) -> dict[str, List[str | None]]:
+        # build_fields 에 넘길 도서 필드 값 (_id 순서)
+        books = cls._sort_books(books)
+        return {
+            field: [getattr(book, field) for book in books]
+            for field in SearchUtil.HANGUL_SEARCH_FIELDS
+        }
+
+    @classmethod
+    def build_fields(cls, values: dict[str, List[str | None]]) -> SearchFields:
+        # 검색에 쓰는 조합만 색인 (일반 검색은 도서명, 초성/자모 검색은 도서명과 과목명)
+        fields: SearchFields = {}
+        fields[("search_title", "book_title")] = cls._build_field(
+            "search_title", values["book_title"]
+        )
+        for field in SearchUtil.HANGUL_SEARCH_FIELDS:
+            for form in ("search_chosung", "search_jamo"):
+                fields[(form, field)] = cls._build_field(form, values[field])
+        return fields
+
+    @classmethod
+    def _build_field(
+        cls, form: str, values: List[str | None]
+    ) -> tuple[PackedStrings, PackedPostings]:
+        texts = [
+            SearchUtil.to_form(form, SearchUtil.normalize(value)) for value in values
+        ]
+        postings: dict[str, List[int]] = {}
+        for position, text in enumerate(texts):
+            for token in SearchUtil.tokens(text):
+                postings.setdefault(token, []).append(position)
+        return PackedStrings(texts), PackedPostings(postings)
+
+    def __len__(self) -> int:
+        return len(self._books)
+
+    def search(self, query: str) -> List[BookDocument]:
+        query_form = SearchUtil.query_form(query)
+        if query_form is None:
+            return []
+
+        form, text = query_form
+        # 초성/자모 검색은 DB 검색과 같이 도서명과 과목명을 함께 검색
+        fields = ("book_title",)
+        if form != "search_title":
+            fields = SearchUtil.HANGUL_SEARCH_FIELDS
+
+        tokens = set(SearchUtil.ngrams(text, 2)) or {text}
+        matched: set[int] = set()
+        for field in fields:
+            texts, postings = self._fields[(form, field)]
+            # 부분 문자열이면 모든 토큰을 포함하므로 가장 짧은 위치 목록만 부분 문자열 일치로 확인
+            positions = min((postings.get(token) for token in tokens), key=len)
+            matched.update(texts.containing(positions, text))
+
+        return [self._books[position] for position in sorted(matched)]
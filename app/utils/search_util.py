@@ -0,0 +1,155 @@
+import re
+import unicodedata
+from typing import Any, List
+
+# 한글 음절(가~힣) = 0xAC00 + (초성 * 21 + 중성) * 28 + 종성
+HANGUL_BASE = 0xAC00
+HANGUL_SYLLABLES = 11172
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+# 겹모음/겹받침은 자판 입력 순서대로 나눠서 저장 (자모 검색어 "ㅎㅗ" 도 "회" 와 일치)
+JUNGSUNG = [
+    "ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅗㅏ", "ㅗㅐ",
+    "ㅗㅣ", "ㅛ", "ㅜ", "ㅜㅓ", "ㅜㅔ", "ㅜㅣ", "ㅠ", "ㅡ", "ㅡㅣ", "ㅣ",
+]  # fmt: skip
+JONGSUNG = [
+    "", "ㄱ", "ㄲ", "ㄱㅅ", "ㄴ", "ㄴㅈ", "ㄴㅎ", "ㄷ", "ㄹ", "ㄹㄱ",
+    "ㄹㅁ", "ㄹㅂ", "ㄹㅅ", "ㄹㅌ", "ㄹㅍ", "ㄹㅎ", "ㅁ", "ㅂ", "ㅂㅅ", "ㅅ",
+    "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+]  # fmt: skip
+COMPOUND_JAMO = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ",
+    "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ",
+    "ㅄ": "ㅂㅅ", "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ",
+    "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+}  # fmt: skip
+# 호환용 자모 (ㄱ~ㅣ), 자음 (ㄱ~ㅎ)
+JAMO_RANGE = ("ㄱ", "ㅣ")
+CONSONANT_RANGE = ("ㄱ", "ㅎ")
+
+# str.translate 로 한 번에 변환하도록 음절별 초성/자모 표를 미리 생성
+_CHOSUNG_TABLE = {
+    HANGUL_BASE + index: CHOSUNG[index // 588] for index in range(HANGUL_SYLLABLES)
+}
+_JAMO_TABLE = {
+    HANGUL_BASE + index: CHOSUNG[index // 588]
+    + JUNGSUNG[index % 588 // 28]
+    + JONGSUNG[index % 28]
+    for index in range(HANGUL_SYLLABLES)
+}
+_JAMO_TABLE.update({ord(jamo): split for jamo, split in COMPOUND_JAMO.items()})
+
+# 한 문서의 여러 필드를 검색 필드 하나에 저장할 때의 구분자 (필드 경계를 넘는 일치 방지)
+FIELD_SEPARATOR = "\x1f"
+
+
+class SearchUtil:
+    # search_tokens 배열에 들어가는 토큰 종류별 접두어
+    TITLE_PREFIX = "t:"
+    CHOSUNG_PREFIX = "c:"
+    JAMO_PREFIX = "j:"
+    # 초성/자모 검색은 도서명과 과목명을 함께 검색
+    HANGUL_SEARCH_FIELDS = ("book_title", "subject_name")
+
+    @classmethod
+    def normalize(cls, text: str | None) -> str:
+        # 대소문자와 공백을 무시하고 비교하기 위한 정규화 (NFC 로 한글 조합형 통일)
+        if not text:
+            return ""
+        return "".join(unicodedata.normalize("NFC", text).lower().split())
+
+    @classmethod
+    def ngrams(cls, text: str, n: int) -> List[str]:
+        return [text[i : i + n] for i in range(len(text) - n + 1)]
+
+    @classmethod
+    def tokens(cls, text: str) -> set[str]:
+        return set(text) | set(cls.ngrams(text, 2))
+
+    @classmethod
+    def has_hangul(cls, text: str) -> bool:
+        return any(
+            ord(char) - HANGUL_BASE in range(HANGUL_SYLLABLES)
+            or JAMO_RANGE[0] <= char <= JAMO_RANGE[1]
+            for char in text
+        )
+
+    @classmethod
+    def chosung(cls, text: str) -> str:
+        # "회계원리" -> "ㅎㄱㅇㄹ" (한글 음절이 아닌 문자는 그대로)
+        return text.translate(_CHOSUNG_TABLE)
+
+    @classmethod
+    def jamo(cls, text: str) -> str:
+        # "회계" -> "ㅎㅗㅣㄱㅖ" (입력 중인 "회계ㅇ" 도 부분 문자열로 일치)
+        return text.translate(_JAMO_TABLE)
+
+    @classmethod
+    def document_fields(
+        cls, book_title: str | None, subject_name: str | None = None
+    ) -> dict[str, Any]:
+        search_title = cls.normalize(book_title)
+        tokens = {cls.TITLE_PREFIX + token for token in cls.tokens(search_title)}
+
+        texts = [search_title, cls.normalize(subject_name)]
+        texts = [text for text in texts if cls.has_hangul(text)]
+        chosung = [cls.chosung(text) for text in texts]
+        jamo = [cls.jamo(text) for text in texts]
+        # 필드마다 따로 토큰을 만들어 필드 경계를 넘는 토큰이 생기지 않도록 함
+        for text in chosung:
+            tokens.update(cls.CHOSUNG_PREFIX + token for token in cls.tokens(text))
+        for text in jamo:
+            tokens.update(cls.JAMO_PREFIX + token for token in cls.tokens(text))
+
+        return {
+            "search_title": search_title,
+            "search_chosung": FIELD_SEPARATOR.join(chosung),
+            "search_jamo": FIELD_SEPARATOR.join(jamo),
+            "search_tokens": sorted(tokens),
+        }
+
+    @classmethod
+    def query_form(cls, query: str) -> tuple[str, str] | None:
+        """검색어 형태에 맞는 (검색 필드, 변환한 검색어)
+
+        - 자음만 입력: search_chosung ("ㅎㄱㅇㄹ")
+        - 자모가 섞인 입력: search_jamo ("회계ㅇ", "ㅎㅚ")
+        - 그 외: search_title
+        """
+        text = cls.normalize(query)
+        if not text:
+            return None
+
+        if all(CONSONANT_RANGE[0] <= char <= CONSONANT_RANGE[1] for char in text):
+            return "search_chosung", text
+        if any(JAMO_RANGE[0] <= char <= JAMO_RANGE[1] for char in text):
+            return "search_jamo", cls.jamo(text)
+        return "search_title", text
+
+    @classmethod
+    def to_form(cls, field: str, text: str) -> str:
+        # 정규화된 텍스트를 query_form 의 검색 필드 형태로 변환 (메모리 색인용)
+        if field == "search_chosung":
+            return cls.chosung(text) if cls.has_hangul(text) else ""
+        if field == "search_jamo":
+            return cls.jamo(text) if cls.has_hangul(text) else ""
+        return text
+
+    @classmethod
+    def query_filter(cls, query: str) -> dict[str, Any] | None:
+        form = cls.query_form(query)
+        if form is None:
+            return None
+
+        field, text = form
+        prefix = {
+            "search_title": cls.TITLE_PREFIX,
+            "search_chosung": cls.CHOSUNG_PREFIX,
+            "search_jamo": cls.JAMO_PREFIX,
+        }[field]
+
+        # 바이그램 인덱스로 후보를 좁힌 뒤 부분 문자열 일치로 최종 확인
+        tokens = cls.ngrams(text, 2) or [text]
+        return {
+            "search_tokens": {"$all": sorted({prefix + token for token in tokens})},
+            field: {"$regex": re.escape(text)},
+        }
@@ -0,0 +1,74 @@
+from array import array
+from bisect import bisect_left
+from typing import List
+
+from app.utils.packed import PackedStrings
+from app.utils.search_util import SearchUtil
+
+# 단어 앞에 붙은 괄호/기호는 키에서 제외 ("(김민수)" -> "김민수")
+KEY_STRIP_CHARS = "([{<\"'-·"
+
+
+class TitleSuggestIndex:
+    """한 지점의 도서명을 정렬된 키 배열에 올려 접두어로 찾는 자동완성 색인
+
+    도서명 전체, 각 단어부터 시작하는 부분, 초성, 자모 분해 형태를 키로 저장
+    (키와 도서명은 packed 배열로 저장해서 별도 프로세스에서 만들어 넘겨받음)
+    """
+
+    def __init__(self, titles: List[str], catalog_version: str | None, revision: int):
+        self.catalog_version = catalog_version
+        self.revision = revision
+
+        entries: set[tuple[str, str]] = set()
+        for title in titles:
+            if not title:
+                continue
+            words = title.split()
+            for start in range(len(words)):
+                key = SearchUtil.normalize(" ".join(words[start:]))
+                key = key.lstrip(KEY_STRIP_CHARS)
+                if key:
+                    entries.add((key, title))
+
+            text = SearchUtil.normalize(title)
+            if SearchUtil.has_hangul(text):
+                entries.add((SearchUtil.chosung(text), title))
+                entries.add((SearchUtil.jamo(text), title))
+
+        # 키 순서대로 정렬해서 bisect 로 접두어 범위의 시작 위치를 찾음
+        sorted_entries = sorted(entries)
+        self._keys = PackedStrings(key for key, _ in sorted_entries)
+        # 키마다 도서명을 반복 저장하지 않도록 중복 없는 도서명 목록의 위치만 저장
+        unique_titles = sorted({title for _, title in sorted_entries})
+        title_positions = {
+            title: position for position, title in enumerate(unique_titles)
+        }
+        self._titles = PackedStrings(unique_titles)
+        self._title_positions = array(
+            "I", (title_positions[title] for _, title in sorted_entries)
+        )
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def suggest(self, query: str, limit: int) -> List[str]:
+        query_form = SearchUtil.query_form(query)
+        if query_form is None:
+            return []
+
+        # 초성만 입력하면 초성 키, 자모가 섞이면 자모 키와 비교
+        _, prefix = query_form
+        suggestions: List[str] = []
+        seen: set[str] = set()
+        # 접두어가 같은 키는 연속해 있으므로 limit 개를 채우면 바로 종료
+        for position in range(bisect_left(self._keys, prefix), len(self._keys)):
+            if not self._keys[position].startswith(prefix):
+                break
+            title = self._titles[self._title_positions[position]]
+            if title not in seen:
+                seen.add(title)
+                suggestions.append(title)
+                if len(suggestions) >= limit:
+                    break
+        return suggestions
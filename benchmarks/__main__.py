@@ -0,0 +1,147 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, List
+
+from benchmarks.environment import BENCHMARK_DB_NAME, configure, use_stand_in
+
+SCENARIO_NAMES = [
+    "parse",
+    "upload",
+    "search",
+    "search_filters",
+    "search_hangul",
+    "search_during_upload",
+    "suggest",
+    "login",
+    "serialize",
+]
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(item) for item in value.split(",") if item]
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="합성 교재 목록으로 검색/로그인/업로드 성능을 측정합니다.",
+    )
+    parser.add_argument(
+        "--mongo-uri",
+        default=None,
+        help="로컬 mongod 주소 (지정하지 않으면 프로세스 내 mongomock 사용)",
+    )
+    parser.add_argument("--db-name", default=BENCHMARK_DB_NAME)
+    parser.add_argument(
+        "--scenarios",
+        default=",".join(SCENARIO_NAMES),
+        help=f"쉼표로 구분한 시나리오 ({', '.join(SCENARIO_NAMES)})",
+    )
+    parser.add_argument(
+        "--sizes", type=_int_list, default=[1000, 5000, 20000], help="엑셀 행 수"
+    )
+    parser.add_argument("--catalog-size", type=int, default=2000, help="지점별 도서 수")
+    parser.add_argument("--requests", type=int, default=500, help="검색 요청 수")
+    parser.add_argument(
+        "--concurrency", type=int, default=16, help="동시 클라이언트 수"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path, default=None, help="결과 JSON 경로")
+    args = parser.parse_args()
+
+    unknown = set(args.scenarios.split(",")) - set(SCENARIO_NAMES)
+    if unknown:
+        parser.error(f"알 수 없는 시나리오: {', '.join(sorted(unknown))}")
+    return args
+
+
+def _git(*args: str) -> str | None:
+    try:
+        return subprocess.run(
+            ["git", *args], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def _run(args: argparse.Namespace) -> dict[str, Any]:
+    # app 모듈은 configure 로 환경 변수를 설정한 뒤에 import
+    from benchmarks.environment import running_app
+    from benchmarks.scenarios import SCENARIOS, BenchmarkContext, prepare
+
+    results: dict[str, Any] = {}
+    async with running_app() as client:
+        ctx = BenchmarkContext(
+            client=client,
+            sizes=args.sizes,
+            catalog_size=args.catalog_size,
+            requests=args.requests,
+            concurrency=args.concurrency,
+            seed=args.seed,
+        )
+        await prepare(ctx)
+
+        for name in args.scenarios.split(","):
+            print(f"[{name}] running", file=sys.stderr)
+            results[name] = await SCENARIOS[name](ctx)
+            print(
+                json.dumps({name: results[name]}, ensure_ascii=False), file=sys.stderr
+            )
+
+    return results
+
+
+def main() -> None:
+    args = _parse_args()
+    backend = configure(args.mongo_uri, args.db_name)
+    if backend == "mongomock":
+        use_stand_in()
+
+    results = asyncio.run(_run(args))
+
+    commit = _git("rev-parse", "--short", "HEAD")
+    timestamp = datetime.now(timezone.utc)
+    report = {
+        "meta": {
+            "commit": commit,
+            "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+            "timestamp": timestamp.isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            # 코어가 하나면 executor 로 옮긴 CPU 작업도 이벤트 루프와 CPU 를 나눠 씀
+            "cpu_count": os.cpu_count(),
+            "backend": backend,
+            "max_rss_mb": round(
+                resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1
+            ),
+            "params": {
+                "scenarios": args.scenarios.split(","),
+                "sizes": args.sizes,
+                "catalog_size": args.catalog_size,
+                "requests": args.requests,
+                "concurrency": args.concurrency,
+                "seed": args.seed,
+            },
+        },
+        "results": results,
+    }
+
+    output = args.output or RESULTS_DIR / (
+        f"{timestamp:%Y%m%dT%H%M%SZ}-{commit or 'unknown'}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2))
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+import argparse
+import json
+from pathlib import Path
+from typing import Any, Iterator
+
+# 값이 작을수록 좋은 지표 (나머지는 클수록 좋음)
+LOWER_IS_BETTER = ("_ms", "_s", "seconds", "_mb")
+
+
+def flatten(value: Any, prefix: str = "") -> Iterator[tuple[str, float]]:
+    if isinstance(value, dict):
+        for key, item in value.items():
+            yield from flatten(item, f"{prefix}.{key}" if prefix else key)
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        yield prefix, float(value)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.compare",
+        description="두 벤치마크 결과 JSON 의 수치를 비교합니다.",
+    )
+    parser.add_argument("old", type=Path)
+    parser.add_argument("new", type=Path)
+    parser.add_argument(
+        "--threshold", type=float, default=0.0, help="이 비율(%%) 이상 바뀐 값만 출력"
+    )
+    args = parser.parse_args()
+
+    old_report = json.loads(args.old.read_text())
+    new_report = json.loads(args.new.read_text())
+    old = dict(flatten(old_report["results"]))
+    new = dict(flatten(new_report["results"]))
+
+    print(
+        f"old: {old_report['meta'].get('commit')}  new: {new_report['meta'].get('commit')}"
+    )
+    for key in sorted(old.keys() & new.keys()):
+        before, after = old[key], new[key]
+        change = (after - before) / before * 100 if before else 0.0
+        if abs(change) < args.threshold:
+            continue
+        better = (change < 0) == key.endswith(LOWER_IS_BETTER)
+        marker = "" if change == 0 else ("+" if better else "-")
+        print(f"{key:<70} {before:>14.3f} {after:>14.3f} {change:>+8.1f}% {marker}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+import io
+import random
+from datetime import datetime, timedelta
+from typing import Any, List
+
+import openpyxl
+
+from app.core.enums import STORE_SPOT
+from app.services.book_service import BOOK_EXCEL_COLUMNS
+from app.utils.search_util import SearchUtil
+
+SUBJECTS = [
+    "회계원리",
+    "경영학원론",
+    "미시경제학",
+    "거시경제학",
+    "재무관리",
+    "마케팅원론",
+    "인적자원관리",
+    "일반화학",
+    "유기화학",
+    "일반물리학",
+    "선형대수학",
+    "미적분학",
+    "확률과통계",
+    "자료구조",
+    "운영체제",
+    "데이터베이스",
+    "컴퓨터네트워크",
+    "알고리즘",
+    "간호학개론",
+    "인체해부학",
+    "생리학",
+    "약리학",
+    "사회복지개론",
+    "교육학개론",
+    "심리학개론",
+    "행정학개론",
+    "법학개론",
+    "민법총칙",
+    "한국사의이해",
+    "대학영어",
+]
+TITLE_SUFFIXES = ["", " 입문", " 연습", " 이론과 실제", " 핵심정리", " 워크북"]
+EDITIONS = ["", " 제2판", " 제3판", " 제5판", " 개정판"]
+SURNAMES = ["김", "이", "박", "최", "정", "강", "조", "윤", "장", "임", "한", "오"]
+GIVEN_NAMES = ["민수", "서연", "지훈", "하은", "도윤", "수빈", "현우", "지민", "준서"]
+PUBLISHERS = [
+    "박영사",
+    "법문사",
+    "한빛아카데미",
+    "생능출판",
+    "교문사",
+    "수문사",
+    "학지사",
+]
+MAJORS = ["경영학과", "경제학과", "화학과", "물리학과", "컴퓨터공학과", "간호학과"]
+
+
+def _name(rng: random.Random) -> str:
+    return rng.choice(SURNAMES) + rng.choice(GIVEN_NAMES)
+
+
+def make_books(size: int, seed: int) -> List[dict[str, Any]]:
+    """엑셀 컬럼명을 키로 하는 가상의 교재 주문 목록"""
+    rng = random.Random(seed)
+    first_order = datetime(2025, 2, 1)
+    books = []
+
+    for index in range(size):
+        subject = rng.choice(SUBJECTS)
+        title = subject + rng.choice(TITLE_SUFFIXES) + rng.choice(EDITIONS)
+        request_count = rng.randint(0, 120)
+        received_count = rng.randint(0, request_count)
+        order_date = first_order + timedelta(days=rng.randint(0, 40))
+
+        books.append(
+            {
+                "과목명": subject,
+                "도서명(저자)": f"{title} ({_name(rng)})",
+                "출판사": rng.choice(PUBLISHERS),
+                "신청": request_count,
+                "입고": received_count,
+                "가격": f"{rng.randint(15, 45) * 1000:,}",
+                "입고율": f"{received_count * 100 // max(request_count, 1)}%",
+                "전공": rng.choice(MAJORS),
+                "교수명": _name(rng) + " 교수",
+                "위치": f"{rng.choice('ABCDEF')}-{index % 50 + 1}",
+                # 엑셀에서 날짜 셀과 문자열 셀이 섞여 있는 경우를 재현
+                "주문": order_date if index % 2 else order_date.strftime("%Y-%m-%d"),
+            }
+        )
+
+    return books
+
+
+def make_xlsx(books: List[dict[str, Any]]) -> bytes:
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    columns = list(BOOK_EXCEL_COLUMNS)
+    sheet.append(columns)
+    for book in books:
+        sheet.append([book.get(column) for column in columns])
+
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+def make_catalogs(size: int, seed: int) -> dict[STORE_SPOT, List[dict[str, Any]]]:
+    return {
+        store_spot: make_books(size, seed=seed + index)
+        for index, store_spot in enumerate(STORE_SPOT)
+    }
+
+
+def make_queries(
+    catalogs: dict[STORE_SPOT, List[dict[str, Any]]], count: int, seed: int
+) -> List[tuple[STORE_SPOT, str]]:
+    """과목명, 제목 일부, 저자명 등 실제 검색과 비슷한 (지점, 검색어) 목록"""
+    rng = random.Random(seed)
+    store_spots = list(catalogs)
+    queries = []
+
+    for _ in range(count):
+        store_spot = rng.choice(store_spots)
+        title = rng.choice(catalogs[store_spot])["도서명(저자)"]
+        kind = rng.random()
+        if kind < 0.4:
+            query = title.split(" ")[0]
+        elif kind < 0.8:
+            start = rng.randint(0, max(0, len(title) - 3))
+            query = title[start : start + rng.randint(2, 4)].strip() or title[:2]
+        else:
+            query = title[title.index("(") + 1 : -1]
+        queries.append((store_spot, query))
+
+    return queries
+
+
+def make_hangul_queries(
+    catalogs: dict[STORE_SPOT, List[dict[str, Any]]], count: int, seed: int
+) -> List[tuple[STORE_SPOT, str]]:
+    """초성 검색어("ㅎㄱㅇㄹ")와 입력 중인 검색어("회계ㅇ")를 반씩 섞은 목록"""
+    rng = random.Random(seed)
+    store_spots = list(catalogs)
+    queries = []
+
+    for index in range(count):
+        store_spot = rng.choice(store_spots)
+        subject = rng.choice(catalogs[store_spot])["과목명"]
+        if index % 2 == 0:
+            query = SearchUtil.chosung(subject[: rng.randint(2, 4)])
+        else:
+            length = rng.randint(1, len(subject) - 1)
+            query = subject[:length] + SearchUtil.chosung(subject[length])
+        queries.append((store_spot, query))
+
+    return queries
+
+
+def make_suggest_queries(
+    catalogs: dict[STORE_SPOT, List[dict[str, Any]]], count: int, seed: int
+) -> List[tuple[STORE_SPOT, str]]:
+    """검색창에 한 글자씩 입력하는 중인 (지점, 접두어) 목록 (초성 입력 포함)"""
+    rng = random.Random(seed)
+    store_spots = list(catalogs)
+    queries = []
+
+    for _ in range(count):
+        store_spot = rng.choice(store_spots)
+        title = rng.choice(catalogs[store_spot])["도서명(저자)"]
+        prefix = title[: rng.randint(1, 4)].strip() or title[0]
+        if rng.random() < 0.2:
+            prefix = SearchUtil.chosung(prefix)
+        queries.append((store_spot, prefix))
+
+    return queries
@@ -0,0 +1,64 @@
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import httpx
+
+BENCHMARK_DB_NAME = "benchmark"
+
+
+def configure(mongo_uri: str | None, db_name: str) -> str:
+    """app 을 import 하기 전에 벤치마크용 환경 변수를 설정하고 백엔드 이름을 반환"""
+    if db_name == "base":
+        raise ValueError("운영 데이터베이스(base)에는 벤치마크를 실행할 수 없습니다.")
+
+    os.environ["DB_URI"] = mongo_uri or "mongodb://localhost:27017"
+    os.environ["DB_NAME"] = db_name
+    os.environ.setdefault("MODE", "prod")
+    os.environ.setdefault("SECRET_KEY", "benchmark")
+    os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
+    os.environ.setdefault("UPLOAD_DIR", tempfile.mkdtemp(prefix="benchmark-uploads-"))
+    # 로그인 부하에서 503 이 나오는 지점을 보려면 PASSWORD_HASH_* 를 직접 지정
+    return "mongod" if mongo_uri else "mongomock"
+
+
+def use_stand_in() -> None:
+    """mongod 없이 실행할 때 Motor 클라이언트를 mongomock_motor 로 교체"""
+    import mongomock.collection
+    from mongomock_motor import AsyncMongoMockClient
+
+    from app.core import database
+
+    # mongomock 의 bulk UpdateOne/ReplaceOne 은 pymongo 4.x 의 sort 인자를 받지 못함
+    builder = mongomock.collection.BulkOperationBuilder
+    for name in ("add_update", "add_replace"):
+        original = getattr(builder, name)
+
+        def without_sort(self, *args, _original=original, sort=None, **kwargs):
+            return _original(self, *args, **kwargs)
+
+        setattr(builder, name, without_sort)
+
+    database.AsyncIOMotorClient = AsyncMongoMockClient
+
+
+@asynccontextmanager
+async def running_app() -> AsyncIterator[httpx.AsyncClient]:
+    """lifespan 을 실행한 app 에 ASGI 로 직접 요청하는 클라이언트"""
+    from app.core.database import Database
+    from app.core.env import env
+    from app.main import app
+
+    # 이전 실행에서 남은 데이터를 지우고 시작
+    await Database.connect()
+    await Database.client.drop_database(env.DB_NAME)
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://benchmark", timeout=None
+        ) as client:
+            yield client
+
+        await Database.client.drop_database(env.DB_NAME)
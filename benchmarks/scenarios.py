@@ -0,0 +1,861 @@
+import asyncio
+import dataclasses
+import io
+import json
+import os
+import pickle
+import random
+import re
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+from typing import Any, Awaitable, Callable, List
+
+import httpx
+import pandas as pd
+from bson import ObjectId
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+
+from app.collections.book_collection import BookCollection
+from app.collections.catalog_collection import CatalogCollection
+from app.collections.user_collection import UserCollection
+from app.core.enums import SEARCH_ENGINE, STORE_SPOT, UPLOAD_MODE
+from app.core.env import env
+from app.core.executor import BoundedExecutor, index_executor, password_executor
+from app.core.responses import ORJSONResponse
+from app.core.security import get_password_hash
+from app.documents.book_document import BookDocument
+from app.documents.user_document import UserDocument
+from app.routers.book_router import get_books_by_title
+from app.routers.book_router import router as book_router
+from app.schemas.book_schema import BookCreateModel, GetBooksResponse
+from app.services.book_service import BOOK_EXCEL_COLUMNS, BookService
+from app.services.search_engine_service import SearchEngineService
+from app.services.suggest_service import SuggestService
+from app.utils.book_util import BookUtil
+from app.utils.excel_util import ExcelUtil
+from app.utils.search_util import CHOSUNG, HANGUL_BASE, SearchUtil
+from app.utils.search_index import BookSearchIndex
+from app.utils.suggest_index import TitleSuggestIndex
+from benchmarks.data import (
+    make_books,
+    make_catalogs,
+    make_hangul_queries,
+    make_queries,
+    make_suggest_queries,
+    make_xlsx,
+)
+from benchmarks.stats import measure, run_load, summarize
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+BENCHMARK_USER_ID = "benchmark"
+BENCHMARK_PASSWORD = "benchmark-password"
+BENCHMARK_STORE_SPOT = STORE_SPOT.sch
+# 자동완성은 키 입력마다 호출되므로 p99 기준 예산
+SUGGEST_BUDGET_MS = 5.0
+
+
+@dataclasses.dataclass
+class BenchmarkContext:
+    client: httpx.AsyncClient
+    sizes: List[int]
+    catalog_size: int
+    requests: int
+    concurrency: int
+    seed: int
+    headers: dict[str, str] = dataclasses.field(default_factory=dict)
+    queries: List[tuple[STORE_SPOT, str]] = dataclasses.field(default_factory=list)
+    hangul_queries: List[tuple[STORE_SPOT, str]] = dataclasses.field(
+        default_factory=list
+    )
+    # 업로드 시나리오가 지점 도서 목록을 바꾸면 False 로 돌려서 다시 적재
+    catalogs_loaded: bool = False
+
+
+def _rows_per_s(rows: int, seconds: float) -> float:
+    return round(rows / seconds, 1) if seconds > 0 else 0.0
+
+
+async def prepare(ctx: BenchmarkContext) -> None:
+    """벤치마크용 관리자 계정을 만들고 인증 헤더를 준비"""
+    await UserCollection.insert_user(
+        UserDocument(
+            user_id=BENCHMARK_USER_ID,
+            hashed_password=get_password_hash(BENCHMARK_PASSWORD),
+            store_spot=BENCHMARK_STORE_SPOT,
+        )
+    )
+    response = await ctx.client.post("/auth/login", json=_login_body())
+    response.raise_for_status()
+    ctx.headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def _login_body() -> dict[str, str]:
+    return {
+        "user_id": BENCHMARK_USER_ID,
+        "password": BENCHMARK_PASSWORD,
+        "store_spot": BENCHMARK_STORE_SPOT.value,
+    }
+
+
+async def upload(
+    ctx: BenchmarkContext, store_spot: STORE_SPOT, data: bytes, **params: Any
+) -> tuple[dict[str, Any], float]:
+    """업로드 작업을 등록하고 끝날 때까지 기다린 뒤 (작업, 걸린 시간) 을 반환"""
+    started_at = time.perf_counter()
+    response = await ctx.client.post(
+        "/books/upload/excel",
+        params={"store_spot": store_spot.value, **params},
+        files={"file": ("benchmark.xlsx", data, XLSX_MEDIA_TYPE)},
+        headers=ctx.headers,
+    )
+    response.raise_for_status()
+    job_id = response.json()["job"]["job_id"]
+
+    while True:
+        await asyncio.sleep(0.05)
+        response = await ctx.client.get(
+            f"/books/upload/jobs/{job_id}", headers=ctx.headers
+        )
+        response.raise_for_status()
+        job = response.json()["job"]
+        if job["status"] in ("succeeded", "failed"):
+            return job, time.perf_counter() - started_at
+
+
+def _upload_summary(job: dict[str, Any], seconds: float, rows: int) -> dict[str, Any]:
+    result = job.get("result") or {}
+    return {
+        "status": job["status"],
+        "seconds": round(seconds, 4),
+        "rows_per_s": _rows_per_s(rows, seconds),
+        "skipped": result.get("skipped", False),
+        "added_books_count": result.get("added_books_count", 0),
+        "updated_books_count": result.get("updated_books_count", 0),
+        "unchanged_books_count": result.get("unchanged_books_count", 0),
+    }
+
+
+async def ensure_catalogs(ctx: BenchmarkContext) -> None:
+    """모든 지점에 catalog_size 권의 도서 목록을 적재하고 검색어를 생성"""
+    if ctx.catalogs_loaded:
+        return
+
+    catalogs = make_catalogs(ctx.catalog_size, ctx.seed)
+    for store_spot, books in catalogs.items():
+        job, _ = await upload(ctx, store_spot, make_xlsx(books), force="true")
+        if job["status"] != "succeeded":
+            raise RuntimeError(f"{store_spot.value} 도서 목록 적재 실패: {job}")
+
+    ctx.queries = make_queries(catalogs, ctx.requests, ctx.seed)
+    ctx.hangul_queries = make_hangul_queries(catalogs, ctx.requests, ctx.seed)
+    ctx.catalogs_loaded = True
+
+
+def _search_request(
+    ctx: BenchmarkContext,
+    queries: List[tuple[STORE_SPOT, str]] | None = None,
+    etags: dict[STORE_SPOT, str] | None = None,
+) -> Callable[[int], Awaitable[int]]:
+    queries = queries or ctx.queries
+
+    async def request(index: int) -> int:
+        store_spot, query = queries[index % len(queries)]
+        # etags 를 주면 브라우저 재검증처럼 If-None-Match 를 보냄
+        headers = {"If-None-Match": etags[store_spot]} if etags else None
+        response = await ctx.client.get(
+            f"/books/search/{query}",
+            params={"store_spot": store_spot.value},
+            headers=headers,
+        )
+        return response.status_code
+
+    return request
+
+
+async def _search_load(
+    ctx: BenchmarkContext,
+    queries: List[tuple[STORE_SPOT, str]] | None = None,
+    etags: dict[STORE_SPOT, str] | None = None,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    cache = BookService._search_cache
+    hits, misses = cache.hits, cache.misses
+    coalesced = BookService._search_flight.coalesced
+    result = await run_load(
+        _search_request(ctx, queries, etags),
+        ctx.requests,
+        ctx.concurrency,
+        **kwargs,
+    )
+    result["cache_hits"] = cache.hits - hits
+    result["cache_misses"] = cache.misses - misses
+    result["coalesced"] = BookService._search_flight.coalesced - coalesced
+    return result
+
+
+def _convert_iterrows(
+    store_spot: STORE_SPOT, chunk: List[dict[str, Any]]
+) -> List[BookDocument]:
+    # 처음 코드의 변환 (DataFrame.iterrows -> 문자열로 바꾼 값으로 BookCreateModel)
+    df = pd.DataFrame(chunk)
+    df = df.astype(object).where(pd.notna(df), None)
+    documents = []
+    for _, row in df.iterrows():
+        book_title = row["도서명(저자)"]
+        if book_title is None:
+            continue
+
+        order_date = row.get("주문")
+        try:
+            if isinstance(order_date, str):
+                order_date = datetime.strptime(order_date, "%Y-%m-%d")
+        except ValueError:
+            order_date = None
+
+        book_data = BookCreateModel(
+            store_spot=store_spot,
+            subject_name=str(row.get("과목명")),
+            book_title=str(book_title),
+            author=str(None),
+            publisher=str(row.get("출판사")),
+            request_count=str(row.get("신청", "0")),
+            received_count=str(row.get("입고", "0")),
+            price=str(row.get("가격")),
+            fulfillment_rate=str(row.get("입고율")),
+            major=str(row.get("전공")),
+            professor_name=str(row.get("교수명")),
+            location=str(row.get("위치")),
+            order_date=order_date,
+        )
+        document = BookService._to_document(book_data)
+        # 현재 변환처럼 검색 필드까지 계산 (이전 코드는 삽입할 때 이벤트 루프에서 계산)
+        SearchUtil.document_fields(document.book_title, document.subject_name)
+        documents.append(document)
+    return documents
+
+
+def _convert_per_row(
+    store_spot: STORE_SPOT, chunk: List[dict[str, Any]]
+) -> List[BookDocument]:
+    # 열 단위 변환 직전의 코드 (재고 필드만 DataFrame 으로 정리하고 행마다 BookCreateModel)
+    frame = (
+        pd.DataFrame(chunk, dtype=object)
+        .rename(columns=BOOK_EXCEL_COLUMNS)
+        .reindex(columns=list(BOOK_EXCEL_COLUMNS.values()))
+    )
+    frame = frame.where(frame.notna(), None)
+    frame = BookUtil.clean_stock_columns(frame)
+
+    documents = []
+    for row in frame.to_dict("records"):
+        book_title = row.get("book_title")
+        if book_title is None:
+            continue
+
+        order_date = row.get("order_date")
+        try:
+            if isinstance(order_date, str):
+                order_date = datetime.strptime(order_date, "%Y-%m-%d")
+        except ValueError:
+            order_date = None
+
+        book_data = BookCreateModel(
+            store_spot=store_spot,
+            subject_name=str(row.get("subject_name")),
+            book_title=str(book_title),
+            author=str(None),
+            publisher=str(row.get("publisher")),
+            request_count=row["request_count"],
+            received_count=row["received_count"],
+            price=row["price"],
+            fulfillment_rate=row["fulfillment_rate"],
+            major=str(row.get("major")),
+            professor_name=str(row.get("professor_name")),
+            location=str(row.get("location")),
+            order_date=order_date,
+        )
+        document = BookService._to_document(book_data)
+        # 현재 변환처럼 검색 필드까지 계산 (이전 코드는 삽입할 때 이벤트 루프에서 계산)
+        SearchUtil.document_fields(document.book_title, document.subject_name)
+        documents.append(document)
+    return documents
+
+
+def _traced(func: Callable[[], int]) -> dict[str, Any]:
+    """func 의 실행 시간과 tracemalloc 기준 최대 메모리 사용량"""
+    started_at = time.perf_counter()
+    rows = func()
+    seconds = time.perf_counter() - started_at
+
+    # tracemalloc 은 실행 속도를 떨어뜨리므로 메모리는 한 번 더 실행해서 측정
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "rows": rows,
+        "seconds": round(seconds, 4),
+        "rows_per_s": _rows_per_s(rows, seconds),
+        "peak_mb": round(peak / 1024 / 1024, 2),
+    }
+
+
+async def _loop_lag(awaitable: Awaitable[Any]) -> dict[str, Any]:
+    """awaitable 을 기다리는 동안 이벤트 루프가 1ms 타이머를 늦게 깨운 시간"""
+    lags: List[float] = []
+    done = asyncio.Event()
+
+    async def tick() -> None:
+        while not done.is_set():
+            started_at = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lags.append(time.perf_counter() - started_at - 0.001)
+
+    ticker = asyncio.create_task(tick())
+    started_at = time.perf_counter()
+    try:
+        await awaitable
+    finally:
+        done.set()
+        await ticker
+    result = summarize(lags, time.perf_counter() - started_at)
+    return {
+        "seconds": result["elapsed_s"],
+        "lag_p99_ms": result["p99_ms"],
+        "lag_max_ms": result["max_ms"],
+    }
+
+
+async def _consume_chunks(file_path: str) -> tuple[int, float]:
+    """업로드와 같이 청크마다 이벤트 루프에 양보하면서 소비 (행 수, 첫 청크까지 걸린 시간)"""
+    rows = 0
+    first_chunk_s = 0.0
+    started_at = time.perf_counter()
+    async for books in BookService._iter_book_chunks(STORE_SPOT.sch, file_path):
+        if not rows:
+            first_chunk_s = time.perf_counter() - started_at
+        rows += len(books)
+        await asyncio.sleep(0)
+    return rows, first_chunk_s
+
+
+async def _process_pipeline(data: bytes) -> dict[str, Any]:
+    """업로드 경로 (excel_executor 자식 프로세스 -> spool 파일 -> 청크 단위 소비)
+
+    - loop_lag: 스레드에서 같은 파싱/변환을 할 때와 비교한 이벤트 루프 지연
+    - parent_peak_mb: 부모 프로세스 (웹 워커) 의 tracemalloc 최대 메모리
+    """
+    fd, file_path = tempfile.mkstemp(suffix=".xlsx")
+    thread_executor = BoundedExecutor("parse-thread", 1)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        # 자식 프로세스 시작 비용이 측정에 섞이지 않도록 미리 한 번 실행
+        await _consume_chunks(file_path)
+
+        started_at = time.perf_counter()
+        rows, first_chunk_s = await _consume_chunks(file_path)
+        seconds = time.perf_counter() - started_at
+
+        tracemalloc.start()
+        try:
+            await _consume_chunks(file_path)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        async def in_thread() -> None:
+            chunks = thread_executor.stream(
+                BookService._parse_book_chunks,
+                STORE_SPOT.sch,
+                file_path,
+                spool_path=file_path + ".thread.chunks",
+            )
+            async for chunk in chunks:
+                pickle.loads(chunk)
+                await asyncio.sleep(0)
+
+        return {
+            "rows": rows,
+            "seconds": round(seconds, 4),
+            "rows_per_s": _rows_per_s(rows, seconds),
+            "first_chunk_s": round(first_chunk_s, 4),
+            "parent_peak_mb": round(peak / 1024 / 1024, 2),
+            "loop_lag": {
+                "thread": await _loop_lag(in_thread()),
+                "process": await _loop_lag(_consume_chunks(file_path)),
+            },
+        }
+    finally:
+        thread_executor.shutdown()
+        os.remove(file_path)
+
+
+async def parse(ctx: BenchmarkContext) -> dict[str, Any]:
+    """스트리밍 파싱과 pd.read_excel 비교, 행 단위와 컬럼 단위 변환 비교, 업로드 파싱 경로
+
+    streaming_parse 는 자식 프로세스가 하는 일 (파싱과 변환) 을 현재 프로세스에서 측정
+    """
+    results = {}
+    for size in ctx.sizes:
+        data = make_xlsx(make_books(size, ctx.seed))
+
+        def stream() -> int:
+            rows = ExcelUtil.iter_row_chunks(
+                file=io.BytesIO(data),
+                chunk_size=env.BOOK_INSERT_BATCH_SIZE,
+                required_columns=["도서명(저자)"],
+            )
+            seen: Counter = Counter()
+            count = 0
+            while (
+                books := BookService._next_book_chunk(STORE_SPOT.sch, rows, seen)
+            ) is not None:
+                count += len(books)
+            return count
+
+        def read_excel() -> int:
+            return len(pd.read_excel(io.BytesIO(data), engine="openpyxl"))
+
+        # 변환 비용만 비교하도록 파싱이 끝난 청크를 재사용
+        chunks = list(
+            ExcelUtil.iter_row_chunks(
+                file=io.BytesIO(data),
+                chunk_size=env.BOOK_INSERT_BATCH_SIZE,
+                required_columns=["도서명(저자)"],
+            )
+        )
+
+        def iterrows() -> int:
+            return sum(
+                len(_convert_iterrows(STORE_SPOT.sch, chunk)) for chunk in chunks
+            )
+
+        def per_row() -> int:
+            return sum(len(_convert_per_row(STORE_SPOT.sch, chunk)) for chunk in chunks)
+
+        def vectorized() -> int:
+            rows = iter(chunks)
+            seen: Counter = Counter()
+            count = 0
+            while (
+                books := BookService._next_book_chunk(STORE_SPOT.sch, rows, seen)
+            ) is not None:
+                count += len(books)
+            return count
+
+        results[str(size)] = {
+            "file_mb": round(len(data) / 1024 / 1024, 3),
+            "streaming_parse": _traced(stream),
+            "read_excel": _traced(read_excel),
+            "row_conversion": {
+                "iterrows": _traced(iterrows),
+                "per_row": _traced(per_row),
+                "vectorized": _traced(vectorized),
+            },
+            "process_pipeline": await _process_pipeline(data),
+        }
+    return results
+
+
+async def upload_books(ctx: BenchmarkContext) -> dict[str, Any]:
+    """전체 교체, 변경 없는 증분, 1% 변경 증분, 같은 파일 재업로드 처리 시간"""
+    results = {}
+    for size in ctx.sizes:
+        books = make_books(size, ctx.seed)
+        data = make_xlsx(books)
+
+        replace, replace_seconds = await upload(
+            ctx, BENCHMARK_STORE_SPOT, data, force="true"
+        )
+        unchanged, unchanged_seconds = await upload(
+            ctx,
+            BENCHMARK_STORE_SPOT,
+            data,
+            mode=UPLOAD_MODE.incremental.value,
+            force="true",
+        )
+
+        rng = random.Random(ctx.seed)
+        for book in rng.sample(books, max(1, size // 100)):
+            book["가격"] = f"{rng.randint(15, 45) * 1000 + 500:,}"
+        changed, changed_seconds = await upload(
+            ctx,
+            BENCHMARK_STORE_SPOT,
+            make_xlsx(books),
+            mode=UPLOAD_MODE.incremental.value,
+        )
+        duplicate, duplicate_seconds = await upload(
+            ctx,
+            BENCHMARK_STORE_SPOT,
+            make_xlsx(books),
+            mode=UPLOAD_MODE.incremental.value,
+        )
+
+        results[str(size)] = {
+            "replace": _upload_summary(replace, replace_seconds, size),
+            "incremental_unchanged": _upload_summary(
+                unchanged, unchanged_seconds, size
+            ),
+            "incremental_1pct_changed": _upload_summary(changed, changed_seconds, size),
+            "duplicate_skip": _upload_summary(duplicate, duplicate_seconds, size),
+        }
+
+    ctx.catalogs_loaded = False
+    return results
+
+
+async def search(ctx: BenchmarkContext) -> dict[str, Any]:
+    """mongo 검색(캐시 없음/캐시 적중/304 재검증/같은 검색어 집중)과 메모리 검색 엔진"""
+    await ensure_catalogs(ctx)
+    engine = env.SEARCH_ENGINE
+    results = {}
+
+    try:
+        env.SEARCH_ENGINE = SEARCH_ENGINE.mongo.value
+        await BookService._search_cache.delete_prefix("")
+        results["mongo"] = await _search_load(ctx)
+        results["mongo_cached"] = await _search_load(ctx)
+        etags = {
+            store_spot: await BookService.get_search_etag(store_spot=store_spot)
+            for store_spot in STORE_SPOT
+        }
+        results["mongo_not_modified"] = await _search_load(ctx, etags=etags)
+
+        # 같은 도서를 한꺼번에 검색하는 경우 (캐시가 비어 있을 때 동시 조회가 하나로 합쳐짐)
+        await BookService._search_cache.delete_prefix("")
+        results["mongo_burst"] = await _search_load(ctx, ctx.queries[:1])
+
+        env.SEARCH_ENGINE = SEARCH_ENGINE.memory.value
+        await SearchEngineService.start()
+        results["memory"] = await _search_load(ctx)
+        results["memory_reload_loop_lag"] = await _search_reload_loop_lag()
+    finally:
+        await SearchEngineService.stop()
+        env.SEARCH_ENGINE = engine
+
+    return results
+
+
+async def _search_reload_loop_lag() -> dict[str, Any]:
+    """한 지점의 메모리 색인을 다시 만드는 동안의 이벤트 루프 지연 (루프에서 만들 때와 비교)"""
+    store_spot = BENCHMARK_STORE_SPOT.value
+    catalog = await CatalogCollection.get_catalog(store_spot=store_spot)
+    catalog_version = catalog.active_version if catalog else None
+    books = await BookCollection.select_all_book_by_store_spot(
+        store_spot=store_spot, catalog_version=catalog_version
+    )
+
+    async def build_in_loop() -> BookSearchIndex:
+        # 지연 측정 타이머가 먼저 시작되도록 한 번 양보
+        await asyncio.sleep(0)
+        return BookSearchIndex(books=books, catalog_version=catalog_version, revision=0)
+
+    return {
+        "books": len(books),
+        "loop": await _loop_lag(build_in_loop()),
+        "process": await _loop_lag(
+            SearchEngineService._refresher.reload_store(store_spot=store_spot)
+        ),
+    }
+
+
+async def _filter_timings(
+    queries: List[tuple[STORE_SPOT, str]],
+    make_filter: Callable[[str], dict[str, Any] | None],
+) -> dict[str, Any]:
+    """검색어마다 make_filter 로 만든 조건을 DB 에 직접 조회한 시간"""
+    catalog_versions = {
+        catalog.store_spot: catalog.active_version
+        for catalog in await CatalogCollection.get_all_catalogs()
+    }
+    latencies = []
+    matched = 0
+    started_at = time.perf_counter()
+    for store_spot, query in queries:
+        query_filter = {
+            "store_spot": store_spot.value,
+            "catalog_version": catalog_versions.get(store_spot),
+            **(make_filter(query) or {}),
+        }
+        call_started_at = time.perf_counter()
+        documents = await BookCollection._collection.find(query_filter).to_list(
+            length=None
+        )
+        latencies.append(time.perf_counter() - call_started_at)
+        matched += len(documents)
+    return {
+        **summarize(latencies, time.perf_counter() - started_at),
+        "matched": matched,
+    }
+
+
+async def search_filters(ctx: BenchmarkContext) -> dict[str, Any]:
+    """대소문자 무시 정규식 필터와 바이그램 토큰 필터의 DB 조회 시간"""
+    await ensure_catalogs(ctx)
+    queries = ctx.queries[:200]
+
+    return {
+        "regex": await _filter_timings(
+            queries,
+            lambda query: {"book_title": {"$regex": re.escape(query), "$options": "i"}},
+        ),
+        "tokens": await _filter_timings(queries, SearchUtil.query_filter),
+    }
+
+
+def _chosung_regex_filter(query: str) -> dict[str, Any]:
+    # 색인 없이 초성 검색을 흉내 내는 방식: 자음마다 해당 초성 음절 범위의 문자 클래스
+    pattern = ""
+    for char in SearchUtil.normalize(query):
+        if char in CHOSUNG:
+            first = HANGUL_BASE + CHOSUNG.index(char) * 588
+            pattern += f"[{chr(first)}-{chr(first + 587)}]"
+        else:
+            pattern += re.escape(char)
+    return {
+        "$or": [
+            {"book_title": {"$regex": pattern}},
+            {"subject_name": {"$regex": pattern}},
+        ]
+    }
+
+
+async def search_hangul(ctx: BenchmarkContext) -> dict[str, Any]:
+    """초성/입력 중 검색어의 API 지연 시간, 초성 검색의 정규식 흉내와 색인 조회 비교"""
+    await ensure_catalogs(ctx)
+    await BookService._search_cache.delete_prefix("")
+    chosung_queries = [
+        (store_spot, query)
+        for store_spot, query in ctx.hangul_queries
+        if SearchUtil.query_form(query)[0] == "search_chosung"
+    ][:200]
+
+    return {
+        "api": await _search_load(ctx, ctx.hangul_queries),
+        "chosung_regex": await _filter_timings(chosung_queries, _chosung_regex_filter),
+        "chosung_tokens": await _filter_timings(
+            chosung_queries, SearchUtil.query_filter
+        ),
+    }
+
+
+async def search_during_upload(ctx: BenchmarkContext) -> dict[str, Any]:
+    """가장 큰 엑셀 업로드가 진행되는 동안과 평소의 검색 지연 시간 비교"""
+    await ensure_catalogs(ctx)
+
+    # 적재한 도서 목록을 앞부분으로 포함하는 파일이라 기존 검색어가 그대로 유효
+    size = max(ctx.sizes)
+    seed = ctx.seed + list(STORE_SPOT).index(BENCHMARK_STORE_SPOT)
+    data = make_xlsx(make_books(max(size, ctx.catalog_size), seed))
+
+    await BookService._search_cache.delete_prefix("")
+    upload_task = asyncio.create_task(
+        upload(ctx, BENCHMARK_STORE_SPOT, data, force="true")
+    )
+    during = await _search_load(ctx, stop_when=upload_task.done)
+    job, seconds = await upload_task
+
+    # 같은 검색어 순서와 요청 수로 다시 측정해서 캐시 적중률을 맞춤
+    await BookService._search_cache.delete_prefix("")
+    idle = await run_load(_search_request(ctx), during["count"], ctx.concurrency)
+
+    ctx.catalogs_loaded = False
+    return {
+        "idle": idle,
+        "during_upload": during,
+        "upload": _upload_summary(job, seconds, size),
+    }
+
+
+async def suggest(ctx: BenchmarkContext) -> dict[str, Any]:
+    """자동완성 색인 생성 시간과 접두어 조회 지연 시간 (색인 직접 호출, API)
+
+    build_loop_lag: 색인을 이벤트 루프에서 만들 때와 색인 프로세스에서 만들 때의 루프 지연
+    """
+    results: dict[str, Any] = {"budget_ms": SUGGEST_BUDGET_MS}
+
+    for size in ctx.sizes:
+        books = make_books(size, ctx.seed)
+        titles = sorted({book["도서명(저자)"] for book in books})
+        started_at = time.perf_counter()
+        index = TitleSuggestIndex(titles=titles, catalog_version=None, revision=0)
+        build_seconds = time.perf_counter() - started_at
+
+        queries = [
+            query
+            for _, query in make_suggest_queries(
+                {BENCHMARK_STORE_SPOT: books}, 1000, ctx.seed
+            )
+        ]
+        latencies = []
+        for query in queries:
+            call_started_at = time.perf_counter()
+            index.suggest(query, env.SUGGEST_LIMIT)
+            latencies.append(time.perf_counter() - call_started_at)
+
+        lookup = summarize(latencies, sum(latencies))
+
+        async def build_in_loop() -> TitleSuggestIndex:
+            # 지연 측정 타이머가 먼저 시작되도록 한 번 양보
+            await asyncio.sleep(0)
+            return TitleSuggestIndex(titles=titles, catalog_version=None, revision=0)
+
+        results[str(size)] = {
+            "titles": len(titles),
+            "keys": len(index),
+            "build_s": round(build_seconds, 4),
+            "lookup": lookup,
+            "within_budget": lookup["p99_ms"] < SUGGEST_BUDGET_MS,
+            "build_loop_lag": {
+                "loop": await _loop_lag(build_in_loop()),
+                "process": await _loop_lag(
+                    index_executor.run(
+                        TitleSuggestIndex,
+                        titles=titles,
+                        catalog_version=None,
+                        revision=0,
+                    )
+                ),
+            },
+        }
+
+    await ensure_catalogs(ctx)
+    await SuggestService.refresh_changed_stores()
+    queries = make_suggest_queries(
+        make_catalogs(ctx.catalog_size, ctx.seed), ctx.requests, ctx.seed
+    )
+
+    async def request(index: int) -> int:
+        store_spot, query = queries[index % len(queries)]
+        response = await ctx.client.get(
+            "/books/suggest", params={"store_spot": store_spot.value, "q": query}
+        )
+        return response.status_code
+
+    api = await run_load(request, ctx.requests, ctx.concurrency)
+    api["within_budget"] = api["p99_ms"] < SUGGEST_BUDGET_MS
+    results["api"] = api
+    return results
+
+
+async def login(ctx: BenchmarkContext) -> dict[str, Any]:
+    """동시 로그인 처리 시간과 로그인이 몰리는 동안/평소의 검색 지연 시간 비교
+
+    비밀번호 검증 대기열이 차면 로그인은 503
+    """
+    await ensure_catalogs(ctx)
+    rejected = password_executor.rejected
+
+    async def request(index: int) -> int:
+        response = await ctx.client.post("/auth/login", json=_login_body())
+        return response.status_code
+
+    await BookService._search_cache.delete_prefix("")
+    login_task = asyncio.create_task(
+        run_load(request, max(ctx.requests // 5, 1), ctx.concurrency)
+    )
+    during = await _search_load(ctx, stop_when=login_task.done)
+    result = await login_task
+    result["rejected"] = password_executor.rejected - rejected
+
+    # 같은 검색어 순서와 요청 수로 다시 측정해서 캐시 적중률을 맞춤
+    await BookService._search_cache.delete_prefix("")
+    idle = await run_load(_search_request(ctx), during["count"], ctx.concurrency)
+
+    return {"login": result, "search_idle": idle, "search_during_login": during}
+
+
+def _search_response_field() -> Any:
+    for route in book_router.routes:
+        if isinstance(route, APIRoute) and route.endpoint is get_books_by_title:
+            return route.response_field
+    raise RuntimeError("검색 라우트를 찾을 수 없습니다.")
+
+
+async def serialize(ctx: BenchmarkContext) -> dict[str, Any]:
+    """검색 응답 생성: 이전 응답 경로와 orjson 직접 직렬화의 초당 문서 수
+
+    두 경로 모두 DB 문서를 BookDocument 로 변환하는 단계부터 측정
+    - response_model: GetBooksResponse 생성 후 FastAPI 가 응답 모델로 다시 검증하고
+      JSON 호환 값으로 바꾼 뒤 JSONResponse(json.dumps) 로 렌더링 (이전 검색 응답 경로)
+    - orjson: ORJSONResponse 로 dataclass 를 바로 직렬화 (현재 검색 응답 경로)
+    """
+    await ensure_catalogs(ctx)
+    catalog_version = await CatalogCollection.get_active_version(
+        store_spot=BENCHMARK_STORE_SPOT.value
+    )
+    catalog = await BookCollection._collection.find(
+        {"store_spot": BENCHMARK_STORE_SPOT.value, "catalog_version": catalog_version}
+    ).to_list(length=None)
+    response_field = _search_response_field()
+    repeat = 5
+
+    results = {}
+    for size in ctx.sizes:
+        # 지점 도서 목록을 반복해서 size 개의 DB 문서를 만듦
+        documents = [
+            {**catalog[index % len(catalog)], "_id": ObjectId()}
+            for index in range(size)
+        ]
+
+        def response_model() -> bytes:
+            # fastapi.routing.serialize_response 와 같은 순서
+            books = [BookCollection._parse(document) for document in documents]
+            content = GetBooksResponse(
+                detail="책을 성공적으로 찾았습니다.",
+                status_code=200,
+                books=books,
+                next_cursor=None,
+            )
+            value, errors = response_field.validate(content, {}, loc=("response",))
+            if errors:
+                raise RuntimeError(errors)
+            return JSONResponse(content=response_field.serialize(value)).body
+
+        def orjson() -> bytes:
+            books = [BookCollection._parse(document) for document in documents]
+            return ORJSONResponse(
+                content={
+                    "detail": "책을 성공적으로 찾았습니다.",
+                    "status_code": 200,
+                    "books": books,
+                    "next_cursor": None,
+                }
+            ).body
+
+        # 두 경로의 JSON 이 같은 값인지 먼저 확인
+        if json.loads(response_model()) != json.loads(orjson()):
+            raise RuntimeError("두 응답 경로의 JSON 이 다릅니다.")
+
+        size_results: dict[str, Any] = {}
+        for name, func in (("response_model", response_model), ("orjson", orjson)):
+            result = measure(func, repeat)
+            result["docs_per_s"] = _rows_per_s(size * repeat, result["elapsed_s"])
+            size_results[name] = result
+        size_results["speedup"] = round(
+            size_results["orjson"]["docs_per_s"]
+            / size_results["response_model"]["docs_per_s"],
+            2,
+        )
+        results[str(size)] = size_results
+    return results
+
+
+SCENARIOS: dict[str, Callable[[BenchmarkContext], Awaitable[dict[str, Any]]]] = {
+    "parse": parse,
+    "upload": upload_books,
+    "search": search,
+    "search_filters": search_filters,
+    "search_hangul": search_hangul,
+    "search_during_upload": search_during_upload,
+    "suggest": suggest,
+    "login": login,
+    "serialize": serialize,
+}
@@ -0,0 +1,80 @@
+import asyncio
+import itertools
+import time
+from collections import Counter
+from typing import Any, Awaitable, Callable, List
+
+
+def percentile(sorted_values: List[float], percent: float) -> float:
+    # nearest-rank 방식
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(percent / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(latencies: List[float], elapsed: float) -> dict[str, Any]:
+    """초 단위 지연 시간 목록을 ms 단위 p50/p95/p99 와 처리량으로 요약"""
+    values = sorted(latencies)
+    count = len(values)
+    return {
+        "count": count,
+        "elapsed_s": round(elapsed, 4),
+        "throughput_per_s": round(count / elapsed, 2) if elapsed > 0 else 0.0,
+        "mean_ms": round(sum(values) / count * 1000, 3) if count else 0.0,
+        "p50_ms": round(percentile(values, 50) * 1000, 3),
+        "p95_ms": round(percentile(values, 95) * 1000, 3),
+        "p99_ms": round(percentile(values, 99) * 1000, 3),
+        "max_ms": round(values[-1] * 1000, 3) if count else 0.0,
+    }
+
+
+async def run_load(
+    request: Callable[[int], Awaitable[int]],
+    total: int,
+    concurrency: int,
+    stop_when: Callable[[], bool] | None = None,
+) -> dict[str, Any]:
+    """concurrency 개의 클라이언트가 total 개의 요청을 나눠 보내고 결과를 요약
+
+    request 는 요청 순번을 받아 HTTP 상태 코드를 반환하는 코루틴 함수
+    stop_when 을 주면 total 대신 stop_when() 이 참이 될 때까지 요청
+    """
+    counter = itertools.count()
+    latencies: List[float] = []
+    status_codes: Counter = Counter()
+
+    def has_next(index: int) -> bool:
+        if stop_when is not None:
+            return not stop_when()
+        return index < total
+
+    async def client() -> None:
+        while has_next(index := next(counter)):
+            started_at = time.perf_counter()
+            status_code = await request(index)
+            latencies.append(time.perf_counter() - started_at)
+            status_codes[status_code] += 1
+            # mongomock 처럼 실제로 대기하지 않는 백엔드에서도 다른 태스크가 실행되도록 양보
+            await asyncio.sleep(0)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started_at
+
+    return {
+        **summarize(latencies, elapsed),
+        "concurrency": concurrency,
+        "status_codes": {str(code): count for code, count in status_codes.items()},
+    }
+
+
+def measure(func: Callable[[], Any], repeat: int) -> dict[str, Any]:
+    """동기 함수를 repeat 번 실행한 지연 시간 요약"""
+    latencies = []
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        call_started_at = time.perf_counter()
+        func()
+        latencies.append(time.perf_counter() - call_started_at)
+    return summarize(latencies, time.perf_counter() - started_at)
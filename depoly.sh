@@ -18,8 +18,13 @@ fi
 echo ">>> 백엔드(Gunicorn) 실행..."
 #TODO: Lock 파일 삭제 및 pipenv clean 진행해야 함
 /home/ingyu/anaconda3/bin/pipenv install
+# 워커별 메트릭을 /metrics 에서 합산하기 위한 디렉터리 (재시작할 때마다 비움)
+export PROMETHEUS_MULTIPROC_DIR="$(pwd)/.prometheus"
+rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
 /home/ingyu/anaconda3/bin/pipenv run gunicorn app.main:app \
     --name "$APP_NAME" \
+    -c gunicorn.conf.py \
     -w 2 \
     -k uvicorn.workers.UvicornWorker \
     --bind 0.0.0.0:8000 \
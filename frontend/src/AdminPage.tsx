@@ -83,8 +83,32 @@ const AdminPage: React.FC = () => {
         throw new Error(errorData.detail || '파일 업로드 실패');
       }
 
-      const result = await response.json();
-      setMessage(`${result.detail}\n\n총 책 수: ${result.added_books_count}`);
+      // 업로드는 백그라운드 작업으로 처리되므로 완료될 때까지 진행 상황을 조회
+      const { job } = await response.json();
+      let status = job.status;
+      while (status === 'queued' || status === 'running') {
+        await new Promise((resolve) => setTimeout(resolve, 1000));
+        const jobResponse = await fetch(`/books/upload/jobs/${job.job_id}`, {
+          headers: { 'Authorization': `Bearer ${token}` },
+        });
+        if (!jobResponse.ok) {
+          const errorData = await jobResponse.json();
+          throw new Error(errorData.detail || '업로드 상태 조회 실패');
+        }
+        const { job: currentJob } = await jobResponse.json();
+        status = currentJob.status;
+
+        if (status === 'failed') {
+          throw new Error(currentJob.errors.join('\n') || '파일 업로드 실패');
+        }
+        if (status === 'succeeded' && currentJob.result.skipped) {
+          setMessage('마지막으로 반영한 파일과 같은 파일이라 변경 없이 유지했습니다.');
+        } else if (status === 'succeeded') {
+          setMessage(`엑셀 파일의 책 목록을 성공적으로 추가했습니다.\n\n총 책 수: ${currentJob.result.added_books_count}`);
+        } else {
+          setMessage(`업로드 중... (${currentJob.rows_inserted}권 추가됨)`);
+        }
+      }
     } catch (err) {
       if (err instanceof Error) {
         setError(err.message);
@@ -31,6 +31,37 @@ const SearchPage: React.FC = () => {
   const [searchResults, setSearchResults] = useState<Book[]>([]);
   const [loading, setLoading] = useState<boolean>(false);
   const [error, setError] = useState<string | null>(null);
+  const [suggestions, setSuggestions] = useState<string[]>([]);
+
+  // 입력이 잠시 멈추면 자동완성 도서명을 조회 (이전 요청은 취소)
+  useEffect(() => {
+    const query = searchTerm.trim();
+    if (!query || !storeSpot) {
+      setSuggestions([]);
+      return;
+    }
+
+    const controller = new AbortController();
+    const timer = setTimeout(async () => {
+      try {
+        const response = await fetch(
+          `/books/suggest?store_spot=${storeSpot}&q=${encodeURIComponent(query)}`,
+          { signal: controller.signal }
+        );
+        if (response.ok) {
+          const data = await response.json();
+          setSuggestions(data.suggestions);
+        }
+      } catch (err) {
+        // 취소되었거나 실패하면 추천 없이 그대로 입력
+      }
+    }, 150);
+
+    return () => {
+      clearTimeout(timer);
+      controller.abort();
+    };
+  }, [searchTerm, storeSpot]);
 
   // const handleLogout = () => {
   //   // 로그아웃 로직 (예: 토큰 삭제)
@@ -50,7 +81,8 @@ const SearchPage: React.FC = () => {
     setSearchResults([]);
 
     try {
-      const response = await fetch(`/books/search/${searchTerm}?store_spot=${storeSpot}`);
+      // 목록에 표시하는 필드만 조회
+      const response = await fetch(`/books/search/${searchTerm}?store_spot=${storeSpot}&fields=publisher&fields=location`);
       if (!response.ok) {
         const errorData = await response.json();
         throw new Error(errorData.detail || '검색 중 오류가 발생했습니다.');
@@ -94,6 +126,7 @@ const SearchPage: React.FC = () => {
             type="text"
             className="form-control mb-3"
             placeholder="검색어를 입력하세요"
+            list="book-suggestions"
             value={searchTerm}
             onChange={(e) => setSearchTerm(e.target.value)}
             onKeyPress={(e) => {
@@ -102,6 +135,11 @@ const SearchPage: React.FC = () => {
               }
             }}
           />
+          <datalist id="book-suggestions">
+            {suggestions.map((title) => (
+              <option key={title} value={title} />
+            ))}
+          </datalist>
           <button className="btn btn-primary w-100" onClick={handleSearch} disabled={loading}>
             {loading ? '검색 중...' : '검색'}
           </button>
@@ -0,0 +1,9 @@
+import os
+
+from prometheus_client import multiprocess
+
+
+# 종료된 워커의 메트릭 파일 정리 (PROMETHEUS_MULTIPROC_DIR 을 사용할 때)
+def child_exit(server, worker):
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        multiprocess.mark_process_dead(worker.pid)